@@ -0,0 +1,122 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import pandas as pd
+
+from logger import AppLogger
+from topk import grouped_top_k, top_k
+
+logger = AppLogger("[AnalysisCube]")
+
+CUBE_KEYS = ["keyword", "category", "year", "month"]
+
+
+def cube_cache_path(input_csv: str) -> Path:
+  """
+  Cache next to the input: `monthly_news_keywords_2025.csv` -> `monthly_news_keywords_2025.cube.pkl`.
+  """
+  return Path(input_csv).with_suffix(".cube.pkl")
+
+
+def _source_stamp(input_csv: str) -> dict:
+  st = os.stat(input_csv)
+  return {"path": str(Path(input_csv).resolve()), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+@dataclass
+class KeywordCube:
+  """
+  Keyword totals aggregated once from the monthly counts, plus the marginals
+  every analysis table is derived from.
+
+  - cells: (keyword, category, year, month) -> count
+  - totals: keyword -> count
+  - by_category: (category, keyword) -> count
+  - by_month: (keyword, year, month) -> count
+
+  All indexes are sorted, so each view is a lookup / sort over keywords only.
+  """
+  cells: pd.Series
+  totals: pd.Series
+  by_category: pd.Series
+  by_month: pd.Series
+
+  @classmethod
+  def from_frame(cls, df: pd.DataFrame) -> "KeywordCube":
+    """
+    Build the cube with a single group-by over the monthly count rows.
+    """
+    cells = df.groupby(CUBE_KEYS)["count"].sum()
+    return cls(
+      cells=cells,
+      totals=cells.groupby(level="keyword").sum(),
+      by_category=cells.groupby(level=["category", "keyword"]).sum(),
+      by_month=cells.groupby(level=["keyword", "year", "month"]).sum(),
+    )
+
+  def keyword_totals(self, category: Optional[str] = None) -> pd.Series:
+    """
+    keyword -> count, over all categories or within one category.
+    """
+    if category is None:
+      return self.totals
+    if category not in self.by_category.index.get_level_values("category"):
+      return self.totals.iloc[:0]
+    return self.by_category.xs(category, level="category")
+
+  def top_keywords(self, n: int, category: Optional[str] = None) -> pd.Series:
+    """
+    The n largest keyword totals (descending, ties by keyword), over all
+    categories or one category.
+    """
+    return top_k(self.keyword_totals(category), n)
+
+  def top_keywords_by(self, levels: Sequence[str], n: int) -> pd.Series:
+    """
+    The n largest keywords of every group of `levels` (any of category / year / month),
+    e.g. levels=["category", "year", "month"] for a monthly top-n per category.
+    """
+    levels = list(levels)
+    counts = self.cells.groupby(level=levels + ["keyword"]).sum()
+    return grouped_top_k(counts, levels, n)
+
+  def monthly(self, keywords: List[str]) -> pd.DataFrame:
+    """
+    (keyword, year, month, count) rows of the given keywords, sorted by keyword then month.
+    """
+    keyword_level = self.by_month.index.get_level_values("keyword")
+    return self.by_month[keyword_level.isin(keywords)].reset_index()
+
+
+def load_keyword_cube(input_csv: str, use_cache: bool = True) -> KeywordCube:
+  """
+  Return the cube of a monthly counts CSV, reusing the on-disk cache unless
+  the CSV changed (size or mtime) since it was built.
+  """
+  cache = cube_cache_path(input_csv)
+  stamp = _source_stamp(input_csv)
+
+  if use_cache and cache.exists():
+    try:
+      cached = pd.read_pickle(cache)
+      if cached.get("source") == stamp:
+        logger.debug(f"Loaded analysis cube from {cache}")
+        return cached["cube"]
+      logger.info(f"Analysis cube {cache} is stale. Rebuilding.")
+    except Exception:
+      logger.exception(f"Failed to read analysis cube {cache}. Rebuilding.")
+
+  logger.info(f"Building analysis cube from {input_csv}")
+  cube = KeywordCube.from_frame(pd.read_csv(input_csv))
+
+  if use_cache:
+    try:
+      tmp = cache.with_name(f".{cache.name}.tmp")
+      pd.to_pickle({"source": stamp, "cube": cube}, tmp)
+      os.replace(tmp, cache)
+    except Exception:
+      logger.exception(f"Failed to write analysis cube cache {cache}.")
+
+  return cube
@@ -3,10 +3,20 @@ from typing import Dict, Union
 
 import pandas as pd
 
+from analysis_cube import KeywordCube, load_keyword_cube
 from logger import AppLogger
 
 logger = AppLogger("[AnalysisTables]")
 
+CountsInput = Union[pd.DataFrame, KeywordCube]
+
+
+def _as_cube(data: CountsInput) -> KeywordCube:
+  """
+  Accept either the monthly counts frame or an already built cube.
+  """
+  return data if isinstance(data, KeywordCube) else KeywordCube.from_frame(data)
+
 
 def load_keyword_monthly_counts(path: str = "../preprocessed/keyword_monthly_counts.csv") -> pd.DataFrame:
   """
@@ -24,7 +34,7 @@ def load_keyword_monthly_counts(path: str = "../preprocessed/keyword_monthly_cou
 
 
 def build_wordcloud_table(
-  df: pd.DataFrame,
+  df: CountsInput,
   output: str = "../preprocessed/wordcloud_top_keywords.csv",
   top_n: int = 100
 ) -> pd.DataFrame:
@@ -37,13 +47,7 @@ def build_wordcloud_table(
   try:
     logger.debug(f"Aggregating counts by keyword and selecting top {top_n}.")
     
-    wc = (
-      df.groupby("keyword")["count"]
-      .sum()
-      .sort_values(ascending=False)
-      .reset_index()
-    )
-    wc_top = wc.head(top_n)
+    wc_top = _as_cube(df).top_keywords(top_n).reset_index()
   except Exception:
     logger.exception("Error during aggregation for wordcloud.")
     raise
@@ -65,7 +69,7 @@ def build_wordcloud_table(
 
 
 def build_top10_monthly_timeseries(
-  df: pd.DataFrame,
+  df: CountsInput,
   output: str = "../preprocessed/top10_monthly_timeseries.csv",
   top_n: int = 10
 ) -> pd.DataFrame:
@@ -79,13 +83,8 @@ def build_top10_monthly_timeseries(
   try:
     logger.debug(f"Identifying top {top_n} keywords.")
     
-    top10_keywords = (
-      df.groupby("keyword")["count"]
-      .sum()
-      .sort_values(ascending=False)
-      .head(top_n)
-      .index.tolist()
-    )
+    cube = _as_cube(df)
+    top10_keywords = cube.top_keywords(top_n).index.tolist()
     logger.info(f"Selected Top{top_n} keywords: {top10_keywords}")
   except Exception:
     logger.exception("Error identifying top keywords.")
@@ -93,11 +92,10 @@ def build_top10_monthly_timeseries(
 
   # 2. Filter & Sort Data
   try:
-    logger.debug("Filtering original dataframe for top keywords.")
+    logger.debug("Selecting monthly counts of the top keywords from the cube.")
     
-    sub = df[df["keyword"].isin(top10_keywords)].copy()
-    sub = sub.groupby(['keyword', 'year', 'month'], as_index=False)['count'].sum()
-    sub = sub.sort_values(["keyword", "year", "month"])
+    # Already sorted by keyword -> year -> month (cube index order)
+    sub = cube.monthly(top10_keywords)
   except Exception:
     logger.exception("Error filtering/sorting timeseries data.")
     raise
@@ -119,7 +117,7 @@ def build_top10_monthly_timeseries(
 
 
 def build_economy_top10_table(
-  df: pd.DataFrame,
+  df: CountsInput,
   output: str = "../preprocessed/economy_top10_keywords.csv",
   top_n: int = 10
 ) -> pd.DataFrame:
@@ -130,17 +128,9 @@ def build_economy_top10_table(
 
   # 1. Filter & Aggregate
   try:
-    logger.debug("Filtering for 'economy' category and aggregating.")
+    logger.debug("Selecting 'economy' keyword totals from the cube.")
     
-    eco = df[df["category"] == "economy"].copy()
-
-    eco_top = (
-      eco.groupby("keyword")["count"]
-      .sum()
-      .sort_values(ascending=False)
-      .head(top_n)
-      .reset_index()
-    )
+    eco_top = _as_cube(df).top_keywords(top_n, category="economy").reset_index()
   except Exception:
     logger.exception("Error processing economy data.")
     raise
@@ -161,20 +151,62 @@ def build_economy_top10_table(
   return eco_top
 
 
-def run_all_analysis(input_csv: str = "../preprocessed/keyword_monthly_counts.csv") -> Dict[str, pd.DataFrame]:
+def build_monthly_category_top_table(
+  df: CountsInput,
+  output: str = "../preprocessed/monthly_category_top10_keywords.csv",
+  top_n: int = 10
+) -> pd.DataFrame:
+  """
+  Extract Top 10 keywords of every month within every category (one grouped pass).
+  Columns: category, year, month, keyword, count
+  """
+  logger.info("Building monthly Top10 keyword table per category.")
+
+  # 1. Grouped Top N
+  try:
+    logger.debug(f"Selecting top {top_n} keywords per category and month from the cube.")
+    
+    monthly_top = _as_cube(df).top_keywords_by(["category", "year", "month"], top_n).reset_index()
+  except Exception:
+    logger.exception("Error selecting monthly top keywords per category.")
+    raise
+
+  # 2. Save to CSV
+  try:
+    path_obj = Path(output)
+    logger.debug(f"Saving monthly category top10 dataset to {path_obj}")
+    
+    path_obj.parent.mkdir(parents=True, exist_ok=True)
+    monthly_top.to_csv(path_obj, index=False, encoding="utf-8-sig")
+    
+    logger.info(f"Saved monthly category top10 dataset -> {output} (rows={len(monthly_top)})")
+  except Exception:
+    logger.exception(f"Failed to save monthly category top10 CSV to {output}")
+    raise
+
+  return monthly_top
+
+
+def run_all_analysis(
+  input_csv: str = "../preprocessed/keyword_monthly_counts.csv",
+  use_cache: bool = True,
+) -> Dict[str, pd.DataFrame]:
   """
-  Execute generation of 3 analysis tables.
+  Execute generation of 4 analysis tables.
+  All tables are derived from one keyword cube, cached next to the input CSV
+  (rebuilt when the CSV changes; use_cache=False always rebuilds it in memory).
   """
   logger.info("Starting all analysis tasks.")
   
   try:
-    # 1. Load Data
-    df = load_keyword_monthly_counts(input_csv)
+    # 1. Load Data (aggregated once)
+    cube = load_keyword_cube(input_csv, use_cache=use_cache)
 
     # 2. Build Tables
-    wc = build_wordcloud_table(df)
-    ts = build_top10_monthly_timeseries(df)
-    eco = build_economy_top10_table(df)
+    wc = build_wordcloud_table(cube)
+    ts = build_top10_monthly_timeseries(cube)
+    eco = build_economy_top10_table(cube)
+    monthly_top = build_monthly_category_top_table(cube)
 
     logger.info("All analysis tasks completed successfully.")
     
@@ -182,6 +214,7 @@ def run_all_analysis(input_csv: str = "../preprocessed/keyword_monthly_counts.cs
       "wordcloud": wc,
       "timeseries": ts,
       "economy_top10": eco,
+      "monthly_category_top10": monthly_top,
     }
   except Exception:
     logger.exception("An error occurred during the analysis pipeline.")
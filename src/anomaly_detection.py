@@ -0,0 +1,67 @@
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+AnomalyMethod = Literal["pct_change", "zscore", "rolling"]
+
+ANOMALY_COLUMNS = ["keyword", "date", "year_month", "count", "baseline", "score", "method"]
+
+
+def monthly_changes(df: pd.DataFrame, key: str = "keyword") -> pd.DataFrame:
+  """
+  Sort a (keyword, year, month, count) series table and add, for every keyword
+  at once: date, year_month, prev_count and pct_change (vs. the previous point).
+  """
+  out = df.copy()
+  out["date"] = pd.to_datetime(out[["year", "month"]].assign(day=1))
+  out = out.sort_values([key, "date"])
+  out["year_month"] = out["date"].dt.strftime("%Y-%m")
+
+  out["prev_count"] = out.groupby(key, sort=False)["count"].shift(1)
+  out["pct_change"] = (out["count"] - out["prev_count"]) / out["prev_count"]
+  return out
+
+
+def detect_anomalies(
+  df: pd.DataFrame,
+  method: AnomalyMethod = "pct_change",
+  threshold: float = 0.25,
+  window: int = 3,
+  key: str = "keyword",
+) -> pd.DataFrame:
+  """
+  Flag surging points of every keyword series in one grouped pass.
+
+  - pct_change: change vs. the previous point > threshold (e.g. 0.25 = +25%)
+  - rolling: change vs. the mean of the previous `window` points > threshold
+  - zscore: (count - keyword mean) / keyword std > threshold (e.g. 2.0)
+
+  Returns a tidy table (keyword, date, year_month, count, baseline, score, method),
+  one row per anomaly, ordered by keyword then date. Extra input columns
+  (e.g. headline) are carried along.
+  """
+  changes = monthly_changes(df, key)
+  counts = changes.groupby(key, sort=False)["count"]
+
+  if method == "pct_change":
+    baseline = changes["prev_count"]
+    score = changes["pct_change"]
+  elif method == "rolling":
+    baseline = counts.transform(lambda s: s.shift(1).rolling(window, min_periods=1).mean())
+    score = (changes["count"] - baseline) / baseline
+  elif method == "zscore":
+    baseline = counts.transform("mean")
+    score = (changes["count"] - baseline) / counts.transform("std")
+  else:
+    raise ValueError(f"Unknown anomaly method: {method}")
+
+  changes["baseline"] = baseline
+  changes["score"] = score
+  changes["method"] = method
+
+  # NaN scores (first point, flat series) never count as anomalies
+  flagged = changes[np.asarray(changes["score"] > threshold)]
+  helper = set(ANOMALY_COLUMNS) | {"year", "month", "prev_count", "pct_change"}
+  extra = [c for c in flagged.columns if c not in helper]
+  return flagged[ANOMALY_COLUMNS + extra].reset_index(drop=True)
@@ -1,23 +1,50 @@
+import json
 import os
+import tempfile
 import time
+from pathlib import Path
+from typing import Optional
 
 from dotenv import load_dotenv
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
 
 from logger import AppLogger
+from waits import WAIT_CONFIG, wait_until
+
+BIGKINDS_URL = "https://www.bigkinds.or.kr/"
+LOGIN_MODAL_SELECTOR = ".modal.modal-login.modal-click-close.in"
+
+# Only rendered for anonymous visitors; used to tell whether a restored session is alive.
+LOGIN_TRIGGER_SELECTOR = 'a[data-target="#login-modal"]'
+
+SESSION_PATH = "../.cache/bigkinds_session.json"
+DRIVER_PATH_CACHE = "../.cache/chromedriver_path.txt"
+
+# Saved sessions older than this are not even tried
+SESSION_MAX_AGE = 12 * 60 * 60
 
 class BrowserClient:
   """
   Selenium based Chrome browser driver.
   
   BrowserClient class is wrapping login process.
+  Authenticated cookies are saved to `session_path` and restored on the next
+  start, so the interactive login only runs when the saved session is invalid.
   """
 
-  def __init__(self):
+  def __init__(
+    self,
+    session_path: Optional[str] = SESSION_PATH,
+    driver_cache_path: Optional[str] = DRIVER_PATH_CACHE,
+  ):
     load_dotenv()
+    self.session_path = Path(session_path) if session_path else None
+    self.driver_cache_path = Path(driver_cache_path) if driver_cache_path else None
     self.user_id = os.getenv("BIGKINDS_ID")
     self.user_pw = os.getenv("BIGKINDS_PW")
     self.logger = AppLogger("[BrowserClient]")
@@ -35,82 +62,210 @@ class BrowserClient:
     chrome_options.add_argument("--disable-dev-shm-usage")
 
     self.driver = webdriver.Chrome(
-      service=Service(ChromeDriverManager().install()),
+      service=Service(self._resolve_driver_path()),
       options=chrome_options
     )
     
     self.driver.set_window_size(2560, 1440)
     self.logger.debug("Browser driver initialized.")
 
+  def _resolve_driver_path(self) -> str:
+    """
+    Return the chromedriver path, asking ChromeDriverManager only when the cached one is gone.
+    """
+    cache = self.driver_cache_path
+
+    if cache is not None and cache.exists():
+      cached = cache.read_text(encoding="utf-8").strip()
+      if cached and Path(cached).exists():
+        self.logger.debug(f"Using cached chromedriver: {cached}")
+        return cached
+
+    driver_path = ChromeDriverManager().install()
+
+    if cache is not None:
+      try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        cache.write_text(driver_path, encoding="utf-8")
+      except Exception:
+        self.logger.warning(f"Failed to cache chromedriver path to {cache}.")
+
+    return driver_path
+
+  def _is_logged_in(self) -> bool:
+    return not self.driver.find_elements(By.CSS_SELECTOR, LOGIN_TRIGGER_SELECTOR)
+
+  def _save_session(self) -> None:
+    """
+    Persist the authenticated cookies (temp file + rename).
+    """
+    if self.session_path is None:
+      return
+
+    tmp = None
+    try:
+      payload = {
+        "user_id": self.user_id,
+        "saved_at": time.time(),
+        "cookies": self.driver.get_cookies(),
+      }
+      self.session_path.parent.mkdir(parents=True, exist_ok=True)
+      # A temp name of its own, so concurrent drivers never write into each other's file
+      with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=self.session_path.parent,
+        prefix=f".{self.session_path.name}.", suffix=".tmp", delete=False,
+      ) as f:
+        tmp = f.name
+        json.dump(payload, f)
+      os.replace(tmp, self.session_path)
+      self.logger.debug(f"Session saved to {self.session_path}")
+    except Exception:
+      self.logger.warning(f"Failed to save session to {self.session_path}.")
+      if tmp is not None and os.path.exists(tmp):
+        os.remove(tmp)
+
+  def _restore_session(self) -> bool:
+    """
+    Load saved cookies into the browser and check that they are still authenticated.
+    """
+    path = self.session_path
+    if path is None or not path.exists():
+      return False
+
+    try:
+      payload = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+      self.logger.warning(f"Unreadable session file {path}. Ignoring it.")
+      return False
+
+    if payload.get("user_id") != self.user_id:
+      self.logger.info("Saved session belongs to another account. Ignoring it.")
+      return False
+    if time.time() - payload.get("saved_at", 0) > SESSION_MAX_AGE:
+      self.logger.info("Saved session is too old. Ignoring it.")
+      return False
+
+    try:
+      # Cookies can only be added for the domain currently loaded
+      self.driver.get(BIGKINDS_URL)
+      now = time.time()
+      for cookie in payload.get("cookies", []):
+        if cookie.get("expiry") and cookie["expiry"] < now:
+          continue
+        cookie.pop("sameSite", None)
+        self.driver.add_cookie(cookie)
+
+      self.driver.get(BIGKINDS_URL)
+      wait_until(
+        self.driver,
+        EC.presence_of_element_located((By.CLASS_NAME, "topMembership")),
+        "session_restore",
+        timeout=WAIT_CONFIG.page_load_timeout,
+      )
+    except Exception:
+      self.logger.warning("Failed to restore saved session.")
+      return False
+
+    if not self._is_logged_in():
+      self.logger.info("Saved session expired. Falling back to interactive login.")
+      self.driver.delete_all_cookies()
+      return False
+
+    return True
+
   def login(self) -> None:
+    """
+    Login Bigkinds website, reusing the saved session when it is still valid.
+    """
+    if self._restore_session():
+      self.logger.info(f"Restored saved session from {self.session_path}. Login skipped.")
+      return
+
+    if self._interactive_login():
+      self._save_session()
+
+  def _interactive_login(self) -> bool:
     """
     Login Bigkidns website with id & password with Selenium Browser.
+    Returns True when the login modal closed (login assumed successful).
     """
     
     self.logger.info("Login process started.")
     
     # 1. URL Access
     try:
-      self.logger.debug("Accessing URL: https://www.bigkinds.or.kr/")
-      self.driver.get("https://www.bigkinds.or.kr/")
-      time.sleep(2)
+      self.logger.debug(f"Accessing URL: {BIGKINDS_URL}")
+      self.driver.get(BIGKINDS_URL)
+      wait_until(
+        self.driver,
+        EC.element_to_be_clickable((By.CLASS_NAME, "topMembership")),
+        "login_page_load",
+        timeout=WAIT_CONFIG.page_load_timeout,
+      )
       self.logger.info("URL access succeeded.")
     except Exception:
       self.logger.exception("URL access failed.")
-      return
+      return False
     
     # 2. Top Membership Button
     try:
       self.logger.debug("Locating 'topMembership' button.")
       top_membership_btn = self.driver.find_element(By.CLASS_NAME, "topMembership")
       top_membership_btn.click()
-      time.sleep(1)
       self.logger.debug("Clicked 'topMembership' button.")
     except Exception:
       self.logger.exception("Failed to click 'topMembership' button.")
-      return
+      return False
     
     # 3. Login Modal Button
     try:
       self.logger.debug("Locating login modal trigger.")
-      login_modal_btn = self.driver.find_element(By.CSS_SELECTOR, 'a[data-target="#login-modal"]')
+      login_modal_btn = wait_until(
+        self.driver,
+        EC.element_to_be_clickable((By.CSS_SELECTOR, LOGIN_TRIGGER_SELECTOR)),
+        "login_modal_trigger",
+      )
       login_modal_btn.click()
-      time.sleep(1)
       self.logger.debug("Opened login modal.")
     except Exception:
       self.logger.exception("Failed to open login modal.")
-      return
+      return False
       
     # 4. Input Credentials & Submit
     try:
       self.logger.debug("Inputting user credentials.")
-      id_input = self.driver.find_element(By.ID, "login-user-id")
+      id_input = wait_until(
+        self.driver,
+        EC.visibility_of_element_located((By.ID, "login-user-id")),
+        "login_form",
+      )
       pw_input = self.driver.find_element(By.ID, "login-user-password")
     
       id_input.send_keys(self.user_id)
-      time.sleep(1)
       pw_input.send_keys(self.user_pw)
       
       login_btn = self.driver.find_element(By.ID, "login-btn")
       login_btn.click()
       
-      time.sleep(3)
-      
       # check login modal closed  
-      modals = self.driver.find_elements(
-        By.CSS_SELECTOR, ".modal.modal-login.modal-click-close.in"
-      )
-
-      if modals:
+      try:
+        wait_until(
+          self.driver,
+          EC.invisibility_of_element_located((By.CSS_SELECTOR, LOGIN_MODAL_SELECTOR)),
+          "login_modal_close",
+          timeout=WAIT_CONFIG.login_timeout,
+        )
+      except TimeoutException:
         self.logger.error("Login modal still visible. Login failed (Incorrect ID/PW or Captcha).")
-        return
-      else:
-        self.logger.info("Login modal closed. Login assumed successful.")
+        return False
+
+      self.logger.info("Login modal closed. Login assumed successful.")
     except Exception:
       self.logger.exception("Error occurred during credential input or login click.")
-      return
+      return False
     
     self.logger.info("Login process completed successfully.")
+    return True
 
   def close(self):
     self.driver.quit()
@@ -0,0 +1,131 @@
+import json
+import os
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from logger import AppLogger
+
+logger = AppLogger("[Checkpoint]")
+
+
+class CrawlCheckpoint:
+  """
+  Persisted record of the Friday anchors already crawled for each category.
+
+  File layout (JSON):
+    {
+      "categories": {
+        "total": {"completed": ["2025-01-03", ...], "empty": [...], "updated_at": "..."},
+        ...
+      },
+      "last_run": "..."
+    }
+
+  "empty" lists the completed anchors whose week had no rows (crawled, nothing to store).
+
+  Every mutation is written through a temp file + rename, so a crash never
+  leaves a half-written checkpoint behind.
+  """
+
+  def __init__(self, path: str = "../datasets/crawl_checkpoint.json"):
+    self.path = Path(path)
+    self._lock = threading.Lock()
+    self._data = self._load()
+
+  def _load(self) -> Dict:
+    if not self.path.exists():
+      logger.info(f"No checkpoint found at {self.path}. Starting fresh.")
+      return {"categories": {}, "last_run": None}
+
+    try:
+      with self.path.open("r", encoding="utf-8") as f:
+        data = json.load(f)
+      data.setdefault("categories", {})
+      data.setdefault("last_run", None)
+      logger.info(f"Loaded checkpoint from {self.path}.")
+      return data
+    except Exception:
+      logger.exception(f"Failed to read checkpoint {self.path}. Starting fresh.")
+      return {"categories": {}, "last_run": None}
+
+  def _save(self) -> None:
+    self.path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+
+    with tmp.open("w", encoding="utf-8") as f:
+      json.dump(self._data, f, ensure_ascii=False, indent=2)
+      f.flush()
+      os.fsync(f.fileno())
+
+    os.replace(tmp, self.path)
+
+  def completed(self, category: str) -> List[date]:
+    """
+    Return the completed anchors of a category in ascending order.
+    """
+    with self._lock:
+      entry = self._data["categories"].get(category, {})
+      anchors = entry.get("completed", [])
+    return sorted(datetime.strptime(a, "%Y-%m-%d").date() for a in anchors)
+
+  def is_done(self, category: str, anchor: date) -> bool:
+    with self._lock:
+      entry = self._data["categories"].get(category, {})
+      return anchor.strftime("%Y-%m-%d") in entry.get("completed", [])
+
+  def pending(self, category: str, anchors: List[date]) -> List[date]:
+    """
+    Filter out anchors that were already crawled.
+    """
+    return [a for a in anchors if not self.is_done(category, a)]
+
+  def last_anchor(self, category: str) -> Optional[date]:
+    """
+    Latest completed anchor of a category, or None when nothing was crawled yet.
+    """
+    done = self.completed(category)
+    return done[-1] if done else None
+
+  def empty(self, category: str) -> List[date]:
+    """
+    Completed anchors of a category that were recorded as empty weeks.
+    """
+    with self._lock:
+      anchors = self._data["categories"].get(category, {}).get("empty", [])
+    return sorted(datetime.strptime(a, "%Y-%m-%d").date() for a in anchors)
+
+  def mark_done(self, category: str, anchor: date, empty: bool = False) -> None:
+    """
+    Record an anchor as completed (empty=True: its week had no rows) and persist immediately.
+    """
+    now = datetime.now().isoformat(timespec="seconds")
+
+    with self._lock:
+      entry = self._data["categories"].setdefault(category, {"completed": []})
+      key = anchor.strftime("%Y-%m-%d")
+      if key not in entry["completed"]:
+        entry["completed"].append(key)
+        entry["completed"].sort()
+      if empty and key not in entry.setdefault("empty", []):
+        entry["empty"].append(key)
+        entry["empty"].sort()
+      entry["updated_at"] = now
+      self._data["last_run"] = now
+      self._save()
+
+    logger.debug(f"Checkpoint updated: {category} {key}")
+
+  def reset(self, category: Optional[str] = None) -> None:
+    """
+    Forget completed anchors of one category (or of all categories).
+    """
+    with self._lock:
+      if category is None:
+        self._data = {"categories": {}, "last_run": None}
+      else:
+        self._data["categories"].pop(category, None)
+      self._save()
+
+    logger.info(f"Checkpoint reset ({category or 'all categories'}).")
@@ -0,0 +1,118 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from keyword_matrix import KeywordMatrix
+from logger import AppLogger
+
+logger = AppLogger("[Cooccurrence]")
+
+
+@dataclass
+class Cooccurrence:
+  """
+  Keyword x keyword co-occurrence over a set of headlines.
+
+  - matrix: symmetric CSR (n_keywords x n_keywords); [i, j] = headlines containing
+    both keywords (or their summed article_count when weighted), the diagonal =
+    headlines containing the keyword.
+  - presence: the (weighted) headline x keyword presence matrix it came from.
+  """
+  matrix: sparse.csr_matrix
+  presence: sparse.csr_matrix
+  vocab: np.ndarray
+  weighted: bool = False
+
+  def keyword_ids(self, keywords: Sequence[str]) -> np.ndarray:
+    """
+    Column ids of keywords in the given order (-1 for keywords not in the vocabulary).
+    """
+    index = {kw: i for i, kw in enumerate(self.vocab.tolist())}
+    return np.array([index.get(kw, -1) for kw in keywords], dtype=np.int64)
+
+  def top_keywords(self, k: int) -> List[str]:
+    """
+    The k keywords with the largest diagonal (ties: vocabulary order).
+    """
+    diag = self.matrix.diagonal()
+    order = np.lexsort((np.arange(len(diag)), -diag))[:k]
+    return self.vocab[order[diag[order] > 0]].tolist()
+
+  def submatrix(
+    self,
+    keywords: Optional[Sequence[str]] = None,
+    k: int = 20,
+    solo_diagonal: bool = False,
+  ) -> pd.DataFrame:
+    """
+    Dense labelled co-occurrence of `keywords` (unknown ones are all zero),
+    or of the top-k keywords.
+
+    solo_diagonal=True puts on the diagonal only the headlines where the keyword
+    is the *only* one of the selected keywords (the original heatmap's rule).
+    """
+    if keywords is None:
+      keywords = self.top_keywords(k)
+    ids = self.keyword_ids(keywords)
+    known = ids >= 0
+    ids = ids[known]
+
+    sub = np.zeros((len(known), len(known)), dtype=self.matrix.dtype)
+    sub[np.ix_(known, known)] = self.matrix[ids][:, ids].toarray()
+
+    if solo_diagonal:
+      selected = self.presence[:, ids]
+      hits = (selected != 0).sum(axis=1).A1
+      solo = np.zeros(len(known), dtype=sub.dtype)
+      solo[known] = np.asarray(selected[hits == 1].sum(axis=0)).ravel()
+      np.fill_diagonal(sub, solo)
+
+    return pd.DataFrame(sub, index=list(keywords), columns=list(keywords))
+
+
+def build_cooccurrence(
+  km: KeywordMatrix,
+  weighted: bool = False,
+  category: Optional[str] = None,
+  year: Optional[int] = None,
+  month: Optional[int] = None,
+) -> Cooccurrence:
+  """
+  Full co-occurrence matrix as one sparse product B.T @ B over the selected headlines.
+
+  - B: binary headline x keyword matrix; weighted=True scales each row of one
+    factor by its article_count, i.e. B.T @ diag(w) @ B.
+  - category / year / month: slice the headlines first.
+  """
+  rows = np.flatnonzero(km.row_mask(category, year, month))
+  presence = km.binary()[rows]
+
+  if weighted:
+    scaled = sparse.diags(km.weights[rows].astype(np.int64), dtype=np.int64) @ presence
+    matrix = (presence.T @ scaled).tocsr()
+    presence = scaled.tocsr()
+  else:
+    matrix = (presence.T @ presence).tocsr()
+
+  logger.debug(f"Co-occurrence over {len(rows)} headlines: {matrix.shape[0]} keywords, nnz={matrix.nnz}")
+  return Cooccurrence(matrix=matrix, presence=presence, vocab=km.vocab, weighted=weighted)
+
+
+def monthly_cooccurrence(
+  km: KeywordMatrix,
+  weighted: bool = False,
+  category: Optional[str] = None,
+) -> Dict[Tuple[int, int], Cooccurrence]:
+  """
+  {(year, month): Cooccurrence} for every month present in the data.
+  """
+  months = km.row_months().dropna().astype(int).drop_duplicates()
+  months = sorted(months.itertuples(index=False, name=None))
+
+  return {
+    (year, month): build_cooccurrence(km, weighted, category, year, month)
+    for year, month in months
+  }
@@ -0,0 +1,324 @@
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from contextlib import ExitStack
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Literal, Optional, Tuple
+
+from browser_client import BrowserClient
+from crawler import (
+  Category,
+  WeekCallback,
+  _collect_anchor_weeks,
+  _go_to_weekend_news_page,
+  collect_weekly_news,
+)
+from logger import AppLogger
+from utils import generate_fridays
+
+ExecutorKind = Literal["thread", "process"]
+
+logger = AppLogger("[CrawlEngine]")
+
+# How often the parent drains weeks reported by process workers (seconds)
+WEEK_QUEUE_POLL_INTERVAL = 0.2
+
+
+@dataclass(frozen=True)
+class WorkerStats:
+  """
+  Throughput report of a single crawl worker.
+  """
+  worker_id: int
+  weeks: int
+  rows: int
+  elapsed: float
+
+  @property
+  def weeks_per_minute(self) -> float:
+    return self.weeks / self.elapsed * 60 if self.elapsed > 0 else 0.0
+
+
+def _split_anchors(fridays: List[date], workers: int) -> List[List[date]]:
+  """
+  Split Friday anchors into at most `workers` contiguous, evenly sized chunks.
+  """
+  workers = max(1, min(workers, len(fridays)))
+  size, extra = divmod(len(fridays), workers)
+
+  chunks = []
+  pos = 0
+  for i in range(workers):
+    end = pos + size + (1 if i < extra else 0)
+    chunks.append(fridays[pos:end])
+    pos = end
+
+  return chunks
+
+
+class _QueueReporter:
+  """
+  Picklable on_week for process workers: sends every scraped week to the
+  parent through a Manager queue, as soon as it is scraped.
+  """
+
+  def __init__(self, week_queue):
+    self.week_queue = week_queue
+
+  def __call__(self, anchor: date, rows: List[Dict]) -> None:
+    self.week_queue.put((anchor, rows))
+
+
+def _crawl_worker(
+  worker_id: int,
+  category: Category,
+  anchors: List[date],
+  start_date: date,
+  end_date: date,
+  on_week: Optional[WeekCallback] = None,
+) -> Tuple[Dict[date, List[Dict]], WorkerStats]:
+  """
+  Log in with a dedicated BrowserClient and crawl the given anchors.
+  Returns the rows of every successfully scraped week keyed by anchor.
+  Must stay a module-level function so it can be pickled for process pools.
+  """
+  started = time.perf_counter()
+  logger.info(f"Worker {worker_id} started ({len(anchors)} weeks, category={category}).")
+
+  week_rows: Dict[date, List[Dict]] = {}
+
+  def _on_week(anchor: date, rows: List[Dict]) -> None:
+    week_rows[anchor] = rows
+    if on_week is not None:
+      on_week(anchor, rows)
+
+  client = BrowserClient()
+  try:
+    client.login()
+    _go_to_weekend_news_page(client, category)
+    _collect_anchor_weeks(client, category, anchors, start_date, end_date, _on_week)
+  finally:
+    client.close()
+
+  stats = WorkerStats(
+    worker_id=worker_id,
+    weeks=len(week_rows),
+    rows=sum(len(rows) for rows in week_rows.values()),
+    elapsed=time.perf_counter() - started,
+  )
+  return week_rows, stats
+
+
+def dedupe_news_rows(rows: List[Dict]) -> List[Dict]:
+  """
+  Drop duplicated rows on (date, category, title), keeping the first one, sorted by date.
+  """
+  seen = set()
+  unique = []
+
+  for row in rows:
+    key = (row.get("date"), row.get("category"), row.get("title"))
+    if key in seen:
+      continue
+    seen.add(key)
+    unique.append(row)
+
+  # Stable sort keeps the in-day ranking order of the site
+  unique.sort(key=lambda r: r.get("date") or "")
+  return unique
+
+
+def crawl_weekly_news(
+  category: Category,
+  start_date: date,
+  end_date: date,
+  workers: int = 4,
+  executor: ExecutorKind = "thread",
+  anchors: Optional[List[date]] = None,
+  on_week: Optional[WeekCallback] = None,
+) -> List[Dict]:
+  """
+  Crawl one category by splitting the Friday anchors across a pool of logged-in workers.
+
+  - executor="thread": one Chrome per thread (drivers are I/O bound, threads are enough)
+  - executor="process": one Chrome per process (isolates crashes of a single worker)
+  - anchors: Friday anchors to crawl (default: every Friday in the range)
+  - on_week: called once per scraped week, serialized by a lock. With processes
+    workers stream their weeks through a Manager queue and it runs in the parent
+    as they arrive, so a crash or Ctrl-C only loses the week in progress.
+  """
+  fridays = generate_fridays(start_date, end_date) if anchors is None else list(anchors)
+  if not fridays:
+    logger.warning(f"No Friday anchors to crawl between {start_date} and {end_date}.")
+    return []
+
+  chunks = _split_anchors(fridays, workers)
+  logger.info(
+    f"Crawling [{category}] {len(fridays)} weeks with {len(chunks)} {executor} workers."
+  )
+
+  if executor == "thread":
+    pool_cls = ThreadPoolExecutor
+  elif executor == "process":
+    pool_cls = ProcessPoolExecutor
+  else:
+    raise ValueError(f"Unknown executor: {executor}")
+
+  callback_lock = threading.Lock()
+
+  def _locked_on_week(anchor: date, rows: List[Dict]) -> None:
+    with callback_lock:
+      on_week(anchor, rows)
+
+  started = time.perf_counter()
+  all_rows: List[Dict] = []
+  stats: List[WorkerStats] = []
+
+  with ExitStack() as stack:
+    # Closures can't be pickled; process workers report weeks back through a queue instead.
+    week_queue = None
+    worker_callback = None
+    if on_week is not None and executor == "process":
+      week_queue = stack.enter_context(multiprocessing.Manager()).Queue()
+      worker_callback = _QueueReporter(week_queue)
+    elif on_week is not None:
+      worker_callback = _locked_on_week
+
+    def _drain_weeks() -> None:
+      while week_queue is not None:
+        try:
+          anchor, rows = week_queue.get_nowait()
+        except queue.Empty:
+          return
+        all_rows.extend(rows)
+        on_week(anchor, rows)
+
+    pool = stack.enter_context(pool_cls(max_workers=len(chunks)))
+    futures = {
+      pool.submit(_crawl_worker, i, category, chunk, start_date, end_date, worker_callback): i
+      for i, chunk in enumerate(chunks)
+    }
+
+    running = set(futures)
+    while running:
+      done, running = wait(
+        running,
+        timeout=WEEK_QUEUE_POLL_INTERVAL if week_queue is not None else None,
+        return_when=FIRST_COMPLETED,
+      )
+      # A worker's weeks are all queued before its future completes
+      _drain_weeks()
+
+      for future in done:
+        worker_id = futures[future]
+        try:
+          week_rows, worker_stats = future.result()
+        except Exception:
+          logger.exception(f"Worker {worker_id} failed. Weeks it already reported are kept.")
+          continue
+
+        if week_queue is None:
+          for anchor in sorted(week_rows):
+            all_rows.extend(week_rows[anchor])
+
+        stats.append(worker_stats)
+        logger.info(
+          f"Worker {worker_stats.worker_id} done: {worker_stats.weeks} weeks, "
+          f"{worker_stats.rows} rows in {worker_stats.elapsed:.1f}s "
+          f"({worker_stats.weeks_per_minute:.2f} weeks/min)."
+        )
+
+  merged = dedupe_news_rows(all_rows)
+  elapsed = time.perf_counter() - started
+  done_weeks = sum(s.weeks for s in stats)
+  logger.info(
+    f"Finished [{category}] parallel crawl. Rows: {len(merged)} "
+    f"(dropped {len(all_rows) - len(merged)} duplicates), wall time {elapsed:.1f}s, "
+    f"{done_weeks / elapsed * 60 if elapsed > 0 else 0.0:.2f} weeks/min overall."
+  )
+  return merged
+
+
+def _crawl_category(
+  client: Optional[BrowserClient],
+  category: Category,
+  start_date: date,
+  end_date: date,
+  anchors: List[date],
+  on_week: Optional[WeekCallback],
+) -> List[Dict]:
+  """
+  Crawl one category on the given driver (or a new one restoring the saved session).
+  """
+  if client is None:
+    client = BrowserClient()
+    client.login()
+
+  try:
+    return collect_weekly_news(client, category, start_date, end_date, anchors=anchors, on_week=on_week)
+  finally:
+    client.close()
+
+
+def crawl_categories_concurrently(
+  end_date: date,
+  plans: Dict[Category, Tuple[date, List[date], Optional[WeekCallback]]],
+  max_workers: Optional[int] = None,
+) -> Dict[Category, List[Dict]]:
+  """
+  Crawl several categories at once, one driver (thread) per category, from one login.
+
+  The first driver logs in and saves its session (see BrowserClient); the other
+  drivers restore that session instead of logging in again.
+
+  - plans: {category: (start_date, anchors, on_week)}
+  - max_workers: cap on concurrent drivers (default: one per category); the
+    remaining categories wait for a free slot
+  """
+  categories = [c for c, (_, anchors, _) in plans.items() if anchors]
+  results: Dict[Category, List[Dict]] = {c: [] for c in plans}
+  if not categories:
+    logger.info("No pending weeks for any category.")
+    return results
+
+  workers = max(1, min(max_workers or len(categories), len(categories)))
+  logger.info(f"Crawling {categories} with {workers} concurrent driver(s).")
+  started = time.perf_counter()
+
+  # Log in once before the other drivers start, so they can reuse the session
+  lead = BrowserClient()
+  try:
+    lead.login()
+  except Exception:
+    lead.close()
+    raise
+
+  with ThreadPoolExecutor(max_workers=workers) as pool:
+    futures = {
+      pool.submit(
+        _crawl_category,
+        lead if i == 0 else None,
+        category,
+        plans[category][0],
+        end_date,
+        plans[category][1],
+        plans[category][2],
+      ): category
+      for i, category in enumerate(categories)
+    }
+
+    for future in as_completed(futures):
+      category = futures[future]
+      try:
+        results[category] = future.result()
+      except Exception:
+        logger.exception(f"Category [{category}] crawl failed.")
+
+  logger.info(
+    f"Finished concurrent crawl of {categories} in {time.perf_counter() - started:.1f}s. "
+    + ", ".join(f"{c}: {len(rows)} rows" for c, rows in results.items())
+  )
+  return results
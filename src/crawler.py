@@ -1,22 +1,72 @@
-import time
+import json
 from datetime import date, datetime
-from typing import Literal, List, Dict, Optional
+from typing import Callable, Literal, List, Dict, Optional
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import Select, WebDriverWait
+from selenium.webdriver.support.ui import Select
 
 from browser_client import BrowserClient
 from logger import AppLogger
 from utils import generate_fridays
+from waits import WAIT_CONFIG, result_signature, wait_for_result_change, wait_until
 
 WEEKEND_NEWS_URL = "https://www.bigkinds.or.kr/v2/news/weekendNews.do"
 
 Category = Literal["total", "economy"]
 
+# Values of the 'issueCategory' select on the weekend news page
+CATEGORY_VALUES = {
+  "total": "전체",
+  "economy": "002000000",
+}
+
+# Called after every successfully scraped week: on_week(anchor, rows_of_that_week)
+WeekCallback = Callable[[date, List[Dict]], None]
+
+# Max topics kept per day (the site ranks the weekly issues top-down)
+MAX_TOPICS_PER_DAY = 10
+
+# Extract every day's (date, title, count) of the visible block in one round-trip.
+# Mirrors the element-based path: title attribute first, span text as fallback.
+_EXTRACT_BLOCK_JS = """
+const container = document.querySelector('div#weekend-news-result > ul.weekendNews-lst');
+if (!container) { return null; }
+const limit = arguments[0];
+const days = [];
+for (const item of container.querySelectorAll('div.item')) {
+  const date = item.getAttribute('data-date');
+  if (!date) { continue; }
+  const topics = [];
+  for (const li of Array.from(item.querySelectorAll('div.cont > ul > li')).slice(0, limit)) {
+    const a = li.querySelector('a.topic-row');
+    const span = a && a.querySelector('span');
+    const num = a && a.querySelector('i.num');
+    if (!a || !span || !num) { continue; }
+    topics.push({
+      title_attr: a.getAttribute('title') || '',
+      title_span: span.innerText.trim(),
+      num: num.innerText.trim(),
+    });
+  }
+  days.push({date: date, topics: topics});
+}
+return JSON.stringify(days);
+"""
+
 logger = AppLogger("[Crawler]")
 
+def category_value(category: Category) -> str:
+  """
+  Map a category name to the value of the 'issueCategory' select.
+  """
+  try:
+    return CATEGORY_VALUES[category]
+  except KeyError:
+    raise ValueError(f"Unknown category: {category}") from None
+
+
 def _go_to_weekend_news_page(client: BrowserClient, category: Category) -> None:
   """
   Navigate to the weekly issue news page.
@@ -29,7 +79,12 @@ def _go_to_weekend_news_page(client: BrowserClient, category: Category) -> None:
   try:
     logger.debug(f"Accessing URL: {WEEKEND_NEWS_URL}")
     d.get(WEEKEND_NEWS_URL)
-    time.sleep(2)
+    wait_until(
+      d,
+      EC.presence_of_element_located((By.ID, "issueCategory")),
+      "weekend_page_load",
+      timeout=WAIT_CONFIG.page_load_timeout,
+    )
     logger.info("URL access succeeded.")
   except Exception:
     logger.exception("URL access failed.")
@@ -37,28 +92,43 @@ def _go_to_weekend_news_page(client: BrowserClient, category: Category) -> None:
 
   # 2. Select Category
   try:
-    logger.debug("Locating 'issueCategory' select element.")
-    select_el = Select(d.find_element(By.ID, "issueCategory"))
-    
-    if category == "total":
-      value = "전체"
-    elif category == "economy":
-      value = "002000000"
-    else:
-      raise ValueError(f"Unknown category: {category}")
-    
-    logger.debug(f"Selecting category value: {value} ({category})")
-    select_el.select_by_value(value)
-    time.sleep(0.5)
+    _select_category(client, category)
     logger.info("Category selection completed.")
   except Exception:
     logger.exception("Failed to select issue category.")
     raise
 
 
-def _search_by_date(client: BrowserClient, target_date: date) -> None:
+def _select_category(client: BrowserClient, category: Category) -> bool:
+  """
+  Switch the 'issueCategory' select on the current page.
+  Returns True when the result block re-rendered after the switch.
+  """
+  d = client.driver
+
+  logger.debug("Locating 'issueCategory' select element.")
+  select_el = Select(d.find_element(By.ID, "issueCategory"))
+  value = category_value(category)
+
+  logger.debug(f"Selecting category value: {value} ({category})")
+  before = result_signature(d)
+  select_el.select_by_value(value)
+
+  # Category change may re-render the result block; don't block if it doesn't.
+  changed = wait_for_result_change(d, before, timeout=WAIT_CONFIG.settle_timeout, required=False)
+  return changed is not None
+
+
+def _search_by_date(
+  client: BrowserClient,
+  target_date: date,
+  previous: Optional[Dict] = None,
+) -> None:
   """
   Input the target date into the search field and submit.
+
+  previous: result signature the new block must differ from (e.g. the block of
+  the category shown before a switch); raises TimeoutException if it never does.
   """
   d = client.driver
   ds = target_date.strftime("%Y-%m-%d")
@@ -67,31 +137,35 @@ def _search_by_date(client: BrowserClient, target_date: date) -> None:
   try:
     # 1. Wait for Input Element
     logger.debug("Waiting for 'weekend-search-date' input to be clickable.")
-    input_el = WebDriverWait(d, 10).until(
-      EC.element_to_be_clickable((By.ID, "weekend-search-date"))
+    input_el = wait_until(
+      d,
+      EC.element_to_be_clickable((By.ID, "weekend-search-date")),
+      "search_input",
     )
 
     # 2. Focus on Input
     input_el.click()
-    time.sleep(0.2)
 
     # 3. Clear Existing Value
     logger.debug("Clearing existing date value.")
     input_el.send_keys(Keys.CONTROL, "a")
     input_el.send_keys(Keys.DELETE)
-    time.sleep(0.1)
 
     # 4. Input Target Date
     logger.debug(f"Inputting date string: {ds}")
     input_el.send_keys(ds)
-    time.sleep(0.2)
 
     # 5. Click Search Button
     logger.debug("Clicking search button.")
+    before = result_signature(d)
     search_btn = d.find_element(By.CSS_SELECTOR, "button.search-btn")
     search_btn.click()
-    
-    time.sleep(10)
+
+    # 6. Wait until the result block actually shows the requested week
+    if previous is not None:
+      wait_for_result_change(d, previous, expected_date=ds, require_change=True)
+    elif wait_for_result_change(d, before, expected_date=ds, required=False) is None:
+      logger.warning(f"Result block did not change for {ds} within {WAIT_CONFIG.search_timeout}s.")
     logger.info("Search triggered successfully.")
 
   except Exception:
@@ -99,10 +173,12 @@ def _search_by_date(client: BrowserClient, target_date: date) -> None:
     raise
 
 
-def _scrape_visible_block(client: BrowserClient, category: Category) -> List[Dict]:
+def _scrape_visible_block_elements(client: BrowserClient, category: Category) -> List[Dict]:
   """
-  Parse the visible 5-day blocks (Mon-Fri) on the current screen.
+  Parse the visible 5-day blocks (Mon-Fri) element by element.
   Includes logic to prevent StaleElementReferenceException.
+  Slow (several WebDriver round-trips per topic); used as a fallback of the script path.
+  Raises when the result container is not found (page not loaded).
   """
   d = client.driver
   results = []
@@ -110,14 +186,16 @@ def _scrape_visible_block(client: BrowserClient, category: Category) -> List[Dic
   # 1. Identify Container & Count Items
   try:
     logger.debug("Locating result container and counting items.")
-    container = WebDriverWait(d, 10).until(
-      EC.presence_of_element_located((By.CSS_SELECTOR, "div#weekend-news-result > ul.weekendNews-lst"))
+    container = wait_until(
+      d,
+      EC.presence_of_element_located((By.CSS_SELECTOR, "div#weekend-news-result > ul.weekendNews-lst")),
+      "result_container",
     )
     items_count = len(container.find_elements(By.CSS_SELECTOR, "div.item"))
     logger.debug(f"Found {items_count} day items.")
   except Exception:
     logger.exception("Failed to locate container or count items.")
-    return []
+    raise
 
   # 2. Iterate Through Items
   for i in range(items_count):
@@ -138,7 +216,7 @@ def _scrape_visible_block(client: BrowserClient, category: Category) -> List[Dic
 
       # 3. Process Inner News List (li)
       li_elements = day_item.find_elements(By.CSS_SELECTOR, "div.cont > ul > li")
-      limit = min(len(li_elements), 10)
+      limit = min(len(li_elements), MAX_TOPICS_PER_DAY)
       
       for j in range(limit):
         try:
@@ -151,11 +229,7 @@ def _scrape_visible_block(client: BrowserClient, category: Category) -> List[Dic
           title = title_attr if title_attr else title_span
 
           num_text = a_tag.find_element(By.CSS_SELECTOR, "i.num").text.strip()
-          
-          try:
-            article_count = int(num_text)
-          except ValueError:
-            article_count = None
+          article_count = _parse_article_count(num_text)
 
           results.append({
             "date": date_str,
@@ -175,71 +249,231 @@ def _scrape_visible_block(client: BrowserClient, category: Category) -> List[Dic
   return results
 
 
-def collect_weekly_news_total(
+def _parse_article_count(num_text: str) -> Optional[int]:
+  """
+  Convert the topic's article count text into int (None when not numeric).
+  """
+  try:
+    return int(num_text)
+  except ValueError:
+    return None
+
+
+def _scrape_visible_block_script(client: BrowserClient, category: Category) -> List[Dict]:
+  """
+  Parse the visible 5-day blocks (Mon-Fri) with a single execute_script call.
+  Raises when the script fails or the container is not rendered yet.
+  """
+  payload = client.driver.execute_script(_EXTRACT_BLOCK_JS, MAX_TOPICS_PER_DAY)
+  if payload is None:
+    raise RuntimeError("Result container not found.")
+
+  results = []
+  for day in json.loads(payload):
+    for topic in day["topics"]:
+      results.append({
+        "date": day["date"],
+        "category": category,
+        "title": topic["title_attr"] or topic["title_span"],
+        "article_count": _parse_article_count(topic["num"]),
+      })
+
+  return results
+
+
+def _scrape_visible_block(client: BrowserClient, category: Category) -> List[Dict]:
+  """
+  Parse the visible 5-day blocks (Mon-Fri) on the current screen.
+  Uses the single-call script extraction and falls back to the element-based path.
+
+  Raises when neither path scrapes any topic (container missing, page not loaded),
+  so the caller skips on_week and the week stays pending in the checkpoint.
+  """
+  try:
+    results = _scrape_visible_block_script(client, category)
+    if results:
+      logger.info(f"Scraped {len(results)} items (category={category}).")
+      return results
+    logger.warning("Script extraction found no topics. Falling back to element-based scraping.")
+  except Exception:
+    logger.warning("Script extraction failed. Falling back to element-based scraping.")
+
+  results = _scrape_visible_block_elements(client, category)
+  if not results:
+    raise RuntimeError(f"No topics scraped for the visible block (category={category}).")
+  return results
+
+
+def _filter_rows_in_range(rows: List[Dict], start_date: date, end_date: date) -> List[Dict]:
+  """
+  Keep rows whose 'date' falls within [start_date, end_date].
+  """
+  kept = []
+  for row in rows:
+    d_obj = datetime.strptime(row["date"], "%Y-%m-%d").date()
+    if start_date <= d_obj <= end_date:
+      kept.append(row)
+  return kept
+
+
+def _collect_anchor_weeks(
   client: BrowserClient,
+  category: Category,
+  fridays: List[date],
   start_date: date,
   end_date: date,
+  on_week: Optional[WeekCallback] = None,
 ) -> List[Dict]:
   """
-  Collect 'Total' category weekly news within the date range.
+  Search and scrape each Friday anchor in order on an already opened weekend news page.
+  Rows outside [start_date, end_date] are dropped; failed weeks are logged and skipped
+  (on_week is not called for them, so a checkpoint will retry them next run).
   """
-  logger.info(f"Collecting weekly [Total] news from {start_date} to {end_date}.")
-
-  _go_to_weekend_news_page(client, "total")
-  
-  fridays = generate_fridays(start_date, end_date)
   all_rows = []
 
   for fri in fridays:
     anchor_str = fri.strftime("%Y-%m-%d")
-    logger.info(f"Processing block anchored at {anchor_str}.")
+    logger.info(f"Processing {category} block anchored at {anchor_str}.")
 
     try:
       _search_by_date(client, fri)
-      block_rows = _scrape_visible_block(client, category="total")
+      block_rows = _scrape_visible_block(client, category=category)
+      week_rows = _filter_rows_in_range(block_rows, start_date, end_date)
 
-      for row in block_rows:
-        d_obj = datetime.strptime(row["date"], "%Y-%m-%d").date()
-        if start_date <= d_obj <= end_date:
-          all_rows.append(row)
+      all_rows.extend(week_rows)
+      if on_week is not None:
+        on_week(fri, week_rows)
     except Exception:
       logger.exception(f"Failed to process week anchored at {anchor_str}. Skipping to next.")
       continue
 
-  logger.info(f"Finished [Total] collection. Total rows: {len(all_rows)}")
   return all_rows
 
 
-def collect_weekly_news_economy(
+def collect_weekly_news(
   client: BrowserClient,
+  category: Category,
   start_date: date,
   end_date: date,
+  anchors: Optional[List[date]] = None,
+  on_week: Optional[WeekCallback] = None,
 ) -> List[Dict]:
   """
-  Collect 'Economy' category weekly news within the date range.
+  Collect weekly news of a category within the date range.
+
+  - anchors: Friday anchors to crawl (default: every Friday in the range)
+  - on_week: callback invoked after each scraped week (e.g. flush to disk + checkpoint)
   """
-  logger.info(f"Collecting weekly [Economy] news from {start_date} to {end_date}.")
+  logger.info(f"Collecting weekly [{category}] news from {start_date} to {end_date}.")
 
-  _go_to_weekend_news_page(client, "economy")
-  
-  fridays = generate_fridays(start_date, end_date)
-  all_rows = []
+  if anchors is None:
+    anchors = generate_fridays(start_date, end_date)
 
-  for fri in fridays:
+  if not anchors:
+    logger.info(f"No pending weeks for [{category}].")
+    return []
+
+  _go_to_weekend_news_page(client, category)
+  all_rows = _collect_anchor_weeks(client, category, anchors, start_date, end_date, on_week)
+
+  logger.info(f"Finished [{category}] collection. Total rows: {len(all_rows)}")
+  return all_rows
+
+
+def collect_weekly_news_multi(
+  client: BrowserClient,
+  categories: List[Category],
+  start_date: date,
+  end_date: date,
+  anchors: Optional[Dict[Category, List[date]]] = None,
+  on_week: Optional[Dict[Category, WeekCallback]] = None,
+) -> Dict[Category, List[Dict]]:
+  """
+  Collect several categories on one driver with a single date search per week.
+
+  After scraping a week, the 'issueCategory' select is switched in place and the
+  re-rendered block is scraped for the next category. If the site does not
+  re-render the same week on the switch, the date is searched again.
+  The category left selected is scraped first on the next week to save a switch.
+  """
+  logger.info(f"Collecting weekly {categories} news from {start_date} to {end_date} (one search per week).")
+
+  if anchors is None:
+    fridays = generate_fridays(start_date, end_date)
+    anchors = {c: fridays for c in categories}
+  on_week = on_week or {}
+
+  pending = {c: set(anchors.get(c, [])) for c in categories}
+  all_anchors = sorted(set().union(*pending.values()))
+  results: Dict[Category, List[Dict]] = {c: [] for c in categories}
+
+  if not all_anchors:
+    logger.info(f"No pending weeks for {categories}.")
+    return results
+
+  current = categories[0]
+  _go_to_weekend_news_page(client, current)
+  searches = 0
+
+  for fri in all_anchors:
     anchor_str = fri.strftime("%Y-%m-%d")
-    logger.info(f"Processing economy block anchored at {anchor_str}.")
+    wanted = [c for c in categories if fri in pending[c]]
+    wanted.sort(key=lambda c: c != current)
+    searched = False
+
+    for category in wanted:
+      logger.info(f"Processing {category} block anchored at {anchor_str}.")
+
+      try:
+        if category != current:
+          # The previous category's block; what we scrape next must differ from it
+          shown = result_signature(client.driver) or {}
+          rerendered = _select_category(client, category)
+          current = category
+          signature = result_signature(client.driver) or {}
+          same_week = anchor_str in signature.get("dates", [])
+          if not (searched and rerendered and same_week):
+            _search_by_date(client, fri, previous=shown if searched else None)
+            searches += 1
+        elif not searched:
+          _search_by_date(client, fri)
+          searches += 1
+        searched = True
+
+        block_rows = _scrape_visible_block(client, category=category)
+        week_rows = _filter_rows_in_range(block_rows, start_date, end_date)
+
+        results[category].extend(week_rows)
+        if category in on_week:
+          on_week[category](fri, week_rows)
+      except Exception:
+        logger.exception(f"Failed to process {category} week anchored at {anchor_str}. Skipping to next.")
+        continue
 
-    try:
-      _search_by_date(client, fri)
-      block_rows = _scrape_visible_block(client, category="economy")
+  logger.info(
+    f"Finished {categories} collection with {searches} date searches for {len(all_anchors)} weeks. "
+    + ", ".join(f"{c}: {len(rows)} rows" for c, rows in results.items())
+  )
+  return results
 
-      for row in block_rows:
-        d_obj = datetime.strptime(row["date"], "%Y-%m-%d").date()
-        if start_date <= d_obj <= end_date:
-          all_rows.append(row)
-    except Exception:
-      logger.exception(f"Failed to process week anchored at {anchor_str}. Skipping to next.")
-      continue
 
-  logger.info(f"Finished [Economy] collection. Total rows: {len(all_rows)}")
-  return all_rows
\ No newline at end of file
+def collect_weekly_news_total(
+  client: BrowserClient,
+  start_date: date,
+  end_date: date,
+) -> List[Dict]:
+  """
+  Collect 'Total' category weekly news within the date range.
+  """
+  return collect_weekly_news(client, "total", start_date, end_date)
+
+
+def collect_weekly_news_economy(
+  client: BrowserClient,
+  start_date: date,
+  end_date: date,
+) -> List[Dict]:
+  """
+  Collect 'Economy' category weekly news within the date range.
+  """
+  return collect_weekly_news(client, "economy", start_date, end_date)
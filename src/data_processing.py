@@ -1,18 +1,79 @@
+import multiprocessing
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
-from typing import List, Set
+from typing import List, Optional, Set, Tuple
 
 import pandas as pd
-from konlpy.tag import Komoran
 
+from keyword_cache import KEYWORD_CACHE_PATH, KeywordCache, stopwords_fingerprint
+from keyword_store import keywords_parquet_path, save_keyword_dataset
 from logger import AppLogger
 from utils import load_stopwords
 
 logger = AppLogger("[DataProcessing]")
 
-komoran = Komoran()
+# Loaded on first use: creating Komoran starts a JVM (several seconds)
+_komoran = None
+_stopwords: Optional[Set[str]] = None
 
-STOPWORDS = load_stopwords()
+# Bump whenever the keyword extraction rules change (invalidates cached keywords)
+KEYWORD_EXTRACTOR_VERSION = 1
+
+# Compiled once, shared by the per-title and the vectorized (Series.str) paths
+_NON_TEXT_RE = re.compile(r"[^가-힣0-9A-Za-z\s]")
+_SPACES_RE = re.compile(r"\s+")
+_EN_TOKEN_RE = re.compile(r"[A-Za-z]{2,}")
+_EN_UPPER_TOKEN_RE = re.compile(r"[A-Z]{2,}")
+
+# Batched Komoran analysis: cleaned titles never contain '.', so a '.' morpheme
+# in the joined analysis always marks a title boundary.
+_BATCH_SENTINEL = " . "
+_SENTINEL_MORPH = "."
+# `morph/TAG` items of KomoranResult.getPlainText() (eojeols: ' ', morphemes: '+')
+_PLAIN_TEXT_SPLIT_RE = re.compile(r"[\s+]+")
+
+
+def get_komoran():
+  """
+  Return the process-wide Komoran analyzer, starting the JVM on first call.
+  """
+  global _komoran
+  if _komoran is None:
+    from konlpy.tag import Komoran
+
+    started = time.perf_counter()
+    _komoran = Komoran()
+    logger.info(f"Komoran initialized in {time.perf_counter() - started:.1f}s.")
+  return _komoran
+
+
+def get_stopwords() -> Set[str]:
+  """
+  Return the news stopword set, loaded from disk on first call.
+  """
+  global _stopwords
+  if _stopwords is None:
+    _stopwords = load_stopwords()
+  return _stopwords
+
+
+def _analyzer_version() -> str:
+  try:
+    konlpy_version = version("konlpy")
+  except PackageNotFoundError:
+    konlpy_version = "unknown"
+  return f"komoran/konlpy-{konlpy_version}/extractor-v{KEYWORD_EXTRACTOR_VERSION}"
+
+
+def keyword_rules_version() -> str:
+  """
+  Identifies the analyzer + stopwords that produced a keyword dataset.
+  """
+  return f"{_analyzer_version()}/stopwords-{stopwords_fingerprint(get_stopwords())}"
 
 
 def _load_raw_datasets(
@@ -56,61 +117,256 @@ def _clean_text(text: str) -> str:
     return ""
 
   # Remove characters except Korean, English, Numbers, and Whitespace
-  text = re.sub(r"[^가-힣0-9A-Za-z\s]", " ", text)
+  text = _NON_TEXT_RE.sub(" ", text)
 
   # Replace multiple spaces with a single space
-  text = re.sub(r"\s+", " ", text)
+  text = _SPACES_RE.sub(" ", text)
 
   return text.strip()
 
 
-def _extract_keywords(text: str, stopwords: Set[str] = STOPWORDS) -> List[str]:
+def clean_titles(titles: pd.Series) -> pd.Series:
+  """
+  Vectorized `_clean_text` over a Series of titles (same output, no per-row Python call).
+  """
+  return (
+    titles.astype(str)
+    .str.replace(_NON_TEXT_RE, " ", regex=True)
+    .str.replace(_SPACES_RE, " ", regex=True)
+    .str.strip()
+  )
+
+
+def extract_english_tokens(clean_titles: pd.Series) -> pd.Series:
+  """
+  Uppercased English tokens (length >= 2) of each cleaned title, in order of appearance.
+  Upper-casing first is safe: cleaned titles only hold Hangul, digits, ASCII letters and spaces.
+  """
+  return clean_titles.str.upper().str.findall(_EN_UPPER_TOKEN_RE)
+
+
+def _merge_keywords(ko_nouns: List[str], en_tokens: List[str], stopwords: Set[str]) -> List[str]:
+  # Merge & Deduplicate (Preserving Order), then drop Stopwords & Single-character Tokens
+  merged = dict.fromkeys(ko_nouns + en_tokens)
+  return [t for t in merged if t not in stopwords and len(t) > 1]
+
+
+def _keywords_from_clean(
+  cleaned: str,
+  en_tokens: List[str],
+  stopwords: Optional[Set[str]] = None,
+) -> List[str]:
+  """
+  Keywords of an already cleaned title whose English tokens were precomputed;
+  only the Komoran noun analysis runs here.
+  """
+  if not cleaned:
+    return []
+
+  try:
+    ko_nouns = get_komoran().nouns(cleaned)
+    return _merge_keywords(ko_nouns, en_tokens, get_stopwords() if stopwords is None else stopwords)
+
+  except Exception:
+    logger.warning(f"Failed to extract keywords from text: {cleaned[:20]}...")
+    return []
+
+
+def _extract_keywords(text: str, stopwords: Optional[Set[str]] = None) -> List[str]:
   """
   Extract keywords from text using Komoran (Korean Nouns) and Regex (English).
+  Uses the news stopwords (get_stopwords) when `stopwords` is None.
   """
   if not isinstance(text, str) or not text.strip():
     return []
 
   cleaned = _clean_text(text)
-  
+  # Normalize to uppercase (AI, ESG, CPI, etc.)
+  en_tokens = [w.upper() for w in _EN_TOKEN_RE.findall(cleaned)]
+
+  return _keywords_from_clean(cleaned, en_tokens, stopwords)
+
+
+def _nouns_batched(cleaned: List[str]) -> Optional[List[List[str]]]:
+  """
+  Komoran nouns of many non-empty cleaned titles from a single JVM call.
+
+  The titles are joined with a sentinel, analyzed as one text and split back at
+  the sentinel morphemes; nouns follow konlpy's Komoran.nouns rule (tags 'NN*').
+  Returns None when the batch cannot be analyzed or split back one-to-one,
+  so the caller falls back to per-title analysis.
+  """
   try:
-    # 1. Extract Korean Nouns
-    ko_nouns = komoran.nouns(cleaned)
-
-    # 2. Extract English Tokens (Length >= 2)
-    en_tokens = re.findall(r"[A-Za-z]{2,}", cleaned)
-    # Normalize to uppercase (AI, ESG, CPI, etc.)
-    en_tokens = [w.upper() for w in en_tokens]
-
-    # 3. Merge & Deduplicate (Preserving Order)
-    merged = ko_nouns + en_tokens
-    merged = list(dict.fromkeys(merged))
-
-    # 4. Remove Stopwords & Single-character Tokens
-    keywords = [
-      t for t in merged
-      if t not in stopwords and len(t) > 1
-    ]
-    
-    return keywords
+    plain = get_komoran().jki.analyze(_BATCH_SENTINEL.join(cleaned)).getPlainText()
+  except Exception:
+    logger.debug(f"Batched Komoran analysis failed for {len(cleaned)} titles. Falling back to per-title calls.")
+    return None
+
+  nouns: List[List[str]] = [[]]
+  for item in _PLAIN_TEXT_SPLIT_RE.split(str(plain).strip()):
+    morph, _, tag = item.rpartition("/")
+    if morph == _SENTINEL_MORPH:
+      nouns.append([])
+    elif tag.startswith("NN"):
+      nouns[-1].append(morph)
+
+  if len(nouns) != len(cleaned):
+    logger.debug(f"Batched analysis split into {len(nouns)} parts for {len(cleaned)} titles. Falling back.")
+    return None
+
+  return nouns
+
 
+def _batch_matches_sample(cleaned: List[str], nouns: List[List[str]]) -> bool:
+  """
+  Spot check of a batched analysis: the middle title (most context on both
+  sides of it) must get the same nouns as when analyzed on its own.
+  """
+  probe = len(cleaned) // 2
+  try:
+    matches = get_komoran().nouns(cleaned[probe]) == nouns[probe]
   except Exception:
-    logger.warning(f"Failed to extract keywords from text: {text[:20]}...")
-    return []
+    return False
+  if not matches:
+    logger.debug(f"Batched nouns differ from per-title analysis for: {cleaned[probe][:20]}... Falling back.")
+  return matches
+
+
+def _init_keyword_worker() -> None:
+  """
+  Process pool initializer: give each worker its own Komoran (JVM) instance, created once.
+  """
+  get_komoran()
+
+
+def _extract_keywords_chunk(
+  items: List[Tuple[str, List[str]]],
+  batch_size: int = 0,
+) -> List[List[str]]:
+  """
+  Keywords of (cleaned title, English tokens) pairs.
+  batch_size > 1 analyzes that many titles per Komoran call (see _nouns_batched);
+  a batch whose sampled title disagrees with per-title analysis is re-analyzed per title.
+  """
+  stopwords = get_stopwords()
+  if batch_size <= 1:
+    return [_keywords_from_clean(t, en, stopwords) for t, en in items]
+
+  results: List[List[str]] = [[] for _ in items]
+  pending = [i for i, (t, _) in enumerate(items) if t]
+
+  for start in range(0, len(pending), batch_size):
+    batch = pending[start:start + batch_size]
+    texts = [items[i][0] for i in batch]
+    nouns = _nouns_batched(texts)
+    if nouns is not None and not _batch_matches_sample(texts, nouns):
+      nouns = None
+
+    for pos, i in enumerate(batch):
+      cleaned, en_tokens = items[i]
+      if nouns is None:
+        results[i] = _keywords_from_clean(cleaned, en_tokens, stopwords)
+      else:
+        results[i] = _merge_keywords(nouns[pos], en_tokens, stopwords)
+
+  return results
+
+
+def extract_keywords_parallel(
+  titles: List[str],
+  workers: int = 1,
+  chunk_size: int = 500,
+  batch_size: int = 0,
+) -> List[List[str]]:
+  """
+  Extract keywords of many cleaned titles, sharded across a process pool.
+
+  - English tokens are extracted for all titles at once (Series.str) in this
+    process; workers only run the Komoran noun analysis.
+  - Each worker initializes its own Komoran once; results keep the input order
+    and are identical to `[_extract_keywords(t) for t in titles]`.
+  - workers <= 1 runs serially in this process.
+  - batch_size > 1 feeds that many titles to each Komoran call.
+  """
+  en_tokens = extract_english_tokens(pd.Series(titles, dtype=object)).tolist()
+  items = list(zip(titles, en_tokens))
+
+  if workers <= 1 or len(items) <= chunk_size:
+    return _extract_keywords_chunk(items, batch_size)
+
+  chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+  workers = min(workers, len(chunks))
+  logger.info(f"Extracting keywords with {workers} workers ({len(chunks)} chunks of <= {chunk_size} titles).")
+
+  started = time.perf_counter()
+
+  # 'spawn': a JVM does not survive fork, workers must start from a clean interpreter
+  ctx = multiprocessing.get_context("spawn")
+  with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_init_keyword_worker) as pool:
+    # map() yields results in submission order
+    results = [kw for chunk in pool.map(partial(_extract_keywords_chunk, batch_size=batch_size), chunks) for kw in chunk]
+
+  logger.info(f"Parallel keyword extraction done in {time.perf_counter() - started:.1f}s.")
+  return results
+
+
+def extract_keywords_cached(
+  titles: List[str],
+  workers: int = 1,
+  chunk_size: int = 500,
+  cache_path: Optional[str] = KEYWORD_CACHE_PATH,
+  batch_size: int = 0,
+) -> List[List[str]]:
+  """
+  Extract keywords for cleaned titles, analyzing each distinct title once and
+  only the ones missing from the on-disk cache (cache_path=None disables it).
+
+  Empty results are not cached, so a transient analyzer failure is retried next run.
+  Neither are batched results (batch_size > 1): Komoran's context across the joined
+  titles can change their nouns, and the cache holds per-title analysis only.
+  """
+  unique = list(dict.fromkeys(titles))
+
+  if cache_path is None:
+    extracted = dict(zip(unique, extract_keywords_parallel(unique, workers, chunk_size, batch_size)))
+    return [list(extracted[t]) for t in titles]
+
+  with KeywordCache(cache_path, get_stopwords(), _analyzer_version()) as cache:
+    extracted = cache.get_many(unique)
+    misses = [t for t in unique if t not in extracted]
+
+    if misses:
+      logger.info(f"Analyzing {len(misses)} uncached titles (of {len(unique)} distinct).")
+      fresh = dict(zip(misses, extract_keywords_parallel(misses, workers, chunk_size, batch_size)))
+      if batch_size > 1:
+        logger.info(f"Not caching {len(fresh)} keyword results of batched analysis (batch_size={batch_size}).")
+      else:
+        cache.put_many({t: kw for t, kw in fresh.items() if kw})
+      extracted.update(fresh)
+
+    cache.log_stats()
+
+  return [list(extracted[t]) for t in titles]
 
 
 def preprocess_news_dataset(
   total_csv_path: str,
   economy_csv_path: str,
   output_csv_path: str = "data/clean_dataset.csv",
+  workers: int = 1,
+  chunk_size: int = 500,
+  cache_path: Optional[str] = KEYWORD_CACHE_PATH,
+  batch_size: int = 0,
 ) -> pd.DataFrame:
   """
   Full Preprocessing Pipeline:
   - Load CSVs
   - Drop NA & Duplicates
   - Clean Text
-  - Extract Keywords (Komoran + Stopwords)
-  - Save to 'clean_dataset.csv'
+  - Extract Keywords (Komoran + Stopwords), in `workers` processes when > 1,
+    skipping titles already in the keyword cache (cache_path=None disables it);
+    batch_size > 1 analyzes that many titles per Komoran call
+  - Save to 'clean_dataset.csv' and its Parquet twin (keywords as list<string>)
   """
   logger.info("Starting preprocessing pipeline.")
 
@@ -140,11 +396,17 @@ def preprocess_news_dataset(
   try:
     logger.info("Cleaning titles and extracting keywords with Komoran.")
 
-    # Create temporary clean_title column
-    df["clean_title"] = df["title"].astype(str).apply(_clean_text)
+    # Create temporary clean_title column (vectorized)
+    df["clean_title"] = clean_titles(df["title"])
 
     # Extract keywords
-    df["keywords"] = df["clean_title"].apply(_extract_keywords)
+    df["keywords"] = extract_keywords_cached(
+      df["clean_title"].tolist(),
+      workers=workers,
+      chunk_size=chunk_size,
+      cache_path=cache_path,
+      batch_size=batch_size,
+    )
 
     # Cast article_count to numeric
     if "article_count" in df.columns:
@@ -163,6 +425,9 @@ def preprocess_news_dataset(
 
     logger.info(f"Saving cleaned dataset to {path}")
     df.to_csv(path, index=False, encoding="utf-8-sig")
+
+    # Typed twin read by the downstream steps (keywords as list<string>)
+    save_keyword_dataset(df, str(keywords_parquet_path(output_csv_path)))
   except Exception:
     logger.exception(f"Failed to save cleaned dataset to {path}.")
     raise
@@ -0,0 +1,265 @@
+import os
+from datetime import date, datetime
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import requests
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from browser_client import BrowserClient
+from crawler import (
+  MAX_TOPICS_PER_DAY,
+  WEEKEND_NEWS_URL,
+  Category,
+  WeekCallback,
+  _parse_article_count,
+  category_value,
+)
+from logger import AppLogger
+from utils import generate_fridays
+
+# `.env` key of the XHR endpoint that renders the weekly result block. Required for
+# live fetches: the weekend news page itself is only the shell the block is loaded into.
+DATA_URL_ENV = "BIGKINDS_WEEKEND_DATA_URL"
+
+# `.env` keys overriding the request parameter names; copy them from the request the
+# search button sends (browser devtools, Network tab) if they differ from the defaults
+DATE_PARAM_ENV = "BIGKINDS_WEEKEND_DATE_PARAM"
+CATEGORY_PARAM_ENV = "BIGKINDS_WEEKEND_CATEGORY_PARAM"
+DATE_PARAM = "searchDate"
+CATEGORY_PARAM = "issueCategory"
+
+logger = AppLogger("[HttpCrawler]")
+
+
+class _WeekendBlockParser(HTMLParser):
+  """
+  Parse `div.item[data-date] > div.cont > ul > li > a.topic-row` blocks
+  into the same rows as crawler._scrape_visible_block.
+  """
+
+  def __init__(self, category: Category):
+    super().__init__()
+    self.category = category
+    self.rows: List[Dict] = []
+
+    self._date: Optional[str] = None
+    self._li_index = 0
+    self._topic: Optional[Dict] = None
+    self._span_depth = 0
+    self._num_depth = 0
+
+  def handle_starttag(self, tag, attrs):
+    attrs = dict(attrs)
+    classes = (attrs.get("class") or "").split()
+
+    if tag == "div" and "item" in classes:
+      self._date = attrs.get("data-date") or None
+      self._li_index = 0
+    elif tag == "li" and self._date:
+      self._li_index += 1
+    elif tag == "a" and "topic-row" in classes and self._date:
+      if self._li_index <= MAX_TOPICS_PER_DAY:
+        self._topic = {"title_attr": attrs.get("title") or "", "span": None, "num": None}
+    elif self._topic is not None and tag == "span":
+      if self._topic["span"] is None:
+        self._topic["span"] = ""
+        self._span_depth = 1
+      elif self._span_depth:
+        self._span_depth += 1
+    elif self._topic is not None and tag == "i" and "num" in classes and self._topic["num"] is None:
+      self._topic["num"] = ""
+      self._num_depth = 1
+
+  def handle_endtag(self, tag):
+    if self._topic is None:
+      return
+
+    if tag == "span" and self._span_depth:
+      self._span_depth -= 1
+    elif tag == "i" and self._num_depth:
+      self._num_depth = 0
+    elif tag == "a":
+      topic, self._topic = self._topic, None
+      self._span_depth = self._num_depth = 0
+
+      # Same rule as the Selenium path: a topic needs its span and count nodes
+      if topic["span"] is None or topic["num"] is None:
+        return
+
+      self.rows.append({
+        "date": self._date,
+        "category": self.category,
+        "title": topic["title_attr"] or topic["span"].strip(),
+        "article_count": _parse_article_count(topic["num"].strip()),
+      })
+
+  def handle_data(self, data):
+    if self._topic is None:
+      return
+    if self._span_depth:
+      self._topic["span"] += data
+    if self._num_depth:
+      self._topic["num"] += data
+
+
+def parse_weekend_news_html(html: str, category: Category) -> List[Dict]:
+  """
+  Parse a weekly result page / fragment into {date, category, title, article_count} rows.
+  """
+  parser = _WeekendBlockParser(category)
+  parser.feed(html)
+  parser.close()
+  return parser.rows
+
+
+def resolve_data_url(data_url: Optional[str] = None) -> str:
+  """
+  The weekly block endpoint (argument or `.env`); raises ValueError when unset.
+  """
+  load_dotenv()
+  url = data_url or os.getenv(DATA_URL_ENV)
+  if not url:
+    msg = (
+      f"{DATA_URL_ENV} is not configured in `.env`. Set it to the XHR endpoint the weekend "
+      f"news page loads its result block from (the page URL {WEEKEND_NEWS_URL} returns no topics)."
+    )
+    logger.critical(msg)
+    raise ValueError(msg)
+  return url
+
+
+class HttpWeeklyClient:
+  """
+  Pooled HTTP session that fetches weekly issue blocks without a browser.
+
+  - Reuses the authenticated cookies of a logged-in BrowserClient (`from_browser`).
+  - fixture_dir: replay recorded responses (`{category}_{YYYY-MM-DD}.html`) offline.
+  - record_dir: save every live response there, to build fixtures.
+  - Live fetches need the data endpoint (data_url or BIGKINDS_WEEKEND_DATA_URL);
+    replays do not.
+  """
+
+  def __init__(
+    self,
+    cookies: Optional[List[Dict]] = None,
+    user_agent: Optional[str] = None,
+    data_url: Optional[str] = None,
+    pool_size: int = 8,
+    timeout: float = 15.0,
+    fixture_dir: Optional[str] = None,
+    record_dir: Optional[str] = None,
+  ):
+    load_dotenv()
+    self.fixture_dir = Path(fixture_dir) if fixture_dir else None
+    self.data_url = resolve_data_url(data_url) if self.fixture_dir is None else data_url
+    self.date_param = os.getenv(DATE_PARAM_ENV) or DATE_PARAM
+    self.category_param = os.getenv(CATEGORY_PARAM_ENV) or CATEGORY_PARAM
+    self.timeout = timeout
+    self.record_dir = Path(record_dir) if record_dir else None
+
+    self.session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    self.session.mount("https://", adapter)
+    self.session.mount("http://", adapter)
+
+    self.session.headers["Referer"] = WEEKEND_NEWS_URL
+    if user_agent:
+      self.session.headers["User-Agent"] = user_agent
+
+    for cookie in cookies or []:
+      self.session.cookies.set(
+        cookie["name"],
+        cookie["value"],
+        domain=cookie.get("domain"),
+        path=cookie.get("path", "/"),
+      )
+
+  @classmethod
+  def from_browser(cls, client: BrowserClient, **kwargs) -> "HttpWeeklyClient":
+    """
+    Build a client from the session of an already logged-in BrowserClient.
+    """
+    cookies = client.driver.get_cookies()
+    user_agent = client.driver.execute_script("return navigator.userAgent;")
+    logger.info(f"Reusing {len(cookies)} browser cookies for the HTTP session.")
+    return cls(cookies=cookies, user_agent=user_agent, **kwargs)
+
+  @staticmethod
+  def _fixture_name(category: Category, anchor: date) -> str:
+    return f"{category}_{anchor.strftime('%Y-%m-%d')}.html"
+
+  def fetch_week(self, category: Category, anchor: date) -> str:
+    """
+    Return the weekly result HTML of an anchor date.
+    """
+    if self.fixture_dir is not None:
+      path = self.fixture_dir / self._fixture_name(category, anchor)
+      logger.debug(f"Replaying recorded response {path}")
+      return path.read_text(encoding="utf-8")
+
+    params = {
+      self.date_param: anchor.strftime("%Y-%m-%d"),
+      self.category_param: category_value(category),
+    }
+    res = self.session.get(self.data_url, params=params, timeout=self.timeout)
+    res.raise_for_status()
+    html = res.text
+
+    if self.record_dir is not None:
+      self.record_dir.mkdir(parents=True, exist_ok=True)
+      (self.record_dir / self._fixture_name(category, anchor)).write_text(html, encoding="utf-8")
+
+    return html
+
+  def close(self) -> None:
+    self.session.close()
+
+
+def collect_weekly_news_http(
+  http_client: HttpWeeklyClient,
+  category: Category,
+  start_date: date,
+  end_date: date,
+  anchors: Optional[List[date]] = None,
+  on_week: Optional[WeekCallback] = None,
+) -> List[Dict]:
+  """
+  HTTP counterpart of crawler.collect_weekly_news (same arguments and rows).
+  """
+  logger.info(f"Collecting weekly [{category}] news over HTTP from {start_date} to {end_date}.")
+
+  if anchors is None:
+    anchors = generate_fridays(start_date, end_date)
+
+  all_rows = []
+
+  for fri in anchors:
+    anchor_str = fri.strftime("%Y-%m-%d")
+    logger.info(f"Fetching {category} block anchored at {anchor_str}.")
+
+    try:
+      html = http_client.fetch_week(category, fri)
+      block_rows = parse_weekend_news_html(html, category)
+      if not block_rows:
+        raise ValueError("No topics found in response (session expired or endpoint changed?).")
+
+      week_rows = []
+      for row in block_rows:
+        d_obj = datetime.strptime(row["date"], "%Y-%m-%d").date()
+        if start_date <= d_obj <= end_date:
+          week_rows.append(row)
+
+      all_rows.extend(week_rows)
+      if on_week is not None:
+        on_week(fri, week_rows)
+    except Exception:
+      logger.exception(f"Failed to fetch week anchored at {anchor_str}. Skipping to next.")
+      continue
+
+  logger.info(f"Finished [{category}] HTTP collection. Total rows: {len(all_rows)}")
+  return all_rows
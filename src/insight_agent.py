@@ -78,12 +78,13 @@ def _build_prompt(
     surge_rows: List[dict],
     user_prompt: str,
     sources_block: str,
+    method: str = "pct_change",
 ) -> str:
     period = f"{start_date:%Y-%m} ~ {end_date:%Y-%m}"
     surge_lines = []
     for row in surge_rows:
         surge_lines.append(
-            f"- {row['keyword']}: first={row['first']}, last={row['last']}, change={row['change']}, pct_change={row['pct_change']:.2f}"
+            f"- {row['keyword']}: first={row['first']}, last={row['last']}, change={row['change']}, {method}={row[method]:.2f}"
         )
     surge_text = "\n".join(surge_lines) if surge_lines else "- (no surge keywords)"
 
@@ -91,7 +92,7 @@ def _build_prompt(
         "You are a research assistant. Answer in Korean.\n"
         "Use the sources to ground your explanation. Cite sources like [1], [2].\n\n"
         f"기간: {period}\n"
-        "급등 키워드(요약 데이터):\n"
+        f"급등 키워드(요약 데이터, {method} 기준 순위):\n"
         f"{surge_text}\n\n"
         f"사용자 요청: {user_prompt}\n\n"
         "웹 검색 결과:\n"
@@ -128,6 +129,7 @@ def generate_insight(
     surge_rows: List[dict],
     user_prompt: str,
     max_results_per_keyword: int = 4,
+    method: str = "pct_change",
 ) -> dict:
     keywords = [row["keyword"] for row in surge_rows]
     if not keywords:
@@ -141,7 +143,7 @@ def generate_insight(
     )
 
     sources_block = _format_sources(results)
-    prompt = _build_prompt(start_date, end_date, surge_rows, user_prompt, sources_block)
+    prompt = _build_prompt(start_date, end_date, surge_rows, user_prompt, sources_block, method)
 
     content = summarize_with_openai(prompt)
     return {
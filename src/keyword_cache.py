@@ -0,0 +1,88 @@
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Set
+
+from logger import AppLogger
+
+logger = AppLogger("[KeywordCache]")
+
+KEYWORD_CACHE_PATH = "../.cache/keyword_cache.sqlite"
+
+
+def stopwords_fingerprint(stopwords: Set[str]) -> str:
+  """
+  Order-independent hash of a stopword set.
+  """
+  return hashlib.sha256("\n".join(sorted(stopwords)).encode("utf-8")).hexdigest()[:16]
+
+
+class KeywordCache:
+  """
+  Content-addressed on-disk cache: cleaned title -> extracted keywords.
+
+  The key is a hash of the cleaned title, the stopword set and the analyzer
+  version, so changing any of them naturally misses the old entries.
+  """
+
+  def __init__(self, path: str, stopwords: Set[str], analyzer_version: str):
+    self.path = Path(path)
+    self.path.parent.mkdir(parents=True, exist_ok=True)
+    self._salt = f"{analyzer_version}\x1f{stopwords_fingerprint(stopwords)}\x1f"
+
+    self.hits = 0
+    self.misses = 0
+
+    self._conn = sqlite3.connect(str(self.path))
+    self._conn.execute(
+      "CREATE TABLE IF NOT EXISTS keywords (key TEXT PRIMARY KEY, keywords TEXT NOT NULL) WITHOUT ROWID"
+    )
+    self._conn.commit()
+
+  def __enter__(self) -> "KeywordCache":
+    return self
+
+  def __exit__(self, exc_type, exc, tb) -> None:
+    self.close()
+
+  def _key(self, title: str) -> str:
+    return hashlib.sha256((self._salt + title).encode("utf-8")).hexdigest()
+
+  def get_many(self, titles: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    Look up titles; returns {title: keywords} for cache hits only.
+    """
+    titles = list(dict.fromkeys(titles))
+    keys = {self._key(t): t for t in titles}
+    found: Dict[str, List[str]] = {}
+
+    key_list = list(keys)
+    # Stay below SQLite's host parameter limit
+    for i in range(0, len(key_list), 500):
+      batch = key_list[i:i + 500]
+      placeholders = ",".join("?" * len(batch))
+      rows = self._conn.execute(
+        f"SELECT key, keywords FROM keywords WHERE key IN ({placeholders})", batch
+      )
+      for key, payload in rows:
+        found[keys[key]] = json.loads(payload)
+
+    self.hits += len(found)
+    self.misses += len(titles) - len(found)
+    return found
+
+  def put_many(self, items: Dict[str, List[str]]) -> None:
+    self._conn.executemany(
+      "INSERT OR REPLACE INTO keywords VALUES (?, ?)",
+      ((self._key(t), json.dumps(kw, ensure_ascii=False)) for t, kw in items.items()),
+    )
+    self._conn.commit()
+
+  def log_stats(self) -> None:
+    total = self.hits + self.misses
+    rate = self.hits / total * 100 if total else 0.0
+    logger.info(f"Keyword cache: {self.hits} hits, {self.misses} misses ({rate:.1f}% hit rate) -> {self.path}")
+
+  def close(self) -> None:
+    self._conn.close()
@@ -0,0 +1,253 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from keyword_store import load_keywords_long, read_row_columns, resolve_keyword_source
+from logger import AppLogger
+
+logger = AppLogger("[KeywordMatrix]")
+
+KEYWORD_MATRIX_PATH = "../datasets/news_keywords_2025.matrix.npz"
+
+# Layout of the saved .npz; bump when keys change so older files are rebuilt, not loaded.
+# v1 (no format_version key) had no per-row weights.
+MATRIX_FORMAT_VERSION = 2
+
+
+def saved_format_version(path: str) -> int:
+  """
+  Format version of a saved matrix file (1 for files written before versioning).
+  """
+  with np.load(path, allow_pickle=False) as z:
+    return int(z["format_version"]) if "format_version" in z.files else 1
+
+
+@dataclass
+class KeywordMatrix:
+  """
+  Headlines x keywords document-term matrix shared by the analysis steps.
+
+  - matrix: CSR (n_rows x n_keywords), entry = the row's article_count for each
+    keyword occurrence (same weighting as the monthly counts).
+  - vocab: keyword strings; column j is vocab[j] (sorted, so ids are stable
+    for the same vocabulary).
+  - dates / categories / weights: per-row metadata ("YYYY-MM-DD" strings and
+    article_count, row order of the keyword dataset).
+  """
+  matrix: sparse.csr_matrix
+  vocab: np.ndarray
+  dates: np.ndarray
+  categories: np.ndarray
+  weights: np.ndarray
+
+  @property
+  def shape(self):
+    return self.matrix.shape
+
+  def vocab_index(self) -> Dict[str, int]:
+    """
+    keyword -> column id.
+    """
+    return {kw: i for i, kw in enumerate(self.vocab.tolist())}
+
+  def binary(self) -> sparse.csr_matrix:
+    """
+    Presence matrix (1 where a row contains the keyword), as int64.
+    """
+    b = self.matrix.copy()
+    b.data = np.ones(b.nnz, dtype=np.int64)
+    return b
+
+  def row_mask(
+    self,
+    category: Optional[str] = None,
+    year: Optional[int] = None,
+    month: Optional[int] = None,
+  ) -> np.ndarray:
+    """
+    Boolean row selector for a category and/or a year / month slice.
+    """
+    mask = np.ones(self.shape[0], dtype=bool)
+    if category is not None:
+      mask &= self.categories == category
+    if year is not None or month is not None:
+      months = self.row_months()
+      if year is not None:
+        mask &= (months["year"] == year).to_numpy()
+      if month is not None:
+        mask &= (months["month"] == month).to_numpy()
+    return mask
+
+  def row_months(self) -> pd.DataFrame:
+    """
+    Per-row year/month (NaN for rows whose date does not parse).
+    """
+    d = pd.to_datetime(pd.Series(self.dates), errors="coerce")
+    return pd.DataFrame({"year": d.dt.year, "month": d.dt.month})
+
+  def monthly_counts(self) -> pd.DataFrame:
+    """
+    (keyword, category, year, month, count) long table computed as one sparse
+    product: (groups x rows) indicator @ matrix. Same rows as
+    keyword_monthly_agg.build_monthly_keyword_counts.
+    """
+    meta = self.row_months()
+    meta["category"] = self.categories
+    valid = meta["year"].notna().to_numpy()
+
+    keys = meta[valid].astype({"year": int, "month": int})
+    grouper = keys.groupby(["category", "year", "month"], sort=True)
+    codes = grouper.ngroup().to_numpy()
+    groups = grouper.size().index.to_frame(index=False)
+    rows = np.flatnonzero(valid)
+    indicator = sparse.csr_matrix(
+      (np.ones(len(rows), dtype=np.int64), (codes, rows)),
+      shape=(len(groups), self.shape[0]),
+    )
+
+    counts = (indicator @ self.matrix).tocoo()
+    out = groups.iloc[counts.row].reset_index(drop=True)
+    out.insert(0, "keyword", self.vocab[counts.col])
+    out["count"] = counts.data.astype(np.int64)
+    out = out[out["count"] != 0]
+
+    return out.sort_values(
+      by=["category", "year", "month", "count", "keyword"],
+      ascending=[True, True, True, False, True],
+    ).reset_index(drop=True)
+
+  def save(self, path: str = KEYWORD_MATRIX_PATH) -> None:
+    """
+    Write everything into one compressed .npz (no pickled objects), atomically.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+
+    m = self.matrix
+    with tmp.open("wb") as f:
+      np.savez_compressed(
+        f,
+        data=m.data,
+        indices=m.indices,
+        indptr=m.indptr,
+        shape=np.array(m.shape),
+        vocab=self.vocab.astype(str),
+        dates=self.dates.astype(str),
+        categories=self.categories.astype(str),
+        weights=self.weights,
+        format_version=np.array(MATRIX_FORMAT_VERSION),
+      )
+    os.replace(tmp, path)
+    logger.info(f"Saved keyword matrix {m.shape[0]} rows x {m.shape[1]} keywords (nnz={m.nnz}) -> {path}")
+
+  @classmethod
+  def load(cls, path: str = KEYWORD_MATRIX_PATH) -> "KeywordMatrix":
+    """
+    Read a matrix written by save(); raises ValueError for an older format version.
+    """
+    with np.load(path, allow_pickle=False) as z:
+      version = int(z["format_version"]) if "format_version" in z.files else 1
+      if version != MATRIX_FORMAT_VERSION:
+        raise ValueError(
+          f"{path} has keyword matrix format v{version}, expected v{MATRIX_FORMAT_VERSION}. "
+          "Rebuild it with build_keyword_matrix()."
+        )
+      matrix = sparse.csr_matrix((z["data"], z["indices"], z["indptr"]), shape=tuple(z["shape"]))
+      return cls(
+        matrix=matrix,
+        vocab=z["vocab"],
+        dates=z["dates"],
+        categories=z["categories"],
+        weights=z["weights"],
+      )
+
+
+def build_keyword_matrix(
+  input_csv: str = "../datasets/news_keywords_2025.csv",
+  output_path: Optional[str] = KEYWORD_MATRIX_PATH,
+) -> KeywordMatrix:
+  """
+  Build the keyword vocabulary + CSR matrix from the preprocessed dataset
+  (Parquet when available, legacy CSV otherwise) and save it (output_path=None skips saving).
+  """
+  logger.info(f"Building keyword matrix from {input_csv}.")
+
+  # 1. Load rows & keyword occurrences
+  try:
+    rows = read_row_columns(input_csv, ["date", "category", "article_count"])
+    long = load_keywords_long(input_csv)
+  except Exception:
+    logger.exception(f"Failed to load keyword dataset from {input_csv}")
+    raise
+
+  # 2. Encode keywords & weights
+  try:
+    keywords = long["keyword"].astype(str).str.strip()
+    keep = (keywords != "").to_numpy()
+    row_ids = long["row_id"].to_numpy()[keep]
+
+    codes, vocab = pd.factorize(keywords[keep], sort=True)
+    weights = pd.to_numeric(rows["article_count"], errors="coerce").fillna(0).astype(np.int64).to_numpy()
+
+    # Duplicate (row, keyword) pairs are summed, like exploding them would
+    matrix = sparse.csr_matrix(
+      (weights[row_ids], (row_ids, codes)),
+      shape=(len(rows), len(vocab)),
+    )
+    matrix.sum_duplicates()
+  except Exception:
+    logger.exception("Error encoding the keyword matrix.")
+    raise
+
+  km = KeywordMatrix(
+    matrix=matrix,
+    vocab=np.asarray(vocab, dtype=str),
+    dates=rows["date"].astype(str).to_numpy(dtype=str),
+    categories=rows["category"].astype(str).to_numpy(dtype=str),
+    weights=weights,
+  )
+
+  # 3. Save
+  if output_path is not None:
+    try:
+      km.save(output_path)
+    except Exception:
+      logger.exception(f"Failed to save keyword matrix to {output_path}")
+      raise
+
+  return km
+
+
+def load_keyword_matrix(
+  path: str = KEYWORD_MATRIX_PATH,
+  input_csv: str = "../datasets/news_keywords_2025.csv",
+) -> KeywordMatrix:
+  """
+  Load the saved matrix, rebuilding it when it is missing, older than the keyword
+  dataset or written in an older format version.
+  """
+  source = resolve_keyword_source(input_csv)
+  matrix_path = Path(path)
+
+  if matrix_path.exists() and (not source.exists() or matrix_path.stat().st_mtime >= source.stat().st_mtime):
+    try:
+      version = saved_format_version(str(matrix_path))
+    except Exception:
+      logger.exception(f"Failed to read keyword matrix {matrix_path}. Rebuilding.")
+      version = None
+
+    if version == MATRIX_FORMAT_VERSION:
+      logger.debug(f"Loading keyword matrix from {matrix_path}")
+      return KeywordMatrix.load(str(matrix_path))
+    if version is not None:
+      logger.info(f"Keyword matrix {matrix_path} has format v{version} (current v{MATRIX_FORMAT_VERSION}). Rebuilding.")
+  else:
+    logger.info(f"Keyword matrix {matrix_path} is missing or stale. Rebuilding.")
+
+  return build_keyword_matrix(input_csv, str(matrix_path))
@@ -1,138 +1,210 @@
-import ast
+import json
+import os
 from pathlib import Path
-from typing import List, Any
+from typing import Dict, Optional
 
 import pandas as pd
 
+from keyword_store import load_keywords_long, read_row_columns
 from logger import AppLogger
 
 logger = AppLogger("[KeywordMonthlyAgg]")
 
+GROUP_KEYS = ["keywords", "category", "year", "month"]
 
-def _parse_keywords_cell(cell: Any) -> List[str]:
+
+def _state_path(output_csv: str) -> Path:
   """
-  Convert the 'keywords' column read from CSV into a list[str].
-  - If it's already a list, return as is.
-  - If it's a string "['k1', 'k2']", use literal_eval.
-  - Otherwise, fallback to comma split.
+  Incremental state kept next to the output: `monthly_news_keywords_2025.state.json`.
   """
-  if isinstance(cell, list):
-    return cell
+  return Path(output_csv).with_suffix(".state.json")
+
 
-  if not isinstance(cell, str) or not cell.strip():
-    return []
+def _input_fingerprint(input_csv: str, high_water: Dict[str, str]) -> Dict[str, list]:
+  """
+  Per category: [rows, article total] of the input rows dated up to its high-water mark.
+  Only the date, category and article_count columns are read; keywords are not parsed.
+  """
+  rows = read_row_columns(input_csv, ["date", "category", "article_count"])
+  rows["date"] = rows["date"].astype(str)
+  rows["article_count"] = pd.to_numeric(rows["article_count"], errors="coerce").fillna(0).astype(int)
 
-  text = cell.strip()
+  fingerprint = {}
+  for category, mark in high_water.items():
+    seen = rows[(rows["category"] == category) & (rows["date"] <= mark)]
+    fingerprint[category] = [int(len(seen)), int(seen["article_count"].sum())]
+  return fingerprint
+
+
+def _load_state(input_csv: str, output_csv: str, rules_version: str) -> Optional[Dict]:
+  path = _state_path(output_csv)
+  if not path.exists() or not Path(output_csv).exists():
+    return None
 
-  # 1. Try parsing as Python literal list
   try:
-    value = ast.literal_eval(text)
-    if isinstance(value, list):
-      return value
+    with path.open("r", encoding="utf-8") as f:
+      state = json.load(f)
   except Exception:
-    pass
+    logger.exception(f"Failed to read aggregation state {path}. Rebuilding.")
+    return None
 
-  # 2. Fallback: Split by comma
-  parts = [p.strip() for p in text.split(",")]
-  return [p for p in parts if p]
+  if state.get("input") != str(Path(input_csv).resolve()):
+    return None
+  if state.get("rules_version") != rules_version:
+    logger.info("Keyword extraction rules changed since the last aggregation. Rebuilding.")
+    return None
+  return state
 
 
-def build_monthly_keyword_counts(
-  input_csv: str = "../datasets/news_keywords_2025.csv",
-  output_csv: str = "../datasets/monthly_news_keywords_2025.csv",
-) -> pd.DataFrame:
-  """
-  Generate aggregated CSV: clean_dataset.csv -> (keyword, category, year, month, count).
+def _save_state(input_csv: str, output_csv: str, high_water: Dict[str, str], rules_version: str) -> None:
+  state = {
+    "input": str(Path(input_csv).resolve()),
+    "rules_version": rules_version,
+    "high_water": high_water,
+    "fingerprint": _input_fingerprint(input_csv, high_water),
+  }
 
-  Logic:
-  - For every keyword in the 'keywords' list of each row,
-    accumulate the row's 'article_count' into the (keyword, category, year, month) group.
-  """
-  logger.info("Starting monthly keyword aggregation process.")
+  path = _state_path(output_csv)
+  tmp = path.with_name(path.name + ".tmp")
+  with tmp.open("w", encoding="utf-8") as f:
+    json.dump(state, f, ensure_ascii=False, indent=2)
+  os.replace(tmp, path)
 
-  # 1. Load Data
-  try:
-    logger.debug(f"Loading cleaned dataset from {input_csv}")
-    df = pd.read_csv(input_csv)
-  except Exception:
-    logger.exception(f"Failed to load dataset from {input_csv}")
-    raise
 
-  # 2. Process Dates & Columns
+def _aggregate(sub: pd.DataFrame) -> pd.DataFrame:
+  """
+  Keyword long table (date, category, article_count, keyword) -> summed counts per GROUP_KEYS.
+  """
+  # 1. Process Dates & Columns
   try:
     logger.debug("Processing dates and numeric columns.")
-    
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
-    df = df.dropna(subset=["date"])
-
-    df["year"] = df["date"].dt.year
-    df["month"] = df["date"].dt.month
 
-    # Convert article_count to int
-    df["article_count"] = pd.to_numeric(df["article_count"], errors="coerce").fillna(0).astype(int)
+    sub["date"] = pd.to_datetime(sub["date"], errors="coerce")
+    sub = sub.dropna(subset=["date"])
 
-    # Check category column
-    if "category" not in df.columns:
-      raise ValueError("Input CSV must contain 'category' column.")
+    # int64 like the previous table read back from CSV, so incremental == full rebuild
+    sub["year"] = sub["date"].dt.year.astype("int64")
+    sub["month"] = sub["date"].dt.month.astype("int64")
 
-    # Parse keywords
-    df["keywords"] = df["keywords"].apply(_parse_keywords_cell)
+    # Convert article_count to int
+    sub["article_count"] = pd.to_numeric(sub["article_count"], errors="coerce").fillna(0).astype(int)
   except Exception:
-    logger.exception("Error during data processing (date conversion or parsing).")
+    logger.exception("Error during data processing (date conversion).")
     raise
 
-  # 3. Explode Keywords & Clean
+  # 2. Clean Keywords
   try:
-    logger.debug("Exploding keywords list into individual rows.")
-    
     # Filter only necessary columns
-    sub = df[["year", "month", "category", "article_count", "keywords"]].copy()
-
-    # List -> Rows
-    sub = sub.explode("keywords")
+    sub = sub[["year", "month", "category", "article_count", "keyword"]].rename(columns={"keyword": "keywords"})
 
     # Remove empty keywords
     sub["keywords"] = sub["keywords"].astype(str).str.strip()
     sub = sub[sub["keywords"] != ""]
   except Exception:
-    logger.exception("Error during keyword explosion.")
+    logger.exception("Error during keyword cleaning.")
     raise
 
-  # 4. Group & Aggregate
+  # 3. Group & Aggregate
   try:
     logger.debug("Grouping by [keywords, category, year, month].")
-    
-    grouped = (
-      sub
-      .groupby(["keywords", "category", "year", "month"], as_index=False)["article_count"]
-      .sum()
-    )
-
-    grouped = grouped.rename(columns={
-      "keywords": "keyword",
-      "article_count": "count",
-    })
-
-    # Sort: category -> year -> month -> count (descending)
-    grouped = grouped.sort_values(
-      by=["category", "year", "month", "count"],
-      ascending=[True, True, True, False]
-    ).reset_index(drop=True)
-    
+    return sub.groupby(GROUP_KEYS, as_index=False)["article_count"].sum()
   except Exception:
     logger.exception("Error during grouping and aggregation.")
     raise
 
-  # 5. Save Result
+
+def _finalize(grouped: pd.DataFrame) -> pd.DataFrame:
+  grouped = grouped.rename(columns={
+    "keywords": "keyword",
+    "article_count": "count",
+  })
+
+  # Sort: category -> year -> month -> count (descending)
+  return grouped.sort_values(
+    by=["category", "year", "month", "count"],
+    ascending=[True, True, True, False]
+  ).reset_index(drop=True)
+
+
+def _load_previous_counts(output_csv: str) -> pd.DataFrame:
+  # Keywords such as "NA" or "NULL" must stay strings
+  prev = pd.read_csv(output_csv, dtype={"keyword": str}, keep_default_na=False, encoding="utf-8-sig")
+  return prev.rename(columns={"keyword": "keywords", "count": "article_count"})
+
+
+def build_monthly_keyword_counts(
+  input_csv: str = "../datasets/news_keywords_2025.csv",
+  output_csv: str = "../datasets/monthly_news_keywords_2025.csv",
+  incremental: bool = False,
+  rules_version: str = "",
+) -> pd.DataFrame:
+  """
+  Generate aggregated CSV: clean_dataset.csv -> (keyword, category, year, month, count).
+
+  Logic:
+  - For every keyword in the 'keywords' list of each row,
+    accumulate the row's 'article_count' into the (keyword, category, year, month) group.
+
+  incremental=True folds only rows dated after each category's high-water mark
+  into the previous output. The state file stores, per category, the row count
+  and article total of the input up to that mark; if they no longer match
+  (rows rewritten, back-filled or removed), or `rules_version` (the keyword
+  extraction rules, see data_processing.keyword_rules_version) differs, the
+  table is rebuilt in full.
+  The result is identical to a full rebuild either way.
+  """
+  logger.info("Starting monthly keyword aggregation process.")
+
+  state = _load_state(input_csv, output_csv, rules_version) if incremental else None
+  if state is not None:
+    high_water = state.get("high_water", {})
+    if _input_fingerprint(input_csv, high_water) != state.get("fingerprint"):
+      logger.info("Input rows before the high-water mark changed. Rebuilding monthly counts in full.")
+      state = None
+
+  # 1. Load Data (one row per keyword; Parquet when available, legacy CSV otherwise)
+  try:
+    since = state["high_water"] if state is not None else None
+    logger.debug(f"Loading keyword long table from {input_csv} (since={since})")
+    sub = load_keywords_long(input_csv, columns=["date", "category", "article_count"], since=since)
+  except Exception:
+    logger.exception(f"Failed to load dataset from {input_csv}")
+    raise
+
+  new_high_water = dict(state["high_water"]) if state is not None else {}
+  dates = pd.to_datetime(sub["date"], errors="coerce")
+  for category, latest in dates.groupby(sub["category"]).max().dropna().items():
+    new_high_water[category] = max(new_high_water.get(category, ""), latest.strftime("%Y-%m-%d"))
+
+  # 2. Aggregate (new rows only when incremental)
+  grouped = _aggregate(sub)
+
+  if state is not None:
+    try:
+      logger.info(f"Folding {len(sub)} new keyword rows into {output_csv}.")
+      prev = _load_previous_counts(output_csv)
+      grouped = (
+        pd.concat([prev[GROUP_KEYS + ["article_count"]], grouped], ignore_index=True)
+        .groupby(GROUP_KEYS, as_index=False)["article_count"]
+        .sum()
+      )
+    except Exception:
+      logger.exception("Error merging new counts into the previous monthly table.")
+      raise
+
+  grouped = _finalize(grouped)
+
+  # 3. Save Result
   path = Path(output_csv)
   try:
     logger.debug(f"Saving results to {path}")
     path.parent.mkdir(parents=True, exist_ok=True)
     grouped.to_csv(path, index=False, encoding="utf-8-sig")
+    _save_state(input_csv, output_csv, new_high_water, rules_version)
   except Exception:
     logger.exception(f"Failed to save output CSV to {path}")
     raise
 
   logger.info(f"Saved monthly keyword counts successfully (rows={len(grouped)}).")
 
-  return grouped
\ No newline at end of file
+  return grouped
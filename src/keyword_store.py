@@ -0,0 +1,175 @@
+import ast
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from logger import AppLogger
+
+logger = AppLogger("[KeywordStore]")
+
+
+def keywords_parquet_path(csv_path: str) -> Path:
+  """
+  Columnar twin of a keyword CSV: `news_keywords_2025.csv` -> `news_keywords_2025.parquet`.
+  """
+  return Path(csv_path).with_suffix(".parquet")
+
+
+def parse_keywords_cell(cell: Any) -> List[str]:
+  """
+  Convert a legacy CSV 'keywords' cell into a list[str].
+  - If it's already a list, return as is.
+  - If it's a string "['k1', 'k2']", use literal_eval.
+  - Otherwise, fallback to comma split.
+  """
+  if isinstance(cell, list):
+    return cell
+
+  if not isinstance(cell, str) or not cell.strip():
+    return []
+
+  text = cell.strip()
+
+  # 1. Try parsing as Python literal list
+  try:
+    value = ast.literal_eval(text)
+    if isinstance(value, list):
+      return value
+  except Exception:
+    pass
+
+  # 2. Fallback: Split by comma
+  parts = [p.strip() for p in text.split(",")]
+  return [p for p in parts if p]
+
+
+def save_keyword_dataset(df: pd.DataFrame, path: str) -> None:
+  """
+  Write the preprocessed dataset as Parquet with `keywords` as list<string>
+  (dictionary-encoded on disk). Raises ImportError when pyarrow is not installed.
+  """
+  try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+  except ImportError:
+    raise ImportError("The Parquet keyword dataset requires `pyarrow` (uv sync / pip install pyarrow).") from None
+
+  path = Path(path)
+  tmp = path.with_name(f".{path.name}.tmp")
+
+  try:
+    table = pa.Table.from_pandas(df.drop(columns=["keywords"]), preserve_index=False)
+    keywords = pa.array([list(k) for k in df["keywords"]], type=pa.list_(pa.string()))
+    table = table.append_column("keywords", keywords)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, tmp, use_dictionary=True, compression="zstd")
+    os.replace(tmp, path)
+  except Exception:
+    logger.exception(f"Failed to write keyword dataset to {path}.")
+    tmp.unlink(missing_ok=True)
+    raise
+
+  logger.info(f"Saved columnar keyword dataset -> {path} (rows={len(df)})")
+
+
+def resolve_keyword_source(path: str) -> Path:
+  """
+  Prefer the Parquet twin of a CSV path when it exists and is not older than the CSV.
+  """
+  path = Path(path)
+  if path.suffix == ".parquet":
+    return path
+
+  parquet = keywords_parquet_path(str(path))
+  if parquet.exists():
+    if not path.exists() or parquet.stat().st_mtime >= path.stat().st_mtime:
+      return parquet
+
+  return path
+
+
+def load_keyword_dataset(path: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+  """
+  Load the preprocessed dataset with `keywords` as list[str] per row.
+
+  Reads the Parquet dataset when available; a legacy CSV (stringified lists)
+  is parsed through parse_keywords_cell.
+  """
+  source = resolve_keyword_source(path)
+  wanted = None if columns is None else list(dict.fromkeys([*columns, "keywords"]))
+  logger.debug(f"Loading keyword dataset from {source}")
+
+  if source.suffix == ".parquet":
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(source, columns=wanted)
+    df = table.drop(["keywords"]).to_pandas()
+    df["keywords"] = table.column("keywords").to_pylist()
+    return df
+
+  logger.info(f"Reading legacy keyword CSV {source} (per-row parsing).")
+  df = pd.read_csv(source, usecols=wanted)
+  df["keywords"] = df["keywords"].apply(parse_keywords_cell)
+  return df
+
+
+def read_row_columns(path: str, columns: Sequence[str]) -> pd.DataFrame:
+  """
+  Read only some scalar columns of the keyword dataset (no keyword parsing).
+  """
+  source = resolve_keyword_source(path)
+  if source.suffix == ".parquet":
+    import pyarrow.parquet as pq
+    return pq.read_table(source, columns=list(columns)).to_pandas()
+  return pd.read_csv(source, usecols=list(columns))
+
+
+def _since_filters(since: Dict[str, str]) -> List[List[tuple]]:
+  # Parquet DNF: (category == c AND date > since[c]) OR ... OR category not in since
+  filters = [[("category", "=", c), ("date", ">", d)] for c, d in since.items()]
+  filters.append([("category", "not in", list(since))])
+  return filters
+
+
+def load_keywords_long(
+  path: str,
+  columns: Sequence[str] = (),
+  since: Optional[Dict[str, str]] = None,
+) -> pd.DataFrame:
+  """
+  Long table with one row per (row_id, keyword), plus the requested row columns.
+
+  From Parquet the list column is flattened in Arrow (no per-row Python);
+  rows without keywords do not appear.
+  since={category: "YYYY-MM-DD"} keeps only rows dated after that day for the
+  listed categories (other categories are loaded in full); from Parquet the
+  filter is pushed down to the reader. row_id then numbers the kept rows.
+  """
+  source = resolve_keyword_source(path)
+  columns = [c for c in columns if c != "keywords"]
+
+  if source.suffix == ".parquet":
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    logger.debug(f"Loading keyword long table from {source}")
+    filters = _since_filters(since) if since else None
+    table = pq.read_table(source, columns=[*columns, "keywords"], filters=filters)
+    lists = table.column("keywords").combine_chunks()
+
+    row_ids = pc.list_parent_indices(lists).to_numpy()
+    long = table.drop(["keywords"]).to_pandas().iloc[row_ids].reset_index(drop=True)
+    long.insert(0, "row_id", row_ids)
+    long["keyword"] = pc.list_flatten(lists).to_pandas()
+    return long
+
+  df = load_keyword_dataset(str(source), list(dict.fromkeys([*columns, "category", "date"])) if since else columns)
+  if since:
+    cutoff = df["category"].map(since)
+    df = df[cutoff.isna() | (df["date"].astype(str) > cutoff.fillna(""))].reset_index(drop=True)
+  long = df[[*columns, "keywords"]].rename(columns={"keywords": "keyword"})
+  long = long.rename_axis("row_id").explode("keyword").dropna(subset=["keyword"]).reset_index()
+  return long
@@ -0,0 +1,81 @@
+import time
+from typing import Dict, Iterable, List
+
+import pandas as pd
+
+from data_processing import (
+  _extract_keywords_chunk,
+  clean_titles,
+  extract_english_tokens,
+  get_komoran,
+  get_stopwords,
+)
+from logger import AppLogger
+
+logger = AppLogger("[KomoranBenchmark]")
+
+TITLES_PATH = "../datasets/total_news_2025.csv"
+
+
+def _items(titles: List[str]) -> List:
+  cleaned = clean_titles(pd.Series(titles, dtype=object))
+  return list(zip(cleaned.tolist(), extract_english_tokens(cleaned).tolist()))
+
+
+def run_komoran_benchmark(
+  titles: List[str],
+  batch_sizes: Iterable[int] = (0, 20, 100, 500),
+  repeat: int = 3,
+) -> Dict[int, Dict]:
+  """
+  Compare titles/sec of per-title (batch_size 0) and batched Komoran analysis.
+
+  Every batched run is checked against the per-title keywords; a mismatch is
+  logged with the first differing title, so a batch size is only trusted when
+  `identical` is True.
+  """
+  items = _items(titles)
+
+  # Warm up: JVM start, stopwords and class loading stay out of the timings
+  get_komoran()
+  get_stopwords()
+  _extract_keywords_chunk(items[:10])
+
+  reference = None
+  results = {}
+
+  for batch_size in batch_sizes:
+    best = None
+    for _ in range(repeat):
+      started = time.perf_counter()
+      keywords = _extract_keywords_chunk(items, batch_size)
+      elapsed = time.perf_counter() - started
+      best = elapsed if best is None else min(best, elapsed)
+
+    if reference is None:
+      reference = keywords if batch_size <= 1 else _extract_keywords_chunk(items)
+
+    mismatches = [i for i, (a, b) in enumerate(zip(reference, keywords)) if a != b]
+    results[batch_size] = {
+      "seconds": best,
+      "titles_per_sec": len(items) / best if best else float("inf"),
+      "identical": not mismatches,
+    }
+
+    logger.info(
+      f"batch_size {batch_size:>4}: {results[batch_size]['titles_per_sec']:9.1f} titles/s "
+      f"({best:.2f}s for {len(items)} titles) | identical to per-title: {not mismatches}"
+    )
+    if mismatches:
+      i = mismatches[0]
+      logger.warning(
+        f"batch_size {batch_size}: {len(mismatches)} titles differ, e.g. '{items[i][0]}': "
+        f"{reference[i]} != {keywords[i]}"
+      )
+
+  return results
+
+
+if __name__ == "__main__":
+  df = pd.read_csv(TITLES_PATH)
+  run_komoran_benchmark(df["title"].dropna().astype(str).tolist())
@@ -1,14 +1,16 @@
 import argparse
-from datetime import date
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
-from browser_client import BrowserClient
-from crawler import collect_weekly_news_total, collect_weekly_news_economy
-from data_processing import preprocess_news_dataset
-from keyword_monthly_agg import build_monthly_keyword_counts
+from checkpoint import CrawlCheckpoint
+from keyword_cache import KEYWORD_CACHE_PATH
 from logger import AppLogger
-from storage import save_news_rows_to_csv
-from analysis_tables import run_all_analysis
-from visualization import run_all_visualizations
+from storage import NewsRowSink
+from utils import generate_fridays, parse_str_to_date
+
+# Step modules (Selenium, Komoran/JVM, matplotlib, ...) are imported inside the
+# run_* functions, so a step only pays for the libraries it actually uses.
 
 # File Path Constants
 TOTAL_NEWS_PATH = "../datasets/total_news_2025.csv"
@@ -16,64 +18,276 @@ ECONOMY_NEWS_PATH = "../datasets/economy_news_2025.csv"
 KEYWORDS_PATH = "../datasets/news_keywords_2025.csv"
 MONTHLY_KEYWORDS_PATH = "../datasets/monthly_news_keywords_2025.csv"
 FONT_PATH = "../fonts/Pretendard-Regular.otf"
+CHECKPOINT_PATH = "../datasets/crawl_checkpoint.json"
+
+CRAWL_TARGETS = {
+  "total": TOTAL_NEWS_PATH,
+  "economy": ECONOMY_NEWS_PATH,
+}
+
+# --http-fixtures replays write here, never over the real datasets / checkpoint
+FIXTURE_REPLAY_DIR = "../datasets/fixture_replay"
+
+# Default crawl range (override with --start / --end)
+DEFAULT_CRAWL_START = date(2025, 1, 1)
+DEFAULT_CRAWL_END = date(2025, 11, 21)
 
 logger = AppLogger("[Main]")
 
-def run_crawler():
+def _crawl_outputs(replay: bool) -> Tuple[Dict[str, str], str]:
   """
-  Execute the crawling process and save the data.
+  ({category: csv_path}, checkpoint_path) of a crawl; fixture replays get their own copies.
   """
-  logger.info("Starting crawling process...")
-  client = BrowserClient()
+  if not replay:
+    return CRAWL_TARGETS, CHECKPOINT_PATH
 
-  total_rows = []
-  economy_rows = []
+  out_dir = Path(FIXTURE_REPLAY_DIR)
+  targets = {category: str(out_dir / Path(path).name) for category, path in CRAWL_TARGETS.items()}
+  return targets, str(out_dir / Path(CHECKPOINT_PATH).name)
 
-  try:
-    client.login()
 
-    start = date(2025, 1, 1)
-    end = date(2025, 11, 21)
+class _WeekFlusher:
+  """
+  on_week callback: stream the week's rows into the category's sink as one
+  batch, then mark the anchor done in the checkpoint.
 
-    # 1. Collect Total News
-    logger.info(f"Collecting [Total] news from {start} to {end}...")
-    total_rows = collect_weekly_news_total(client, start, end)
-    
-    # 2. Collect Economy News
-    logger.info(f"Collecting [Economy] news from {start} to {end}...")
-    economy_rows = collect_weekly_news_economy(client, start, end)
+  - A week whose anchor Friday is today or later may still be filling up on the
+    site: its rows are stored but the anchor stays pending, so the next run
+    (also with --since-last) crawls it again and adds the missing rows.
+  - A finished week without rows is recorded as an empty week (done).
+
+  A category without any completed anchor starts a fresh dataset (the CSV is
+  replaced on the first flush), matching the previous "rewrite at the end" behaviour.
+  """
+
+  def __init__(self, checkpoint: CrawlCheckpoint, category: str, csv_path: str, parquet: bool = False):
+    self.checkpoint = checkpoint
+    self.category = category
+    self.sink = NewsRowSink(csv_path, parquet=parquet, reset=not checkpoint.completed(category))
+
+  def __call__(self, anchor: date, rows: List[Dict]) -> None:
+    written = 0
+    if rows:
+      self.sink.push(rows)
+      # 0 with rows means they were all stored already (e.g. a crash before mark_done)
+      written = self.sink.flush()
 
+    if anchor >= date.today():
+      logger.warning(
+        f"[{self.category}] week {anchor} is not complete yet. Flushed {written} rows, "
+        "leaving it pending in the checkpoint to refill on the next run."
+      )
+      return
+
+    if not rows:
+      logger.warning(f"No [{self.category}] rows for week {anchor}. Recording it as an empty week.")
+      self.checkpoint.mark_done(self.category, anchor, empty=True)
+      return
+
+    self.checkpoint.mark_done(self.category, anchor)
+    logger.info(f"Flushed {written} [{self.category}] rows for week {anchor} -> {self.sink.path}")
+
+  def close(self) -> None:
+    self.sink.close()
+
+
+def _run_http_crawl(plans: Dict, end: date, http_fixtures: Optional[str] = None) -> None:
+  """
+  Crawl the planned weeks with the HTTP backend.
+  The browser is only used to log in and is closed before fetching.
+  """
+  from browser_client import BrowserClient
+  from http_crawler import HttpWeeklyClient, collect_weekly_news_http, resolve_data_url
+
+  if http_fixtures:
+    logger.info(f"Replaying recorded HTTP responses from {http_fixtures}")
+    http_client = HttpWeeklyClient(fixture_dir=http_fixtures)
+  else:
+    # Fail before starting a browser when the data endpoint is not configured
+    resolve_data_url()
+    client = BrowserClient()
+    try:
+      client.login()
+      http_client = HttpWeeklyClient.from_browser(client)
+    finally:
+      client.close()
+
+  try:
+    for category, (cat_start, anchors, flush) in plans.items():
+      if not anchors:
+        continue
+      collect_weekly_news_http(http_client, category, cat_start, end, anchors=anchors, on_week=flush)
   except Exception:
-    logger.exception("An error occurred during the crawling process.")
+    logger.exception("An error occurred during the HTTP crawling process.")
   finally:
-    client.close()
+    http_client.close()
+
 
-  # 3. Save Data
-  if total_rows:
+def run_crawler(
+  start: Optional[date] = None,
+  end: Optional[date] = None,
+  workers: Optional[int] = None,
+  executor: str = "thread",
+  since_last: bool = False,
+  reset_checkpoint: bool = False,
+  backend: str = "selenium",
+  http_fixtures: Optional[str] = None,
+  category_mode: str = "sequential",
+  parquet: bool = False,
+):
+  """
+  Execute the crawling process and save the data.
+
+  Every scraped week is appended to its CSV and recorded in the checkpoint
+  right away, so an interrupted run resumes from the last good anchor.
+
+  - since_last: only crawl the weeks after the last completed anchor (up to today)
+  - reset_checkpoint: forget completed anchors and rebuild the CSVs from scratch
+  - workers > 1: split the anchors across a pool of logged-in browsers (see crawl_engine);
+    with category_mode="parallel" it caps the concurrent drivers instead (default: one per category)
+  - backend="http": log in once, then fetch the weeks over a pooled HTTP session
+    (see http_crawler); http_fixtures replays recorded responses offline into
+    FIXTURE_REPLAY_DIR with its own checkpoint
+  - category_mode: "sequential" (one category after another), "switch" (one search
+    per week, switching the category select in place) or "parallel" (one driver per
+    category sharing one login)
+  - parquet: also write each news dataset as a Parquet directory next to the CSV
+  """
+  from browser_client import BrowserClient
+  from crawler import collect_weekly_news, collect_weekly_news_multi
+  from crawl_engine import crawl_categories_concurrently, crawl_weekly_news
+  from waits import WAIT_STATS
+
+  logger.info("Starting crawling process...")
+
+  replay = backend == "http" and bool(http_fixtures)
+  targets, checkpoint_path = _crawl_outputs(replay)
+  if replay:
+    logger.info(f"Fixture replay: writing datasets and checkpoint under {FIXTURE_REPLAY_DIR}")
+
+  checkpoint = CrawlCheckpoint(checkpoint_path)
+  if reset_checkpoint:
+    checkpoint.reset()
+
+  start = start or DEFAULT_CRAWL_START
+  end = end or (date.today() if since_last else DEFAULT_CRAWL_END)
+
+  # 1. Plan pending anchors per category
+  plans = {}
+  for category, csv_path in targets.items():
+    cat_start = start
+    if since_last:
+      last = checkpoint.last_anchor(category)
+      if last is None:
+        logger.warning(f"No previous [{category}] run in checkpoint. Crawling from {start}.")
+      else:
+        cat_start = max(start, last + timedelta(days=1))
+
+    anchors = checkpoint.pending(category, generate_fridays(cat_start, end))
+    plans[category] = (cat_start, anchors, _WeekFlusher(checkpoint, category, csv_path, parquet))
+    logger.info(f"[{category}] {len(anchors)} pending weeks between {cat_start} and {end}.")
+
+  if not any(anchors for _, anchors, _ in plans.values()):
+    logger.info("Nothing to crawl. All weeks are already in the checkpoint.")
+    for _, _, flush in plans.values():
+      flush.close()
+    return
+
+  # 2. Collect & Flush per Week
+  if backend == "http":
+    _run_http_crawl(plans, end, http_fixtures)
+  elif category_mode == "parallel":
     try:
-      save_news_rows_to_csv(total_rows, TOTAL_NEWS_PATH)
-      logger.info(f"Total news saved: {TOTAL_NEWS_PATH}")
+      crawl_categories_concurrently(end, plans, max_workers=workers)
     except Exception:
-      logger.exception("Failed to save total news CSV.")
-  
-  if economy_rows:
+      logger.exception("An error occurred during the concurrent category crawl.")
+  elif (workers or 1) > 1:
+    for category, (cat_start, anchors, flush) in plans.items():
+      if not anchors:
+        continue
+      try:
+        logger.info(f"Collecting [{category}] news from {cat_start} to {end} with {workers} workers...")
+        crawl_weekly_news(
+          category, cat_start, end,
+          workers=workers, executor=executor, anchors=anchors, on_week=flush,
+        )
+      except Exception:
+        logger.exception(f"An error occurred during the parallel [{category}] crawl.")
+  else:
+    client = BrowserClient()
+
+    try:
+      client.login()
+
+      if category_mode == "switch":
+        collect_weekly_news_multi(
+          client,
+          list(plans),
+          min(cat_start for cat_start, _, _ in plans.values()),
+          end,
+          anchors={c: anchors for c, (_, anchors, _) in plans.items()},
+          on_week={c: flush for c, (_, _, flush) in plans.items()},
+        )
+      else:
+        for category, (cat_start, anchors, flush) in plans.items():
+          logger.info(f"Collecting [{category}] news from {cat_start} to {end}...")
+          collect_weekly_news(client, category, cat_start, end, anchors=anchors, on_week=flush)
+
+    except Exception:
+      logger.exception("An error occurred during the crawling process.")
+    finally:
+      client.close()
+
+  # 3. Close the sinks
+  for category, (_, _, flush) in plans.items():
     try:
-      save_news_rows_to_csv(economy_rows, ECONOMY_NEWS_PATH)
-      logger.info(f"Economy news saved: {ECONOMY_NEWS_PATH}")
+      flush.close()
     except Exception:
-      logger.exception("Failed to save economy news CSV.")
+      logger.exception(f"Failed to flush remaining [{category}] rows.")
+
+  # Time actually spent waiting on the site (process workers keep their own records)
+  WAIT_STATS.log_summary()
 
 
-def run_preprocessing():
+def run_preprocessing(
+  workers: int = 1,
+  chunk_size: int = 500,
+  use_cache: bool = True,
+  batch_size: int = 0,
+  full_monthly_rebuild: bool = False,
+):
   """
   Load saved CSV files and execute preprocessing.
+  Keyword extraction is sharded across `workers` processes when > 1,
+  analyzes `batch_size` titles per Komoran call when > 1 and
+  reuses the keyword cache unless use_cache is False.
+  Monthly counts are updated incrementally unless full_monthly_rebuild is True.
   """
+  from data_processing import keyword_rules_version, preprocess_news_dataset
+  from keyword_matrix import KEYWORD_MATRIX_PATH, build_keyword_matrix
+  from keyword_monthly_agg import build_monthly_keyword_counts
+
   logger.info("Starting data preprocessing process...")
   
   try:
     # The preprocess_news_dataset function handles file loading and error logging internally.
-    preprocess_news_dataset(TOTAL_NEWS_PATH, ECONOMY_NEWS_PATH, KEYWORDS_PATH)
-    build_monthly_keyword_counts(KEYWORDS_PATH, MONTHLY_KEYWORDS_PATH)
+    preprocess_news_dataset(
+      TOTAL_NEWS_PATH,
+      ECONOMY_NEWS_PATH,
+      KEYWORDS_PATH,
+      workers=workers,
+      chunk_size=chunk_size,
+      cache_path=KEYWORD_CACHE_PATH if use_cache else None,
+      batch_size=batch_size,
+    )
+    build_monthly_keyword_counts(
+      KEYWORDS_PATH,
+      MONTHLY_KEYWORDS_PATH,
+      incremental=not full_monthly_rebuild,
+      rules_version=keyword_rules_version(),
+    )
+    # Vocabulary + headlines x keywords CSR matrix shared by the analysis steps
+    build_keyword_matrix(KEYWORDS_PATH, KEYWORD_MATRIX_PATH)
     logger.info(f"Preprocessing completed. Result saved to: {KEYWORDS_PATH}")
   except Exception:
     logger.exception("An error occurred during the preprocessing step.")
@@ -82,6 +296,8 @@ def run_analysis_table() -> None:
   """
   Execute the analysis table generation process.
   """
+  from analysis_tables import run_all_analysis
+
   logger.info("Starting analysis table generation...")
 
   try:
@@ -92,15 +308,19 @@ def run_analysis_table() -> None:
     logger.exception("Failed during analysis table generation.")
     
 
-def run_visualizations() -> None:
+def run_visualizations(workers: Optional[int] = None, use_cache: bool = True) -> None:
   """
   Execute the visualization generation process.
+  Charts render in parallel processes; workers=1 renders them sequentially.
+  Charts whose inputs are unchanged are skipped unless use_cache is False.
   """
+  from visualization import run_all_visualizations
+
   logger.info("Starting visualization process...")
 
   try:
     # Assuming FONT_PATH is defined globally
-    run_all_visualizations(font_path=FONT_PATH)
+    run_all_visualizations(font_path=FONT_PATH, workers=workers, use_cache=use_cache)
     logger.info("Visualization process completed successfully.")
   except Exception:
     logger.exception("Failed during visualization process.")
@@ -117,21 +337,161 @@ def main():
     help="Select step to execute: crawl, process, or all"
   )
 
+  parser.add_argument(
+    "--workers",
+    type=int,
+    default=None,
+    help="Number of parallel browser workers for the crawl step (default: 1; "
+         "with --category-mode parallel, the cap on concurrent drivers, default one per category)"
+  )
+
+  parser.add_argument(
+    "--executor",
+    type=str,
+    choices=["thread", "process"],
+    default="thread",
+    help="Worker pool type for the parallel crawl (default: thread)"
+  )
+
+  parser.add_argument(
+    "--start",
+    type=parse_str_to_date,
+    default=None,
+    help="Crawl start date YYYYMMDD (default: 20250101)"
+  )
+
+  parser.add_argument(
+    "--end",
+    type=parse_str_to_date,
+    default=None,
+    help="Crawl end date YYYYMMDD (default: 20251121, or today with --since-last)"
+  )
+
+  parser.add_argument(
+    "--since-last",
+    action="store_true",
+    help="Only crawl the weeks added since the last completed anchor in the checkpoint"
+  )
+
+  parser.add_argument(
+    "--reset-checkpoint",
+    action="store_true",
+    help="Ignore the crawl checkpoint and rebuild the news CSVs from scratch"
+  )
+
+  parser.add_argument(
+    "--backend",
+    type=str,
+    choices=["selenium", "http"],
+    default="selenium",
+    help="Crawler backend: full browser (selenium) or direct HTTP after login (http)"
+  )
+
+  parser.add_argument(
+    "--http-fixtures",
+    type=str,
+    default=None,
+    help="Directory of recorded responses to replay with --backend http (offline, writes under datasets/fixture_replay)"
+  )
+
+  parser.add_argument(
+    "--category-mode",
+    type=str,
+    choices=["sequential", "switch", "parallel"],
+    default="sequential",
+    help="How to crawl both categories on the selenium backend (default: sequential)"
+  )
+
+  parser.add_argument(
+    "--parquet",
+    action="store_true",
+    help="Also write crawled news as Parquet (requires pyarrow)"
+  )
+
+  parser.add_argument(
+    "--nlp-workers",
+    type=int,
+    default=1,
+    help="Number of processes for Komoran keyword extraction (default: 1)"
+  )
+
+  parser.add_argument(
+    "--nlp-chunk-size",
+    type=int,
+    default=500,
+    help="Titles per keyword extraction task (default: 500)"
+  )
+
+  parser.add_argument(
+    "--komoran-batch-size",
+    type=int,
+    default=0,
+    help="Titles analyzed per Komoran call; 0 analyzes each title separately (default: 0)"
+  )
+
+  parser.add_argument(
+    "--full-monthly-rebuild",
+    action="store_true",
+    help="Recompute monthly keyword counts from all rows instead of only new ones"
+  )
+
+  parser.add_argument(
+    "--viz-workers",
+    type=int,
+    default=None,
+    help="Processes for chart rendering (default: one per chart; 1 = sequential)"
+  )
+
+  parser.add_argument(
+    "--no-render-cache",
+    action="store_true",
+    help="Re-render every chart even if its inputs are unchanged"
+  )
+
+  parser.add_argument(
+    "--no-keyword-cache",
+    action="store_true",
+    help="Re-analyze every title instead of reusing the keyword cache"
+  )
+
   args = parser.parse_args()
 
+  # Crawl strategies are exclusive; don't silently run a different one than asked for
+  if args.category_mode != "sequential" and args.backend == "http":
+    parser.error(f"--category-mode {args.category_mode} needs the selenium backend (got --backend http).")
+  if args.category_mode == "switch" and (args.workers or 1) > 1:
+    parser.error("--category-mode switch crawls on one driver; it cannot be combined with --workers > 1.")
+
   # 1. Crawling Step
   if args.step in ["crawl", "all"]:
-    run_crawler()
+    run_crawler(
+      start=args.start,
+      end=args.end,
+      workers=args.workers,
+      executor=args.executor,
+      since_last=args.since_last,
+      reset_checkpoint=args.reset_checkpoint,
+      backend=args.backend,
+      http_fixtures=args.http_fixtures,
+      category_mode=args.category_mode,
+      parquet=args.parquet,
+    )
 
   # 2. Preprocessing Step
   if args.step in ["process", "all"]:
-    run_preprocessing()
+    run_preprocessing(
+      workers=args.nlp_workers,
+      chunk_size=args.nlp_chunk_size,
+      use_cache=not args.no_keyword_cache,
+      batch_size=args.komoran_batch_size,
+      full_monthly_rebuild=args.full_monthly_rebuild,
+    )
 
   if args.step in ["analysis", "all"]:
     run_analysis_table()
     
   if args.step in ["viz", "all"]:
-    run_visualizations()
+    run_visualizations(workers=args.viz_workers, use_cache=not args.no_render_cache)
     
 if __name__ == "__main__":
   main()
\ No newline at end of file
@@ -0,0 +1,87 @@
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from logger import AppLogger
+
+logger = AppLogger("[RenderCache]")
+
+RENDER_MANIFEST_PATH = "../visualizations/.render_manifest.json"
+
+
+def file_digest(path: str) -> Optional[str]:
+  """
+  sha256 of a file's content (None when the file does not exist).
+  """
+  p = Path(path)
+  if not p.is_file():
+    return None
+
+  h = hashlib.sha256()
+  with p.open("rb") as f:
+    for block in iter(lambda: f.read(1 << 20), b""):
+      h.update(block)
+  return h.hexdigest()
+
+
+class RenderCache:
+  """
+  Manifest of the fingerprint each chart was last rendered with.
+
+  A fingerprint covers the content of the chart's input files, its parameters
+  and its code version; a chart whose output exists and whose fingerprint is
+  unchanged does not need to be rendered again.
+  """
+
+  def __init__(self, manifest_path: str = RENDER_MANIFEST_PATH):
+    self.path = Path(manifest_path)
+    self._lock = threading.Lock()
+    self._entries: Dict[str, Dict[str, Any]] = self._load()
+
+  def _load(self) -> Dict[str, Dict[str, Any]]:
+    if not self.path.exists():
+      return {}
+    try:
+      with self.path.open("r", encoding="utf-8") as f:
+        return json.load(f).get("charts", {})
+    except Exception:
+      logger.exception(f"Failed to read render manifest {self.path}. Rendering everything.")
+      return {}
+
+  @staticmethod
+  def fingerprint(params: Dict[str, Any], input_files: Iterable[str], code_version: str) -> str:
+    payload = {
+      "params": {k: params[k] for k in sorted(params)},
+      "inputs": {str(f): file_digest(str(f)) for f in input_files},
+      "code": code_version,
+    }
+    blob = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+  def is_fresh(self, output_path: str, fingerprint: str) -> bool:
+    """
+    True when the output exists, is the file we rendered, and was rendered with `fingerprint`.
+    """
+    with self._lock:
+      entry = self._entries.get(str(output_path))
+    if entry is None or entry.get("fingerprint") != fingerprint:
+      return False
+    return file_digest(output_path) == entry.get("output_digest")
+
+  def record(self, output_path: str, fingerprint: str) -> None:
+    """
+    Store a chart's fingerprint and persist the manifest (temp file + rename).
+    """
+    with self._lock:
+      self._entries[str(output_path)] = {
+        "fingerprint": fingerprint,
+        "output_digest": file_digest(output_path),
+      }
+      self.path.parent.mkdir(parents=True, exist_ok=True)
+      tmp = self.path.with_name(self.path.name + ".tmp")
+      with tmp.open("w", encoding="utf-8") as f:
+        json.dump({"charts": self._entries}, f, ensure_ascii=False, indent=2)
+      os.replace(tmp, self.path)
@@ -0,0 +1,88 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from logger import AppLogger
+
+logger = AppLogger("[StartupBenchmark]")
+
+# Modules each `main.py --step` imports before doing any work
+STEP_MODULES = {
+  "analysis": ["analysis_tables"],
+  "viz": ["visualization"],
+  "crawl": ["browser_client", "crawler", "crawl_engine"],
+  "process": ["data_processing", "keyword_monthly_agg", "keyword_matrix"],
+}
+
+# Runs in a fresh interpreter: time `import main` + the step modules, and report
+# whether Komoran's JVM was started along the way.
+_PROBE = """
+import importlib, json, sys, time
+t0 = time.perf_counter()
+import main
+t_main = time.perf_counter() - t0
+for name in {modules!r}:
+  importlib.import_module(name)
+t_step = time.perf_counter() - t0
+jpype = sys.modules.get("jpype")
+print(json.dumps({{
+  "main": t_main,
+  "step": t_step,
+  "konlpy": "konlpy" in sys.modules,
+  "jvm": bool(jpype and jpype.isJVMStarted()),
+}}))
+"""
+
+
+def measure_step_startup(step: str, repeat: int = 3) -> dict:
+  """
+  Best-of-`repeat` cold startup time of a pipeline step, in seconds.
+  """
+  src_dir = Path(__file__).resolve().parent
+  code = _PROBE.format(modules=STEP_MODULES[step])
+
+  best = None
+  for _ in range(repeat):
+    out = subprocess.run(
+      [sys.executable, "-c", code],
+      cwd=src_dir,
+      capture_output=True,
+      text=True,
+      check=True,
+    )
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    if best is None or result["step"] < best["step"]:
+      best = result
+
+  return best
+
+
+def run_startup_benchmark(repeat: int = 3) -> dict:
+  """
+  Measure every step and log whether non-NLP steps stay JVM-free and under a second.
+  """
+  results = {}
+
+  for step in STEP_MODULES:
+    r = measure_step_startup(step, repeat)
+    results[step] = r
+    logger.info(
+      f"--step {step:<8} import main {r['main'] * 1000:7.1f} ms | "
+      f"ready {r['step'] * 1000:7.1f} ms | konlpy imported: {r['konlpy']} | JVM started: {r['jvm']}"
+    )
+
+  for step in ("analysis", "viz", "crawl"):
+    r = results[step]
+    if r["jvm"] or r["konlpy"]:
+      logger.warning(f"--step {step} still loads Komoran/konlpy at startup.")
+    elif r["step"] >= 1.0:
+      logger.warning(f"--step {step} takes {r['step']:.2f}s to start (target: < 1s).")
+    else:
+      logger.info(f"--step {step} starts in {r['step']:.2f}s without the JVM.")
+
+  return results
+
+
+if __name__ == "__main__":
+  run_startup_benchmark()
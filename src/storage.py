@@ -1,11 +1,19 @@
 import csv
+import io
+import os
+import shutil
+import sqlite3
+import threading
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable
 
 from logger import AppLogger
 
 logger = AppLogger("[Storage]")
 
+# CSV Column Definition
+NEWS_FIELDNAMES = ["date", "category", "title", "article_count"]
+
 def save_news_rows_to_csv(rows: List[Dict[str, Any]], filepath: str) -> None:
   """
   Save crawled news rows (list[dict]) to a CSV file.
@@ -18,9 +26,7 @@ def save_news_rows_to_csv(rows: List[Dict[str, Any]], filepath: str) -> None:
     return
 
   path = Path(filepath)
-  
-  # CSV Column Definition
-  fieldnames = ["date", "category", "title", "article_count"]
+  fieldnames = NEWS_FIELDNAMES
 
   logger.info(f"Saving process started. Target rows: {len(rows)}, Path: {path}")
 
@@ -32,11 +38,12 @@ def save_news_rows_to_csv(rows: List[Dict[str, Any]], filepath: str) -> None:
     logger.exception(f"Failed to create directory: {path.parent}")
     raise
 
-  # 2. Write CSV File
+  # 2. Write CSV File (temp file + rename, readers never see a half-written file)
+  tmp = path.with_name(path.name + ".tmp")
   try:
     logger.debug("Opening file and writing data.")
     
-    with path.open("w", newline="", encoding="utf-8-sig") as f:
+    with tmp.open("w", newline="", encoding="utf-8-sig") as f:
       writer = csv.DictWriter(f, fieldnames=fieldnames)
       writer.writeheader()
 
@@ -47,10 +54,235 @@ def save_news_rows_to_csv(rows: List[Dict[str, Any]], filepath: str) -> None:
           "title": row.get("title"),
           "article_count": row.get("article_count"),
         })
-        
+
+      f.flush()
+      os.fsync(f.fileno())
+
+    os.replace(tmp, path)
     logger.info("Data writing completed.")
   except Exception:
     logger.exception(f"Failed to write CSV file: {path}")
+    tmp.unlink(missing_ok=True)
     raise
 
-  logger.info(f"CSV saved successfully: {path}")
\ No newline at end of file
+  logger.info(f"CSV saved successfully: {path}")
+
+
+def _row_key(row: Dict[str, Any]) -> tuple:
+  return (str(row.get("date")), str(row.get("category")), str(row.get("title")))
+
+
+class NewsRowSink:
+  """
+  Streaming, append-only writer for crawled news rows.
+
+  - push(): buffer rows, flushed every `batch_size` rows (memory stays constant).
+  - Deduplicates on (date, category, title) with an on-disk SQLite index
+    next to the CSV (`<csv>.index.sqlite`), rebuilt from the CSV if missing.
+  - A new file is created through a temp file + rename; later batches are
+    appended with a single write, and a torn last line left by a crash is
+    trimmed on open. The CSV is never rewritten.
+  - parquet=True: each batch is also written as an atomic part file of the
+    `<csv stem>.parquet/` dataset directory (requires pyarrow).
+  - reset=True: start a new dataset (the old CSV is replaced on the first flush).
+  """
+
+  def __init__(
+    self,
+    filepath: str,
+    batch_size: int = 200,
+    parquet: bool = False,
+    reset: bool = False,
+  ):
+    self.path = Path(filepath)
+    self.index_path = self.path.with_name(self.path.name + ".index.sqlite")
+    self.parquet_dir = self.path.with_suffix(".parquet") if parquet else None
+    self.batch_size = batch_size
+
+    self.written = 0
+    self.skipped = 0
+    self._buffer: List[Dict[str, Any]] = []
+    self._lock = threading.Lock()
+    self._replace_on_flush = reset
+
+    if parquet:
+      try:
+        import pyarrow  # noqa: F401
+      except ImportError:
+        raise ImportError("Parquet output requires `pyarrow` (pip install pyarrow).") from None
+
+    self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    if reset:
+      self.index_path.unlink(missing_ok=True)
+      if self.parquet_dir is not None and self.parquet_dir.exists():
+        shutil.rmtree(self.parquet_dir)
+    else:
+      self._repair_tail()
+
+    self._index = sqlite3.connect(str(self.index_path), check_same_thread=False)
+    self._index.execute(
+      "CREATE TABLE IF NOT EXISTS news_keys ("
+      "date TEXT, category TEXT, title TEXT, PRIMARY KEY (date, category, title)"
+      ") WITHOUT ROWID"
+    )
+    self._index.commit()
+
+    if not reset and self.path.exists():
+      has_keys = self._index.execute("SELECT 1 FROM news_keys LIMIT 1").fetchone()
+      if not has_keys:
+        self._rebuild_index()
+
+  def __enter__(self) -> "NewsRowSink":
+    return self
+
+  def __exit__(self, exc_type, exc, tb) -> None:
+    self.close()
+
+  def _repair_tail(self) -> None:
+    """
+    Drop an incomplete last line (no trailing newline) left by an interrupted append.
+    """
+    if not self.path.exists() or self.path.stat().st_size == 0:
+      return
+
+    with self.path.open("rb+") as f:
+      f.seek(-1, os.SEEK_END)
+      if f.read(1) == b"\n":
+        return
+
+      # Walk back to the last newline
+      end = f.seek(0, os.SEEK_END)
+      pos = end
+      while pos > 0:
+        step = min(65536, pos)
+        pos -= step
+        f.seek(pos)
+        chunk = f.read(step)
+        nl = chunk.rfind(b"\n")
+        if nl != -1:
+          f.truncate(pos + nl + 1)
+          logger.warning(f"Trimmed a torn last line from {self.path}.")
+          return
+
+  def _rebuild_index(self) -> None:
+    logger.info(f"Building dedup index from existing {self.path}")
+
+    with self.path.open("r", newline="", encoding="utf-8-sig") as f:
+      keys = (_row_key(row) for row in csv.DictReader(f))
+      self._index.executemany("INSERT OR IGNORE INTO news_keys VALUES (?, ?, ?)", keys)
+    self._index.commit()
+
+  def push(self, rows: Iterable[Dict[str, Any]]) -> bool:
+    """
+    Buffer rows; returns True when this call flushed a batch to disk.
+    """
+    with self._lock:
+      self._buffer.extend(rows)
+      if len(self._buffer) < self.batch_size:
+        return False
+      self._flush_locked()
+      return True
+
+  def flush(self) -> int:
+    """
+    Write the buffered rows now. Returns the number of new (non-duplicate) rows.
+    """
+    with self._lock:
+      return self._flush_locked()
+
+  def _flush_locked(self) -> int:
+    if not self._buffer:
+      return 0
+
+    rows, self._buffer = self._buffer, []
+
+    try:
+      # Keys are inserted in an open transaction, committed only once the data is on disk
+      new_rows = []
+      for row in rows:
+        cur = self._index.execute("INSERT OR IGNORE INTO news_keys VALUES (?, ?, ?)", _row_key(row))
+        if cur.rowcount:
+          new_rows.append(row)
+
+      if new_rows:
+        self._write_csv(new_rows)
+        if self.parquet_dir is not None:
+          self._write_parquet_part(new_rows)
+
+      self._index.commit()
+    except Exception:
+      self._index.rollback()
+      logger.exception(f"Failed to flush {len(rows)} rows to {self.path}")
+      raise
+
+    self.written += len(new_rows)
+    self.skipped += len(rows) - len(new_rows)
+    logger.debug(f"Flushed {len(new_rows)} rows ({len(rows) - len(new_rows)} duplicates) -> {self.path}")
+    return len(new_rows)
+
+  def _write_csv(self, rows: List[Dict[str, Any]]) -> None:
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=NEWS_FIELDNAMES)
+
+    create = self._replace_on_flush or not self.path.exists() or self.path.stat().st_size == 0
+    if create:
+      writer.writeheader()
+    for row in rows:
+      writer.writerow({key: row.get(key) for key in NEWS_FIELDNAMES})
+
+    if create:
+      tmp = self.path.with_name(self.path.name + ".tmp")
+      with tmp.open("w", newline="", encoding="utf-8-sig") as f:
+        f.write(buf.getvalue())
+        f.flush()
+        os.fsync(f.fileno())
+      os.replace(tmp, self.path)
+      self._replace_on_flush = False
+      return
+
+    data = buf.getvalue().encode("utf-8")
+    fd = os.open(self.path, os.O_WRONLY | os.O_APPEND)
+    try:
+      view = memoryview(data)
+      while view:
+        n = os.write(fd, view)
+        view = view[n:]
+      os.fsync(fd)
+    finally:
+      os.close(fd)
+
+  def _write_parquet_part(self, rows: List[Dict[str, Any]]) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+      ("date", pa.string()),
+      ("category", pa.string()),
+      ("title", pa.string()),
+      ("article_count", pa.int64()),
+    ])
+    table = pa.Table.from_pylist(
+      [{key: row.get(key) for key in NEWS_FIELDNAMES} for row in rows],
+      schema=schema,
+    )
+
+    self.parquet_dir.mkdir(parents=True, exist_ok=True)
+    part_no = len(list(self.parquet_dir.glob("part-*.parquet")))
+    part = self.parquet_dir / f"part-{part_no:06d}.parquet"
+    tmp = self.parquet_dir / f".{part.name}.tmp"
+
+    pq.write_table(table, tmp)
+    os.replace(tmp, part)
+
+  def close(self) -> None:
+    """
+    Flush the remaining rows and close the index.
+    """
+    with self._lock:
+      try:
+        self._flush_locked()
+      finally:
+        self._index.close()
+
+    logger.info(f"Sink closed: {self.written} rows written, {self.skipped} duplicates skipped -> {self.path}")
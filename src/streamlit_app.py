@@ -1,9 +1,7 @@
 ﻿from __future__ import annotations
 
 import os
-from datetime import date
 from pathlib import Path
-from typing import List
 
 import numpy as np
 import pandas as pd
@@ -12,50 +10,44 @@ import streamlit as st
 from dotenv import load_dotenv
 
 from insight_agent import generate_insight
+from surge_engine import SURGE_METHODS, SurgeEngine
+from timeseries_store import TimeseriesIndex, file_fingerprint, load_timeseries_index
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 DEFAULT_TS_PATH = BASE_DIR / "preprocessed" / "top10_monthly_timeseries.csv"
 
+SURGE_METHOD_LABELS = {
+    "pct_change": "변화율 (첫 달 대비)",
+    "slope": "추세 기울기 (월당 증가량)",
+    "cagr": "월평균 복합 성장률",
+}
 
-def load_timeseries(path: Path = DEFAULT_TS_PATH) -> pd.DataFrame:
-    df = pd.read_csv(path)
-    df["date"] = pd.to_datetime(df[["year", "month"]].assign(day=1))
-    return df
-
-
-def compute_surge_keywords(
-    df: pd.DataFrame,
-    start_date: date,
-    end_date: date,
-    top_n: int = 5,
-) -> List[dict]:
-    # 기간 필터링 시 복사본 생성
-    mask = (df["date"] >= pd.Timestamp(start_date)) & (df["date"] <= pd.Timestamp(end_date))
-    period = df[mask].copy()
-    if period.empty:
-        return []
-
-    period = period.sort_values("date")
-    grouped = period.groupby("keyword")
-    
-    # 단순히 first/last를 취하기보다 시작점과 끝점의 존재 여부 확인
-    summary = grouped.agg(
-        first_val=('count', 'first'),
-        last_val=('count', 'last')
-    ).reset_index()
-
-    summary["change"] = summary["last_val"] - summary["first_val"]
-    
-    # 0으로 나누기 방지 및 급등 지수 계산 개선
-    # 시작값이 0인 경우 0.5 정도로 보정하여 변화율 계산 (폭발적 증가 반영)
-    summary["pct_change"] = summary["change"] / (summary["first_val"].replace(0, 0.5))
-    
-    summary = summary.sort_values("pct_change", ascending=False).head(top_n)
-
-    return summary.rename(columns={
-        "first_val": "first", "last_val": "last"
-    }).to_dict(orient="records")
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _cached_timeseries_index(path: str, fingerprint: str) -> TimeseriesIndex:
+    # `fingerprint` only keys the cache: an edited file maps to a new entry
+    return load_timeseries_index(path)
+
+
+def get_timeseries_index(path: Path = DEFAULT_TS_PATH) -> TimeseriesIndex:
+    """
+    Indexed timeseries shared by all sessions; rebuilt only when the file's content changes.
+    """
+    return _cached_timeseries_index(str(path), file_fingerprint(path))
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _cached_surge_engine(path: str, fingerprint: str) -> SurgeEngine:
+    # Built from the cached index, so the CSV is not read again
+    return SurgeEngine.from_frame(_cached_timeseries_index(path, fingerprint).frame.reset_index())
+
+
+def get_surge_engine(path: Path = DEFAULT_TS_PATH) -> SurgeEngine:
+    """
+    Keyword x month surge engine shared by all sessions; rebuilt only when the file's content changes.
+    """
+    return _cached_surge_engine(str(path), file_fingerprint(path))
 
 
 def main() -> None:
@@ -67,19 +59,13 @@ def main() -> None:
         st.error(f"데이터 파일을 찾을 수 없습니다: {DEFAULT_TS_PATH}")
         return
 
-    df = load_timeseries()
-    keywords = (
-        df.groupby("keyword")["count"]
-        .sum()
-        .sort_values(ascending=False)
-        .index
-        .tolist()
-    )
+    ts = get_timeseries_index()
+    keywords = ts.keywords
 
     default_keywords = keywords[:5]
 
-    min_date = df["date"].min().date()
-    max_date = df["date"].max().date()
+    min_date = ts.min_date.date()
+    max_date = ts.max_date.date()
 
     if "selected_range" not in st.session_state:
         st.session_state.selected_range = (min_date, max_date)
@@ -87,6 +73,10 @@ def main() -> None:
         st.session_state.selected_keywords = default_keywords
     if "top_n" not in st.session_state:
         st.session_state.top_n = 5
+    if "surge_method" not in st.session_state:
+        st.session_state.surge_method = "pct_change"
+    if "scan_all" not in st.session_state:
+        st.session_state.scan_all = False
 
     with st.form("analysis_form"):
         st.subheader("분석 조건 입력")
@@ -102,6 +92,13 @@ def main() -> None:
             max_value=max_date,
         )
         top_n = st.slider("급등 키워드 개수", min_value=3, max_value=10, value=st.session_state.top_n)
+        surge_method = st.selectbox(
+            "급등 지표",
+            options=SURGE_METHODS,
+            index=SURGE_METHODS.index(st.session_state.surge_method),
+            format_func=SURGE_METHOD_LABELS.get,
+        )
+        scan_all = st.checkbox("전체 키워드에서 급등 탐색", value=st.session_state.scan_all)
         submitted = st.form_submit_button("적용")
 
     if submitted:
@@ -109,15 +106,16 @@ def main() -> None:
             st.session_state.selected_range = picked
         st.session_state.selected_keywords = selected_keywords
         st.session_state.top_n = top_n
+        st.session_state.surge_method = surge_method
+        st.session_state.scan_all = scan_all
 
     selected_keywords = st.session_state.selected_keywords
     top_n = st.session_state.top_n
+    surge_method = st.session_state.surge_method
+    scan_all = st.session_state.scan_all
     start_date, end_date = st.session_state.selected_range
 
-    if selected_keywords:
-        chart_df = df[df["keyword"].isin(selected_keywords)].copy()
-    else:
-        chart_df = df.head(0).copy()
+    chart_df = ts.select(selected_keywords)
     fig = px.line(
         chart_df,
         x="date",
@@ -129,9 +127,15 @@ def main() -> None:
     fig.update_layout(height=500)
     st.plotly_chart(fig, width="stretch")
 
-    surge_rows = compute_surge_keywords(chart_df, start_date, end_date, top_n=top_n)
+    surge_rows = get_surge_engine().rank(
+        start_date,
+        end_date,
+        top_n=top_n,
+        method=surge_method,
+        keywords=None if scan_all else selected_keywords,
+    ).to_dict(orient="records")
     st.subheader("급등 키워드 요약")
-    if not selected_keywords:
+    if not selected_keywords and not scan_all:
         st.warning("키워드를 최소 1개 이상 선택하세요.")
     elif surge_rows:
         st.dataframe(pd.DataFrame(surge_rows), width="stretch")
@@ -153,6 +157,7 @@ def main() -> None:
                 end_date=end_date,
                 surge_rows=surge_rows,
                 user_prompt=user_prompt,
+                method=surge_method,
             )
 
         st.subheader("요약 결과")
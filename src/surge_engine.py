@@ -0,0 +1,164 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Literal, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from topk import top_k
+
+SurgeMethod = Literal["pct_change", "slope", "cagr"]
+
+SURGE_METHODS = ("pct_change", "slope", "cagr")
+SURGE_COLUMNS = ["keyword", "first", "last", "change", "pct_change", "slope", "cagr"]
+
+# A window starting from 0 is scored against 0.5 (an explosive rise, not a division by zero)
+ZERO_BASE = 0.5
+
+DateLike = Union[date, str, pd.Timestamp]
+
+
+def _prefix(values: np.ndarray) -> np.ndarray:
+  # Row-wise prefix sums with a leading zero column: window sum [a, b] = P[:, b + 1] - P[:, a]
+  out = np.zeros((values.shape[0], values.shape[1] + 1))
+  np.cumsum(values, axis=1, out=out[:, 1:])
+  return out
+
+
+@dataclass
+class SurgeEngine:
+  """
+  Dense keyword x month matrix, built once, that scores any [start, end] window
+  with column gathers only.
+
+  - keywords: (K,) sorted keywords
+  - month_ords: (T,) sorted months as year * 12 + month - 1
+  - counts: (K, T) counts, NaN where a keyword has no row for the month
+
+  Per window: first / last = counts of the first / last month the keyword has
+  data in, change = last - first, pct_change = change / first (0 -> 0.5),
+  slope = least-squares trend per month over the months with data,
+  cagr = compound monthly growth rate from first to last.
+  """
+  keywords: np.ndarray
+  month_ords: np.ndarray
+  counts: np.ndarray
+  _rows: Dict[str, int] = field(init=False, repr=False)
+  _next: np.ndarray = field(init=False, repr=False)
+  _prev: np.ndarray = field(init=False, repr=False)
+  _sums: Dict[str, np.ndarray] = field(init=False, repr=False)
+
+  def __post_init__(self):
+    n_rows, n_months = self.counts.shape
+    present = ~np.isnan(self.counts)
+    cols = np.broadcast_to(np.arange(n_months), (n_rows, n_months))
+
+    # First month with data at or after t (n_months if none) / at or before t (-1 if none)
+    self._next = np.minimum.accumulate(np.where(present, cols, n_months)[:, ::-1], axis=1)[:, ::-1]
+    self._prev = np.maximum.accumulate(np.where(present, cols, -1), axis=1)
+
+    # Prefix sums of n, t, t^2, y, t*y over months with data, for window regressions
+    origin = self.month_ords[0] if len(self.month_ords) else 0
+    t = (self.month_ords - origin).astype(float)
+    y = np.where(present, self.counts, 0.0)
+    self._sums = {
+      "n": _prefix(present.astype(float)),
+      "t": _prefix(present * t),
+      "tt": _prefix(present * t * t),
+      "y": _prefix(y),
+      "ty": _prefix(y * t),
+    }
+    self._rows = {kw: i for i, kw in enumerate(self.keywords.tolist())}
+
+  @classmethod
+  def from_frame(cls, df: pd.DataFrame) -> "SurgeEngine":
+    """
+    Build from (keyword, year, month, count) rows; duplicate cells (e.g. one per category) are summed.
+    """
+    ords = df["year"].to_numpy(dtype=np.int64) * 12 + df["month"].to_numpy(dtype=np.int64) - 1
+    kw_codes, keywords = pd.factorize(df["keyword"], sort=True)
+    month_codes, month_ords = pd.factorize(ords, sort=True)
+
+    counts = np.zeros((len(keywords), len(month_ords)))
+    np.add.at(counts, (kw_codes, month_codes), df["count"].to_numpy(dtype=float))
+    present = np.zeros(counts.shape, dtype=bool)
+    present[kw_codes, month_codes] = True
+    counts[~present] = np.nan
+
+    return cls(keywords=np.asarray(keywords, dtype=object), month_ords=np.asarray(month_ords), counts=counts)
+
+  def window(self, start: DateLike, end: DateLike) -> Optional[Tuple[int, int]]:
+    """
+    Inclusive column range of the months whose first day lies in [start, end] (None if empty).
+    """
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    a = int(np.searchsorted(self.month_ords, start.year * 12 + start.month - 1 + (start.day > 1), "left"))
+    b = int(np.searchsorted(self.month_ords, end.year * 12 + end.month - 1, "right")) - 1
+    return (a, b) if a <= b else None
+
+  def _row_ids(self, keywords: Optional[Sequence[str]]) -> np.ndarray:
+    if keywords is None:
+      return np.arange(len(self.keywords))
+    return np.array(sorted({self._rows[kw] for kw in keywords if kw in self._rows}), dtype=np.int64)
+
+  def scores(
+    self,
+    start: DateLike,
+    end: DateLike,
+    keywords: Optional[Sequence[str]] = None,
+  ) -> pd.DataFrame:
+    """
+    Surge metrics of every keyword (or the given ones) that has data in the window,
+    in keyword order.
+    """
+    span = self.window(start, end)
+    rows = self._row_ids(keywords)
+    if span is None or len(rows) == 0:
+      return pd.DataFrame(columns=SURGE_COLUMNS)
+    a, b = span
+
+    first_col = self._next[rows, a]
+    last_col = self._prev[rows, b]
+    has_data = first_col <= b
+    rows, first_col, last_col = rows[has_data], first_col[has_data], last_col[has_data]
+
+    first = self.counts[rows, first_col]
+    last = self.counts[rows, last_col]
+    change = last - first
+    base = np.where(first == 0, ZERO_BASE, first)
+
+    s = {name: p[rows, b + 1] - p[rows, a] for name, p in self._sums.items()}
+    denom = s["n"] * s["tt"] - s["t"] ** 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+      slope = np.where(denom > 0, (s["n"] * s["ty"] - s["t"] * s["y"]) / denom, 0.0)
+      periods = (self.month_ords[last_col] - self.month_ords[first_col]).astype(float)
+      cagr = np.where(periods > 0, np.power(np.maximum(last, 0) / base, 1 / periods) - 1, 0.0)
+
+    return pd.DataFrame({
+      "keyword": self.keywords[rows],
+      "first": first.astype(np.int64),
+      "last": last.astype(np.int64),
+      "change": change.astype(np.int64),
+      "pct_change": change / base,
+      "slope": slope,
+      "cagr": cagr,
+    })
+
+  def rank(
+    self,
+    start: DateLike,
+    end: DateLike,
+    top_n: int = 5,
+    method: SurgeMethod = "pct_change",
+    keywords: Optional[Sequence[str]] = None,
+  ) -> pd.DataFrame:
+    """
+    The top_n surging keywords of the window by `method` (ties by keyword),
+    over the whole vocabulary or only `keywords`.
+    """
+    if method not in SURGE_METHODS:
+      raise ValueError(f"Unknown surge method: {method}")
+
+    table = self.scores(start, end, keywords).set_index("keyword")
+    picked = top_k(table[method].astype(float), top_n).index
+    return table.loc[picked].reset_index()
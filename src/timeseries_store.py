@@ -0,0 +1,101 @@
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from logger import AppLogger
+from render_cache import file_digest
+
+logger = AppLogger("[TimeseriesStore]")
+
+TIMESERIES_COLUMNS = ["keyword", "year", "month", "count", "date"]
+
+# path -> (mtime_ns, size, sha256): the content hash is only recomputed when the file is touched
+_DIGESTS: Dict[str, Tuple[int, int, str]] = {}
+_DIGESTS_LOCK = threading.Lock()
+
+
+def file_fingerprint(path: Union[str, Path]) -> str:
+  """
+  Content hash of a file, memoized on its (mtime, size).
+  Use as a cache key so that cached loaders are invalidated when the file changes.
+  """
+  key = str(Path(path).resolve())
+  st = os.stat(key)
+
+  with _DIGESTS_LOCK:
+    cached = _DIGESTS.get(key)
+  if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+    return cached[2]
+
+  digest = file_digest(key)
+  with _DIGESTS_LOCK:
+    _DIGESTS[key] = (st.st_mtime_ns, st.st_size, digest)
+  return digest
+
+
+@dataclass
+class TimeseriesIndex:
+  """
+  Monthly keyword counts indexed once for interactive lookups.
+
+  - frame: (keyword, date) sorted MultiIndex -> year, month, count
+  - keywords: keywords by total count, descending
+  """
+  frame: pd.DataFrame
+  keywords: List[str]
+  min_date: pd.Timestamp
+  max_date: pd.Timestamp
+  keyword_set: frozenset = field(init=False, repr=False)
+
+  def __post_init__(self):
+    self.keyword_set = frozenset(self.keywords)
+
+  @classmethod
+  def from_frame(cls, df: pd.DataFrame) -> "TimeseriesIndex":
+    df = df.copy()
+    df["date"] = pd.to_datetime(df[["year", "month"]].assign(day=1))
+    frame = df.set_index(["keyword", "date"]).sort_index()
+    keywords = (
+      df.groupby("keyword")["count"]
+      .sum()
+      .sort_values(ascending=False)
+      .index
+      .tolist()
+    )
+    return cls(
+      frame=frame[["year", "month", "count"]],
+      keywords=keywords,
+      min_date=df["date"].min(),
+      max_date=df["date"].max(),
+    )
+
+  def select(
+    self,
+    keywords: Sequence[str],
+    start: Optional[pd.Timestamp] = None,
+    end: Optional[pd.Timestamp] = None,
+  ) -> pd.DataFrame:
+    """
+    Rows (keyword, year, month, count, date) of the given keywords within [start, end],
+    sorted by keyword then date. Index lookups only; cost grows with the selection.
+    """
+    known = sorted({kw for kw in keywords if kw in self.keyword_set})
+    if not known:
+      return self.frame.iloc[:0].reset_index()[TIMESERIES_COLUMNS]
+
+    start = pd.Timestamp(start) if start is not None else None
+    end = pd.Timestamp(end) if end is not None else None
+    rows = self.frame.loc[(known, slice(start, end)), :]
+    return rows.reset_index()[TIMESERIES_COLUMNS]
+
+
+def load_timeseries_index(path: Union[str, Path]) -> TimeseriesIndex:
+  """
+  Read a (keyword, year, month, count) CSV into a TimeseriesIndex.
+  """
+  logger.info(f"Indexing timeseries {path}")
+  return TimeseriesIndex.from_frame(pd.read_csv(path))
@@ -0,0 +1,46 @@
+from typing import List, Union
+
+import numpy as np
+import pandas as pd
+
+
+def top_k(values: pd.Series, k: int) -> pd.Series:
+  """
+  The k largest entries of `values`, descending; ties are broken by index ascending.
+
+  Candidates are picked with nlargest (partial selection; keep="all" so ties at
+  the cut-off are not dropped arbitrarily) and only those are sorted.
+  """
+  if k <= 0 or values.empty:
+    return values.iloc[:0]
+
+  candidates = values.nlargest(k, keep="all")
+
+  # Rank of each label in ascending index order, as the secondary key
+  label_rank = np.argsort(candidates.index.argsort(), kind="stable")
+  order = np.lexsort((label_rank, -candidates.to_numpy()))
+  return candidates.iloc[order[:k]]
+
+
+def grouped_top_k(values: pd.Series, by: Union[str, List[str]], k: int) -> pd.Series:
+  """
+  Top-k entries within every group of index level(s) `by`, in one grouped pass
+  (e.g. the top 10 keywords of each category and month).
+
+  Result is ordered by group, then descending value; ties are broken by the
+  index ascending, as in top_k.
+  """
+  by = [by] if isinstance(by, str) else list(by)
+  if k <= 0 or values.empty:
+    return values.iloc[:0]
+
+  # On an index-sorted series, "first" ranks break ties by index ascending
+  ordered = values.sort_index()
+  ranks = ordered.groupby(level=by, sort=False).rank(method="first", ascending=False)
+  picked = ordered[(ranks <= k).to_numpy()]
+
+  # Only the k rows per group are sorted into the final order
+  frame = picked.index.to_frame(index=False)[by]
+  frame["_value"] = picked.to_numpy()
+  order = frame.sort_values(by + ["_value"], ascending=[True] * len(by) + [False], kind="stable").index
+  return picked.iloc[order]
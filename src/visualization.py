@@ -1,33 +1,51 @@
+import hashlib
+import importlib.util
+import inspect
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import matplotlib
-matplotlib.use("Agg")  # Set backend before importing pyplot
-import matplotlib.pyplot as plt
+matplotlib.use("Agg")  # Render off-screen; charts never touch pyplot's global state
 import pandas as pd
-from wordcloud import WordCloud
+from matplotlib.figure import Figure
 from matplotlib.ticker import MultipleLocator
-import ast
-import seaborn as sns
-from itertools import combinations
-from collections import Counter
 
+from anomaly_detection import AnomalyMethod, detect_anomalies, monthly_changes
+from keyword_store import resolve_keyword_source
 from logger import AppLogger
+from render_cache import RenderCache
+from wordcloud_layout import WORDCLOUD_LAYOUT_CACHE_DIR, build_wordcloud, frequencies_from_frame
 
 logger = AppLogger("[Visualization]")
 
-# Global Matplotlib Settings
-plt.rc('font', family='NanumGothic')
-plt.rcParams['axes.unicode_minus'] = False
+# Global Matplotlib Settings (applied again in every render process on import)
+matplotlib.rc('font', family='NanumGothic')
+matplotlib.rcParams['axes.unicode_minus'] = False
+
+# Default keywords of the co-occurrence heatmap
+COOCCURRENCE_KEYWORDS = ["현대차", "관세", "LG", "미국", "트럼프", "AI", "SK", "기아", "대통령", "반도체"]
 
 
 def generate_wordcloud(
   input_csv: str = "../preprocessed/wordcloud_top_keywords.csv",
   output_path: str = "../visualizations/wordcloud_total.png",
   font_path: Optional[str] = None,
+  scale: float = 1.5,
+  layout_cache_dir: Optional[str] = WORDCLOUD_LAYOUT_CACHE_DIR,
 ) -> None:
   """
   Generate a WordCloud based on total top keywords.
+  The layout is cached per frequency set; the image is written directly (no matplotlib).
+  Output is (1600 x 900) * scale px, i.e. 2400 x 1350 by default (the former
+  12x7in @ 200dpi figure was 2400 x 1400 including its margins).
+  Placement and colors are seeded, so unchanged inputs render identical images.
   """
   logger.info(f"Generating WordCloud. Input: {input_csv}")
 
@@ -37,30 +55,27 @@ def generate_wordcloud(
     df = pd.read_csv(input_csv)
     
     # Convert to dictionary {keyword: count}
-    freqs = {row["keyword"]: int(row["count"]) for _, row in df.iterrows()}
+    freqs = frequencies_from_frame(df)
     logger.debug(f"Loaded {len(freqs)} keywords for WordCloud.")
 
-    # 2. Generate WordCloud Object
-    wc = WordCloud(
+    # 2. Generate WordCloud Object (layout reused when the frequencies did not change)
+    wc = build_wordcloud(
+      freqs,
+      cache_dir=layout_cache_dir,
       width=1600,
       height=900,
+      scale=scale,
       background_color="white",
       font_path=font_path,
-    ).generate_from_frequencies(freqs)
+    )
 
-    # 3. Plot & Save
+    # 3. Save
     path_obj = Path(output_path)
     logger.debug(f"Saving WordCloud image to {path_obj}")
     
     path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-    plt.figure(figsize=(12, 7))
-    plt.imshow(wc, interpolation="bilinear")
-    plt.axis("off")
-    plt.tight_layout()
-
-    plt.savefig(output_path, dpi=200)
-    plt.close()
+    wc.to_file(output_path)
     
     logger.info(f"Saved WordCloud -> {output_path}")
 
@@ -88,36 +103,35 @@ def generate_lineplot(
     # 2. Plotting
     logger.debug("Plotting time series data.")
     
-    plt.figure(figsize=(12, 7))
-    plt.grid(True)
+    fig = Figure(figsize=(12, 7))
+    ax = fig.subplots()
+    ax.grid(True)
 
     unique_keywords = df["keyword"].unique()
     for keyword in unique_keywords:
       sub = df[df["keyword"] == keyword].copy()
       sub = sub.sort_values(["year", "month"])
-      plt.plot(
+      ax.plot(
         sub["year_month"],
         sub["count"],
         marker="o",
         label=keyword
       )
       
-    ax = plt.gca()
     ax.yaxis.set_major_locator(MultipleLocator(500))
 
-    plt.xticks(rotation=45)
-    plt.xlabel("Year-Month")
-    plt.ylabel("Weighted Frequency (article_count sum)")
-    plt.title("Top 10 Keywords — Monthly Trend")
-    plt.legend(loc="upper left", bbox_to_anchor=(1.02, 1.0))
-    plt.tight_layout()
+    ax.tick_params(axis="x", labelrotation=45)
+    ax.set_xlabel("Year-Month")
+    ax.set_ylabel("Weighted Frequency (article_count sum)")
+    ax.set_title("Top 10 Keywords — Monthly Trend")
+    ax.legend(loc="upper left", bbox_to_anchor=(1.02, 1.0))
+    fig.tight_layout()
 
     # 3. Save
     path_obj = Path(output_path)
     path_obj.parent.mkdir(parents=True, exist_ok=True)
     
-    plt.savefig(output_path, dpi=200)
-    plt.close()
+    fig.savefig(output_path, dpi=200)
 
     logger.info(f"Saved Line Plot -> {output_path}")
 
@@ -146,18 +160,18 @@ def generate_barchart(
     # 2. Plotting
     logger.debug("Plotting bar chart.")
     
-    plt.figure(figsize=(10, 6))
-    plt.barh(df["keyword"], df["count"])
-    plt.xlabel("Weighted Frequency (article_count sum)")
-    plt.title("Economy — Top 10 Keywords")
-    plt.tight_layout()
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    ax.barh(df["keyword"], df["count"])
+    ax.set_xlabel("Weighted Frequency (article_count sum)")
+    ax.set_title("Economy — Top 10 Keywords")
+    fig.tight_layout()
 
     # 3. Save
     path_obj = Path(output_path)
     path_obj.parent.mkdir(parents=True, exist_ok=True)
     
-    plt.savefig(output_path, dpi=200)
-    plt.close()
+    fig.savefig(output_path, dpi=200)
 
     logger.info(f"Saved Bar Chart -> {output_path}")
 
@@ -169,40 +183,37 @@ def generate_barchart(
 def generate_enhanced_lineplot(
   input_csv: str = "../preprocessed/top10_monthly_timeseries.csv",
   output_path: str = "../visualizations/enhanced_lineplot_top10_trend.png",
-  anomaly_threshold: float = 0.25
+  anomaly_threshold: float = 0.25,
+  anomaly_method: AnomalyMethod = "pct_change",
+  anomaly_window: int = 3
 ) -> None:
   """
   Generate a line plot with automatic Anomaly Detection and Event Annotation.
+  Anomalies come from detect_anomalies (one grouped pass over all keywords).
   (Indentation: 2 spaces)
   """
   logger.info(f"Generating Enhanced Line Plot. Input: {input_csv}")
 
   try:
-    # 1. 데이터 로드 및 시계열 전처리
+    # 1. 데이터 로드 및 시계열 전처리 / 이상치 탐지 (전체 키워드 일괄 계산)
     logger.debug(f"Loading timeseries data from {input_csv}")
-    df = pd.read_csv(input_csv)
-    
-    # datetime 변환을 통한 정확한 시계열 정렬
-    df["date"] = pd.to_datetime(df[['year', 'month']].assign(day=1))
-    df = df.sort_values(["keyword", "date"])
-    df["year_month"] = df["date"].dt.strftime("%Y-%m")
+    raw = pd.read_csv(input_csv)
+    df = monthly_changes(raw)
+    anomalies = detect_anomalies(raw, method=anomaly_method, threshold=anomaly_threshold, window=anomaly_window)
+    logger.debug(f"Detected {len(anomalies)} anomalies ({anomaly_method}, threshold={anomaly_threshold})")
 
     # 2. 그래프 설정
     logger.debug("Plotting time series with anomaly detection.")
-    plt.figure(figsize=(14, 8))
-    plt.grid(True, linestyle="--", alpha=0.5)
+    fig = Figure(figsize=(14, 8))
+    ax = fig.subplots()
+    ax.grid(True, linestyle="--", alpha=0.5)
     
     unique_keywords = df["keyword"].unique()
-    colors = plt.cm.get_cmap('tab10', len(unique_keywords))
+    colors = matplotlib.colormaps['tab10'].resampled(len(unique_keywords))
+    line_colors = {}
 
-    for idx, keyword in enumerate(unique_keywords):
-      sub = df[df["keyword"] == keyword].copy()
-      
-      # 이상치 탐지: 전월 대비 변화율 계산
-      sub["prev_count"] = sub["count"].shift(1)
-      sub["pct_change"] = (sub["count"] - sub["prev_count"]) / sub["prev_count"]
-      
-      line, = plt.plot(
+    for idx, (keyword, sub) in enumerate(df.groupby("keyword", sort=False)):
+      line, = ax.plot(
         sub["year_month"],
         sub["count"],
         marker="o",
@@ -212,41 +223,47 @@ def generate_enhanced_lineplot(
         linewidth=2,
         alpha=0.8
       )
-
-      # 이상치 주석(Annotation) 추가
-      anomalies = sub[sub["pct_change"] > anomaly_threshold]
-      for _, row in anomalies.iterrows():
-        # 'headline' 컬럼이 있으면 출력, 없으면 기본 메시지 출력
-        label = row.get('headline', f"급증: {row['keyword']}")
-        
-        plt.annotate(
-          label,
-          xy=(row["year_month"], row["count"]),
-          xytext=(5, 15),
-          textcoords='offset points',
-          fontsize=8,
-          fontweight='bold',
-          arrowprops=dict(arrowstyle='->', color=line.get_color(), lw=1),
-          bbox=dict(boxstyle='round,pad=0.3', fc='white', ec=line.get_color(), alpha=0.8)
-        )
+      line_colors[keyword] = line.get_color()
+
+    # 이상치 주석(Annotation): 미리 계산된 이상치만 순회
+    # 'headline' 컬럼이 있으면 출력, 없으면 기본 메시지 출력
+    if "headline" in anomalies.columns:
+      labels = anomalies["headline"].tolist()
+    else:
+      labels = [f"급증: {kw}" for kw in anomalies["keyword"]]
+
+    for label, keyword, year_month, count in zip(
+      labels, anomalies["keyword"], anomalies["year_month"], anomalies["count"]
+    ):
+      color = line_colors[keyword]
+      ax.annotate(
+        label,
+        xy=(year_month, count),
+        xytext=(5, 15),
+        textcoords='offset points',
+        fontsize=8,
+        fontweight='bold',
+        arrowprops=dict(arrowstyle='->', color=color, lw=1),
+        bbox=dict(boxstyle='round,pad=0.3', fc='white', ec=color, alpha=0.8)
+      )
 
     # 3. 레이아웃 및 스타일링
-    ax = plt.gca()
     ax.yaxis.set_major_locator(MultipleLocator(500))
     
-    plt.xticks(rotation=45, ha='right')
-    plt.xlabel("Year-Month", fontsize=11)
-    plt.ylabel("Weighted Frequency", fontsize=11)
-    plt.title("Top 10 Keywords — Monthly Trend (Anomaly Annotated)", fontsize=15, pad=20)
-    plt.legend(loc="upper left", bbox_to_anchor=(1.02, 1.0), title="Keywords")
-    plt.tight_layout()
+    ax.tick_params(axis="x", labelrotation=45)
+    for tick_label in ax.get_xticklabels():
+      tick_label.set_horizontalalignment('right')
+    ax.set_xlabel("Year-Month", fontsize=11)
+    ax.set_ylabel("Weighted Frequency", fontsize=11)
+    ax.set_title("Top 10 Keywords — Monthly Trend (Anomaly Annotated)", fontsize=15, pad=20)
+    ax.legend(loc="upper left", bbox_to_anchor=(1.02, 1.0), title="Keywords")
+    fig.tight_layout()
 
     # 4. 저장
     path_obj = Path(output_path)
     path_obj.parent.mkdir(parents=True, exist_ok=True)
     
-    plt.savefig(output_path, dpi=250, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_path, dpi=250, bbox_inches='tight')
 
     logger.info(f"Saved Enhanced Line Plot -> {output_path}")
 
@@ -257,74 +274,71 @@ def generate_enhanced_lineplot(
 
 def generate_cooccurrence_heatmap(
   input_csv: str = "../datasets/news_keywords_2025.csv",
-  output_path: str = "../visualizations/heatmap_keyword_cooccurrence.png"
+  output_path: str = "../visualizations/heatmap_keyword_cooccurrence.png",
+  keywords: Optional[List[str]] = None,
+  top_k: Optional[int] = None,
+  weighted: bool = False,
+  year: Optional[int] = None,
+  month: Optional[int] = None,
+  matrix_path: str = "../datasets/news_keywords_2025.matrix.npz",
 ) -> None:
   """
   TOP 10 경제 키워드가 한 기사에 동시에 등장하는 빈도를 분석하여 히트맵을 생성합니다.
+  - keywords 대신 top_k를 주면 등장 빈도 상위 K개 키워드로 히트맵을 그립니다.
+  - weighted=True: article_count 가중, year/month: 해당 월만 집계
   """
   logger.info(f"Generating Co-occurrence Heatmap. Input: {input_csv}")
 
+  # seaborn pulls in scipy.stats (~0.8s); only this chart needs it
+  import seaborn as sns
+
+  from cooccurrence import build_cooccurrence
+  from keyword_matrix import load_keyword_matrix
+
   try:
-    # 1. 데이터 로드
-    df = pd.read_csv(input_csv)
-    
-    # 2. 분석 대상 TOP 10 키워드 설정
-    target_keywords = ["현대차", "관세", "LG", "미국", "트럼프", "AI", "SK", "기아", "대통령", "반도체"]
+    # 1. 데이터 로드 (헤드라인 x 키워드 희소 행렬)
+    km = load_keyword_matrix(matrix_path, input_csv)
     
-    # 3. 동시 출현 빈도 계산
-    # 각 행의 'keywords' 컬럼(문자열)을 실제 리스트로 변환 후 조합 추출
-    pair_counts = Counter()
+    # 2. 분석 대상 키워드 설정 (기본: TOP 10 경제 키워드)
+    if keywords is None and top_k is None:
+      keywords = COOCCURRENCE_KEYWORDS
     
-    logger.debug("Calculating keyword pairs from articles.")
-    for raw_keywords in df['keywords']:
-      try:
-        # 문자열 형태의 리스트 "['a', 'b']"를 실제 리스트 ['a', 'b']로 변환
-        kw_list = ast.literal_eval(raw_keywords)
-        
-        # 기사 내 키워드 중 target_keywords에 포함된 것만 필터링 (중복 제거)
-        found = sorted(list(set([k for k in kw_list if k in target_keywords])))
-        
-        # 한 기사에 2개 이상의 타겟 키워드가 등장한 경우만 조합 생성
-        if len(found) >= 2:
-          for pair in combinations(found, 2):
-            pair_counts[pair] += 1
-        elif len(found) == 1:
-          # 자기 자신과의 관계(대각선)를 위해 카운트 (선택 사항)
-          pair_counts[(found[0], found[0])] += 1
-          
-      except (ValueError, SyntaxError):
-        continue
+    # 3. 동시 출현 빈도 계산 (B.T @ B 한 번)
+    logger.debug("Calculating keyword co-occurrence matrix.")
+    cooc = build_cooccurrence(km, weighted=weighted, year=year, month=month)
 
     # 4. 행렬(Matrix) 데이터프레임 생성
-    matrix = pd.DataFrame(0, index=target_keywords, columns=target_keywords)
-    for (k1, k2), count in pair_counts.items():
-      matrix.loc[k1, k2] = count
-      matrix.loc[k2, k1] = count # 대칭 행렬 설정
+    # 대각선: 선택된 키워드 중 해당 키워드만 등장한 기사 수 (기존 규칙 유지)
+    matrix = cooc.submatrix(keywords, k=top_k or 10, solo_diagonal=True)
+    n = len(matrix)
 
     # 5. 시각화
-    plt.figure(figsize=(14, 11))
+    # 키워드가 많으면 그림을 키우고 숫자 표기는 생략
+    size = max(14, n * 0.35)
+    fig = Figure(figsize=(size, size * 11 / 14))
+    ax = fig.subplots()
     
     # 가독성을 위해 데이터가 없는 부분은 0으로 표시하고, 
     # 상관관계가 높은 부분을 강조하기 위해 'YlGnBu' 또는 'magma' 컬러맵 사용
     sns.heatmap(
       matrix, 
-      annot=True, 
+      annot=n <= 30, 
       fmt="d", 
       cmap="YlGnBu", 
       linewidths=0.5,
-      cbar_kws={'label': 'Co-occurrence Count (Shared Articles)'}
+      cbar_kws={'label': 'Co-occurrence Count (Shared Articles)'},
+      ax=ax,
     )
     
-    plt.title("Economic Trends: Keyword Co-occurrence Heatmap", fontsize=18, pad=25)
-    plt.xlabel("Keywords", fontsize=12)
-    plt.ylabel("Keywords", fontsize=12)
-    plt.tight_layout()
+    ax.set_title("Economic Trends: Keyword Co-occurrence Heatmap", fontsize=18, pad=25)
+    ax.set_xlabel("Keywords", fontsize=12)
+    ax.set_ylabel("Keywords", fontsize=12)
+    fig.tight_layout()
 
     # 6. 저장
     path_obj = Path(output_path)
     path_obj.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, dpi=200)
-    plt.close()
+    fig.savefig(output_path, dpi=200)
 
     logger.info(f"Saved Co-occurrence Heatmap -> {output_path}")
 
@@ -333,48 +347,208 @@ def generate_cooccurrence_heatmap(
     raise
 
 
+# Chart name -> renderer; jobs refer to renderers by name so they pickle into worker processes
+CHART_RENDERERS = {
+  "wordcloud": generate_wordcloud,
+  "lineplot": generate_lineplot,
+  "barchart": generate_barchart,
+  "enhanced_lineplot": generate_enhanced_lineplot,
+  "cooccurrence_heatmap": generate_cooccurrence_heatmap,
+}
+
+# Modules whose logic shapes a chart; their whole source (helpers and constants)
+# is part of its code version. Named, not imported, so scipy stays lazy.
+CHART_CODE_DEPENDENCIES = {
+  "wordcloud": ["wordcloud_layout"],
+  "enhanced_lineplot": ["anomaly_detection"],
+  "cooccurrence_heatmap": ["cooccurrence", "keyword_matrix", "keyword_store"],
+}
+
+ChartJob = Tuple[str, Dict[str, Any]]
+
+# Bump to re-render every chart (e.g. after changing the global matplotlib settings)
+RENDER_CODE_VERSION = 1
+
+
+@lru_cache(maxsize=None)
+def _module_source(module: str) -> str:
+  return Path(importlib.util.find_spec(module).origin).read_text(encoding="utf-8")
+
+
+def _renderer_constants(func) -> Dict[str, Any]:
+  # Module-level values a renderer reads (e.g. COOCCURRENCE_KEYWORDS); functions, modules and loggers excluded
+  referenced = inspect.getclosurevars(func).globals
+  return {k: v for k, v in referenced.items() if isinstance(v, (str, int, float, bool, list, tuple, dict))}
+
+
+def _chart_code_version(name: str) -> str:
+  # A renderer's source (incl. its default dpi / size / threshold), the constants it
+  # reads and the source of its helper modules are its code version
+  renderer = CHART_RENDERERS[name]
+  source = inspect.getsource(renderer)
+  source += json.dumps(_renderer_constants(renderer), sort_keys=True, ensure_ascii=False, default=str)
+  source += "".join(_module_source(m) for m in CHART_CODE_DEPENDENCIES.get(name, []))
+  return f"v{RENDER_CODE_VERSION}-{hashlib.sha256(source.encode('utf-8')).hexdigest()[:16]}"
+
+
+def _chart_input_files(name: str, kwargs: Dict[str, Any]) -> List[str]:
+  """
+  Files whose content a chart depends on.
+  """
+  files = []
+  if kwargs.get("input_csv"):
+    files.append(kwargs["input_csv"])
+    if name == "cooccurrence_heatmap":
+      # Reads the Parquet twin when it is the fresher source, and the matrix built from it
+      # (a rebuilt matrix re-renders the chart once more on the next run)
+      files.append(str(resolve_keyword_source(kwargs["input_csv"])))
+      matrix_path = inspect.signature(generate_cooccurrence_heatmap).parameters["matrix_path"].default
+      files.append(kwargs.get("matrix_path", matrix_path))
+  if kwargs.get("font_path"):
+    files.append(kwargs["font_path"])
+  return files
+
+
+def _job_fingerprint(name: str, kwargs: Dict[str, Any]) -> str:
+  return RenderCache.fingerprint(kwargs, _chart_input_files(name, kwargs), _chart_code_version(name))
+
+
+def _render_chart(name: str, kwargs: Dict[str, Any]) -> float:
+  """
+  Render one chart and return its wall time in seconds.
+  """
+  started = time.perf_counter()
+  CHART_RENDERERS[name](**kwargs)
+  return time.perf_counter() - started
+
+
+def _render_context():
+  # fork on Linux: workers inherit the already imported matplotlib/pandas/wordcloud
+  # (no per-chart import cost). Charts hold no threads or global pyplot state, so
+  # forking is safe there. Elsewhere (macOS system frameworks, Windows) use spawn.
+  use_fork = sys.platform.startswith("linux") and "fork" in multiprocessing.get_all_start_methods()
+  method = "fork" if use_fork else "spawn"
+  return multiprocessing.get_context(method)
+
+
+def render_charts(
+  jobs: List[ChartJob],
+  workers: Optional[int] = None,
+  cache: Optional[RenderCache] = None,
+) -> Dict[str, float]:
+  """
+  Render charts, each in its own process (Agg, Figure API), and log per-chart timings.
+
+  - workers: process count (default: one per chart, capped at the CPU count);
+    workers <= 1 renders sequentially in this process.
+  - cache: skip charts whose inputs, parameters and code are unchanged since
+    their output was rendered, and record the fingerprint of every new render.
+  - Every chart is attempted; failures are logged and re-raised at the end.
+  """
+  fingerprints: Dict[str, str] = {}
+  if cache is not None:
+    pending = []
+    for name, kwargs in jobs:
+      fingerprints[name] = _job_fingerprint(name, kwargs)
+      if cache.is_fresh(kwargs["output_path"], fingerprints[name]):
+        logger.info(f"Chart '{name}' is up to date. Skipping.")
+      else:
+        pending.append((name, kwargs))
+    jobs = pending
+
+  if not jobs:
+    logger.info("All charts are up to date.")
+    return {}
+
+  if workers is None:
+    workers = min(len(jobs), os.cpu_count() or 1)
+
+  started = time.perf_counter()
+  timings: Dict[str, float] = {}
+  failed: List[str] = []
+  outputs = {name: kwargs["output_path"] for name, kwargs in jobs}
+
+  if workers <= 1 or len(jobs) <= 1:
+    for name, kwargs in jobs:
+      try:
+        timings[name] = _render_chart(name, kwargs)
+        logger.info(f"Chart '{name}' rendered in {timings[name]:.2f}s.")
+      except Exception:
+        logger.exception(f"Chart '{name}' failed.")
+        failed.append(name)
+  else:
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_render_context()) as pool:
+      futures = {pool.submit(_render_chart, name, kwargs): name for name, kwargs in jobs}
+      for future in as_completed(futures):
+        name = futures[future]
+        try:
+          timings[name] = future.result()
+          logger.info(f"Chart '{name}' rendered in {timings[name]:.2f}s.")
+        except Exception:
+          logger.exception(f"Chart '{name}' failed.")
+          failed.append(name)
+
+  if cache is not None:
+    for name in timings:
+      cache.record(outputs[name], fingerprints[name])
+
+  elapsed = time.perf_counter() - started
+  slowest = max(timings.values(), default=0.0)
+  logger.info(
+    f"Rendered {len(timings)}/{len(jobs)} charts in {elapsed:.2f}s with {max(workers, 1)} worker(s) "
+    f"(sum of chart times {sum(timings.values()):.2f}s, slowest {slowest:.2f}s)."
+  )
+
+  if failed:
+    raise RuntimeError(f"Failed to render charts: {', '.join(failed)}")
+  return timings
+
+
 def run_all_visualizations(
   wordcloud_csv: str = "../preprocessed/wordcloud_top_keywords.csv",
   timeseries_csv: str = "../preprocessed/top10_monthly_timeseries.csv",
   economy_csv: str = "../preprocessed/economy_top10_keywords.csv",
   raw_keywords_csv: str = "../datasets/news_keywords_2025.csv",
   font_path: Optional[str] = None,
+  workers: Optional[int] = None,
+  use_cache: bool = True,
 ) -> None:
   """
-  Execute all visualization tasks sequentially.
+  Execute all visualization tasks, each chart in its own process
+  (see render_charts; workers=1 renders them sequentially).
+  Unchanged charts are skipped via the render manifest unless use_cache is False.
   """
   logger.info("Starting all visualization tasks.")
 
-  try:
-    generate_wordcloud(
-      input_csv=wordcloud_csv,
-      output_path="../visualizations/wordcloud_total.png",
-      font_path=font_path,
-    )
-
-    generate_lineplot(
-      input_csv=timeseries_csv,
-      output_path="../visualizations/lineplot_top10_trend.png",
-    )
-
-    generate_barchart(
-      input_csv=economy_csv,
-      output_path="../visualizations/barchart_economy_top10.png",
-    )
-
-    generate_enhanced_lineplot(
-      input_csv=timeseries_csv,
-      output_path="../visualizations/enhanced_lineplot_top10_trend.png"
-    )
+  jobs: List[ChartJob] = [
+    ("wordcloud", {
+      "input_csv": wordcloud_csv,
+      "output_path": "../visualizations/wordcloud_total.png",
+      "font_path": font_path,
+    }),
+    ("lineplot", {
+      "input_csv": timeseries_csv,
+      "output_path": "../visualizations/lineplot_top10_trend.png",
+    }),
+    ("barchart", {
+      "input_csv": economy_csv,
+      "output_path": "../visualizations/barchart_economy_top10.png",
+    }),
+    ("enhanced_lineplot", {
+      "input_csv": timeseries_csv,
+      "output_path": "../visualizations/enhanced_lineplot_top10_trend.png",
+    }),
+    ("cooccurrence_heatmap", {
+      "input_csv": raw_keywords_csv,
+      "output_path": "../visualizations/heatmap_cooccurrence.png",
+    }),
+  ]
 
-    generate_cooccurrence_heatmap(
-      input_csv=raw_keywords_csv,
-      output_path="../visualizations/heatmap_cooccurrence.png"
-    )
-    
+  try:
+    render_charts(jobs, workers=workers, cache=RenderCache() if use_cache else None)
     logger.info("All visualization tasks completed successfully.")
     
   except Exception:
     logger.exception("An error occurred during the visualization pipeline.")
     # Depending on requirements, we might want to raise here or let it finish partially.
-    raise
\ No newline at end of file
+    raise
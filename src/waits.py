@@ -0,0 +1,164 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from logger import AppLogger
+
+logger = AppLogger("[Waits]")
+
+# Snapshot of the weekly result block: rendered day dates + number of topic rows.
+_RESULT_SIGNATURE_JS = """
+const root = document.querySelector('div#weekend-news-result');
+if (!root) { return null; }
+const items = root.querySelectorAll('ul.weekendNews-lst div.item');
+return {
+  dates: Array.from(items, el => el.getAttribute('data-date') || ''),
+  rows: root.querySelectorAll('ul.weekendNews-lst div.item div.cont > ul > li').length,
+  text: root.innerText,
+};
+"""
+
+
+@dataclass
+class WaitConfig:
+  """
+  Timeouts (seconds) used by the condition-based waits.
+  """
+  page_load_timeout: float = 10.0
+  element_timeout: float = 10.0
+  search_timeout: float = 15.0
+  login_timeout: float = 10.0
+  settle_timeout: float = 2.0
+  poll_interval: float = 0.1
+
+
+class WaitRecorder:
+  """
+  Thread-safe record of how long each labelled wait actually took.
+  """
+
+  def __init__(self):
+    self._lock = threading.Lock()
+    self._records: Dict[str, List[float]] = {}
+    self._timeouts: Dict[str, int] = {}
+
+  def record(self, label: str, elapsed: float, timed_out: bool = False) -> None:
+    with self._lock:
+      self._records.setdefault(label, []).append(elapsed)
+      if timed_out:
+        self._timeouts[label] = self._timeouts.get(label, 0) + 1
+
+  def summary(self) -> Dict[str, Dict[str, float]]:
+    """
+    Return {label: {count, total, mean, max, timeouts}}.
+    """
+    with self._lock:
+      return {
+        label: {
+          "count": len(values),
+          "total": sum(values),
+          "mean": sum(values) / len(values),
+          "max": max(values),
+          "timeouts": self._timeouts.get(label, 0),
+        }
+        for label, values in self._records.items()
+      }
+
+  def total(self) -> float:
+    with self._lock:
+      return sum(sum(values) for values in self._records.values())
+
+  def reset(self) -> None:
+    with self._lock:
+      self._records.clear()
+      self._timeouts.clear()
+
+  def log_summary(self) -> None:
+    for label, s in sorted(self.summary().items()):
+      logger.info(
+        f"{label}: {s['count']} waits, total {s['total']:.2f}s, "
+        f"mean {s['mean']:.2f}s, max {s['max']:.2f}s, timeouts {s['timeouts']}"
+      )
+
+
+WAIT_CONFIG = WaitConfig()
+WAIT_STATS = WaitRecorder()
+
+
+def wait_until(
+  driver,
+  condition: Callable[[Any], Any],
+  label: str,
+  timeout: Optional[float] = None,
+  required: bool = True,
+) -> Any:
+  """
+  Poll `condition(driver)` until it returns a truthy value and record the elapsed time.
+
+  - required=True: re-raise TimeoutException when the timeout expires
+  - required=False: return None on timeout (used for "settle" waits)
+  """
+  timeout = WAIT_CONFIG.element_timeout if timeout is None else timeout
+  started = time.perf_counter()
+
+  try:
+    result = WebDriverWait(driver, timeout, poll_frequency=WAIT_CONFIG.poll_interval).until(condition)
+  except TimeoutException:
+    elapsed = time.perf_counter() - started
+    WAIT_STATS.record(label, elapsed, timed_out=True)
+    logger.debug(f"Wait '{label}' timed out after {elapsed:.2f}s.")
+    if required:
+      raise
+    return None
+
+  elapsed = time.perf_counter() - started
+  WAIT_STATS.record(label, elapsed)
+  logger.debug(f"Wait '{label}' satisfied in {elapsed:.2f}s.")
+  return result
+
+
+def result_signature(driver) -> Optional[Dict[str, Any]]:
+  """
+  Read the current state of `div#weekend-news-result` in a single script call.
+  """
+  try:
+    return driver.execute_script(_RESULT_SIGNATURE_JS)
+  except Exception:
+    return None
+
+
+def wait_for_result_change(
+  driver,
+  previous: Optional[Dict[str, Any]],
+  expected_date: Optional[str] = None,
+  timeout: Optional[float] = None,
+  required: bool = True,
+  require_change: bool = False,
+) -> Optional[Dict[str, Any]]:
+  """
+  Wait until the weekly result block is rendered and differs from `previous`
+  (or already contains `expected_date` in its `data-date` attributes).
+
+  require_change=True: the block must differ from `previous` AND show
+  `expected_date`; a block that already showed the date (e.g. the same week of
+  another category) does not count.
+  """
+  timeout = WAIT_CONFIG.search_timeout if timeout is None else timeout
+
+  def _changed(d):
+    current = result_signature(d)
+    if not current or not current.get("dates"):
+      return False
+    if require_change:
+      if current == previous or (expected_date and expected_date not in current["dates"]):
+        return False
+      return current
+    if expected_date and expected_date in current["dates"]:
+      return current
+    return current if current != previous else False
+
+  return wait_until(driver, _changed, "result_change", timeout=timeout, required=required)
@@ -0,0 +1,85 @@
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import matplotlib
+matplotlib.use("Agg")
+import pandas as pd
+from matplotlib.figure import Figure
+from wordcloud import WordCloud
+
+from analysis_cube import load_keyword_cube
+from logger import AppLogger
+from wordcloud_layout import build_wordcloud, frequencies_from_frame
+
+logger = AppLogger("[WordCloudBenchmark]")
+
+MONTHLY_KEYWORDS_PATH = "../datasets/monthly_news_keywords_2025.csv"
+
+WC_ARGS = dict(width=1600, height=900, background_color="white", random_state=42)
+
+
+def _legacy_render(df: pd.DataFrame, output_path: str, font_path: Optional[str]) -> None:
+  # The previous path: iterrows dict, fresh layout, redraw through matplotlib at dpi 200
+  freqs = {row["keyword"]: int(row["count"]) for _, row in df.iterrows()}
+  wc = WordCloud(font_path=font_path, **WC_ARGS).generate_from_frequencies(freqs)
+  fig = Figure(figsize=(12, 7))
+  ax = fig.subplots()
+  ax.imshow(wc, interpolation="bilinear")
+  ax.axis("off")
+  fig.tight_layout()
+  fig.savefig(output_path, dpi=200)
+
+
+def _fast_render(df: pd.DataFrame, output_path: str, font_path: Optional[str], cache_dir: str) -> None:
+  wc = build_wordcloud(frequencies_from_frame(df), cache_dir=cache_dir, font_path=font_path, scale=1.5, **WC_ARGS)
+  wc.to_file(output_path)
+
+
+def _best_of(fn, repeat: int) -> float:
+  best = None
+  for _ in range(repeat):
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    best = elapsed if best is None else min(best, elapsed)
+  return best
+
+
+def run_wordcloud_benchmark(
+  input_csv: str = MONTHLY_KEYWORDS_PATH,
+  top_ns: Iterable[int] = (1000, 3000),
+  font_path: Optional[str] = None,
+  repeat: int = 2,
+) -> Dict[int, Dict]:
+  """
+  Seconds per wordcloud render for the legacy path, the new path on a cold
+  layout cache, and the new path on a warm cache (a re-render), per top_n.
+  """
+  cube = load_keyword_cube(input_csv)
+  results = {}
+
+  with tempfile.TemporaryDirectory() as tmp:
+    out = str(Path(tmp) / "wordcloud.png")
+
+    for n in top_ns:
+      df = cube.top_keywords(n).rename("count").rename_axis("keyword").reset_index()
+      cache_dir = str(Path(tmp) / f"layouts_{n}")
+
+      legacy = _best_of(lambda: _legacy_render(df, out, font_path), repeat)
+      cold = _best_of(lambda: _fast_render(df, out, font_path, None), repeat)
+      _fast_render(df, out, font_path, cache_dir)
+      warm = _best_of(lambda: _fast_render(df, out, font_path, cache_dir), repeat)
+
+      results[n] = {"legacy": legacy, "cold": cold, "warm": warm}
+      logger.info(
+        f"top_n {len(df):>5}: legacy {legacy:6.2f}s | direct (cold layout) {cold:6.2f}s "
+        f"| direct (cached layout) {warm:6.2f}s | speedup x{legacy / warm:.1f}"
+      )
+
+  return results
+
+
+if __name__ == "__main__":
+  run_wordcloud_benchmark()
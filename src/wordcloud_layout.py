@@ -0,0 +1,124 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+from wordcloud import WordCloud
+
+from logger import AppLogger
+
+logger = AppLogger("[WordCloudLayout]")
+
+WORDCLOUD_LAYOUT_CACHE_DIR = "../.cache/wordcloud_layouts"
+
+# Default seed for word placement and colors, so the same input renders the same pixels
+# (the render manifest fingerprints inputs, not images)
+WORDCLOUD_SEED = 42
+
+# WordCloud arguments that decide word placement; everything else (scale,
+# background_color, colormap, color_func, mode) only affects drawing
+LAYOUT_PARAMS = (
+  "width", "height", "font_path", "max_words", "min_font_size", "max_font_size",
+  "font_step", "prefer_horizontal", "relative_scaling", "margin", "random_state",
+)
+
+# Arguments that decide the colors picked during placement (kept with the layout
+# for color_random_state=None, when there is no recolor seed to reproduce them)
+COLOR_PARAMS = ("color_func", "colormap", "mode")
+
+
+def frequencies_from_frame(df: pd.DataFrame, key: str = "keyword", value: str = "count") -> Dict[str, int]:
+  """
+  {keyword: count} straight from the two columns.
+  """
+  return dict(zip(df[key].tolist(), df[value].astype(int).tolist()))
+
+
+def layout_fingerprint(freqs: Dict[str, int], wc: WordCloud, seed: Optional[int]) -> str:
+  """
+  Hash of the frequencies and the placement-relevant WordCloud arguments.
+  `seed` is the random_state as passed; WordCloud keeps a Random instance instead.
+  """
+  params = {name: getattr(wc, name, None) for name in LAYOUT_PARAMS}
+  params["random_state"] = seed
+  payload = {
+    "freqs": sorted(freqs.items()),
+    "params": params,
+  }
+  blob = json.dumps(payload, ensure_ascii=False, default=str)
+  return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _color_key(wordcloud_args: Dict[str, Any]) -> str:
+  # Functions and colormaps by name; anything unnamed never matches a cached entry
+  named = {}
+  for name in COLOR_PARAMS:
+    value = wordcloud_args.get(name)
+    named[name] = getattr(value, "__qualname__", None) or getattr(value, "name", None) or value
+  return json.dumps(named, sort_keys=True, default=lambda v: f"{type(v).__name__}@{id(v)}")
+
+
+def build_wordcloud(
+  freqs: Dict[str, int],
+  cache_dir: Optional[str] = WORDCLOUD_LAYOUT_CACHE_DIR,
+  color_random_state: Optional[int] = WORDCLOUD_SEED,
+  **wordcloud_args: Any,
+) -> WordCloud:
+  """
+  WordCloud for `freqs`, reusing a cached layout (word, size, position,
+  orientation) when the same frequencies and layout arguments were seen before.
+
+  On a cache hit only the colors are recomputed, so changing the scale,
+  background or colormap does not re-run the placement search.
+  cache_dir=None disables the cache.
+
+  Placement (random_state) and colors (color_random_state) are seeded with
+  WORDCLOUD_SEED by default. color_random_state=None keeps the colors picked
+  during placement; they are cached with the layout, so a cache hit still
+  renders the same image as a fresh run.
+  """
+  wordcloud_args.setdefault("random_state", WORDCLOUD_SEED)
+  wc = WordCloud(**wordcloud_args)
+  if cache_dir is None:
+    wc.generate_from_frequencies(freqs)
+    return wc.recolor(random_state=color_random_state) if color_random_state is not None else wc
+
+  cache = Path(cache_dir) / f"{layout_fingerprint(freqs, wc, wordcloud_args['random_state'])}.pkl"
+
+  color_key = _color_key(wordcloud_args)
+
+  if cache.exists():
+    try:
+      cached = pd.read_pickle(cache)
+      colors = cached.get("colors")
+      if color_random_state is not None or (colors is not None and cached.get("color_key") == color_key):
+        colors = colors if color_random_state is None else [None] * len(cached["layout"])
+        wc.words_ = cached["words"]
+        wc.layout_ = [
+          (word_freq, size, pos, orient, color)
+          for (word_freq, size, pos, orient), color in zip(cached["layout"], colors)
+        ]
+        logger.debug(f"Reusing WordCloud layout {cache.name} ({len(wc.layout_)} words)")
+        return wc if color_random_state is None else wc.recolor(random_state=color_random_state)
+      logger.debug(f"WordCloud layout {cache.name} has no colors for these arguments. Regenerating.")
+    except Exception:
+      logger.exception(f"Failed to read WordCloud layout cache {cache}. Regenerating.")
+
+  wc.generate_from_frequencies(freqs)
+  # Placement-time colors, only meaningful without a recolor seed
+  placement_colors = [color for *_, color in wc.layout_] if color_random_state is None else None
+  if color_random_state is not None:
+    wc.recolor(random_state=color_random_state)
+
+  try:
+    cache.parent.mkdir(parents=True, exist_ok=True)
+    layout = [(word_freq, size, pos, orient) for word_freq, size, pos, orient, _ in wc.layout_]
+    tmp = cache.with_name(f".{cache.name}.tmp")
+    pd.to_pickle({"words": wc.words_, "layout": layout, "colors": placement_colors, "color_key": color_key}, tmp)
+    os.replace(tmp, cache)
+  except Exception:
+    logger.exception(f"Failed to write WordCloud layout cache {cache}.")
+
+  return wc
@@ -0,0 +1,26 @@
+import pandas as pd
+
+from analysis_tables import build_monthly_category_top_table
+
+
+def test_monthly_category_top_table(tmp_path):
+  df = pd.DataFrame({
+    "category": ["economy"] * 4 + ["total"] * 2,
+    "year": [2025] * 6,
+    "month": [1, 1, 1, 2, 1, 1],
+    "keyword": ["관세", "환율", "반도체", "관세", "트럼프", "관세"],
+    "count": [5, 9, 5, 1, 3, 3],
+  })
+  output = tmp_path / "monthly_top.csv"
+
+  table = build_monthly_category_top_table(df, output=str(output), top_n=2)
+
+  assert table.columns.tolist() == ["category", "year", "month", "keyword", "count"]
+  assert table[["category", "month", "keyword", "count"]].values.tolist() == [
+    ["economy", 1, "환율", 9],
+    ["economy", 1, "관세", 5],  # tie with 반도체 broken by keyword
+    ["economy", 2, "관세", 1],
+    ["total", 1, "관세", 3],
+    ["total", 1, "트럼프", 3],
+  ]
+  assert len(pd.read_csv(output)) == 5
@@ -0,0 +1,48 @@
+import pandas as pd
+import pytest
+
+from anomaly_detection import ANOMALY_COLUMNS, detect_anomalies, monthly_changes
+
+SERIES = pd.DataFrame({
+  "keyword": ["관세"] * 4 + ["환율"] * 4,
+  "year": [2025] * 8,
+  "month": [3, 1, 2, 4, 1, 2, 3, 4],
+  "count": [30, 10, 10, 24, 5, 5, 5, 5],
+  "headline": ["h3", "h1", "h2", "h4", "x", "x", "x", "x"],
+})
+
+
+def test_monthly_changes_per_keyword():
+  out = monthly_changes(SERIES)
+  tariff = out[out["keyword"] == "관세"]
+  assert tariff["year_month"].tolist() == ["2025-01", "2025-02", "2025-03", "2025-04"]
+  assert tariff["pct_change"].tolist()[1:] == [0.0, 2.0, -0.2]
+  # Series never leak into each other
+  assert pd.isna(out[out["keyword"] == "환율"]["prev_count"].iloc[0])
+
+
+def test_pct_change_anomalies():
+  out = detect_anomalies(SERIES, method="pct_change", threshold=0.25)
+  assert out.columns.tolist() == ANOMALY_COLUMNS + ["headline"]
+  assert out[["keyword", "year_month", "baseline", "score", "headline"]].values.tolist() == [
+    ["관세", "2025-03", 10.0, 2.0, "h3"],
+  ]
+
+
+def test_rolling_anomalies():
+  out = detect_anomalies(SERIES, method="rolling", threshold=0.25, window=2)
+  # April: 24 vs mean(10, 30) = 20 -> +20%, below the threshold
+  assert out["year_month"].tolist() == ["2025-03"]
+  out = detect_anomalies(SERIES, method="rolling", threshold=0.1, window=2)
+  assert out[["year_month", "baseline"]].values.tolist() == [["2025-03", 10.0], ["2025-04", 20.0]]
+
+
+def test_zscore_anomalies_skip_flat_series():
+  out = detect_anomalies(SERIES, method="zscore", threshold=1.0)
+  assert out[["keyword", "year_month"]].values.tolist() == [["관세", "2025-03"]]
+  assert out["baseline"].iloc[0] == pytest.approx(18.5)
+
+
+def test_unknown_method():
+  with pytest.raises(ValueError):
+    detect_anomalies(SERIES, method="median")
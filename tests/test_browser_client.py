@@ -0,0 +1,42 @@
+import json
+from browser_client import BrowserClient
+from logger import AppLogger
+
+
+class _FakeDriver:
+  def __init__(self, name):
+    self.name = name
+
+  def get_cookies(self):
+    return [{"name": "SESSION", "value": self.name * 2000}]
+
+
+def _client(session_path, name):
+  # Skip __init__: no Chrome or credentials needed to persist cookies
+  client = BrowserClient.__new__(BrowserClient)
+  client.session_path = session_path
+  client.user_id = "user"
+  client.driver = _FakeDriver(name)
+  client.logger = AppLogger("[BrowserClient]")
+  return client
+
+
+def test_session_save_uses_a_temp_file_of_its_own(tmp_path, monkeypatch):
+  import browser_client
+
+  path = tmp_path / "session.json"
+  sources = []
+  real_replace = browser_client.os.replace
+
+  def recording_replace(src, dst):
+    sources.append(str(src))
+    real_replace(src, dst)
+
+  monkeypatch.setattr(browser_client.os, "replace", recording_replace)
+  for i in range(3):
+    _client(path, str(i))._save_session()
+
+  assert len(set(sources)) == 3
+  assert all(src.startswith(str(tmp_path)) for src in sources)
+  assert json.loads(path.read_text(encoding="utf-8"))["cookies"][0]["value"].startswith("2")
+  assert [p.name for p in tmp_path.iterdir()] == ["session.json"]
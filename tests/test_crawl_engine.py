@@ -0,0 +1,70 @@
+import multiprocessing
+import threading
+import time
+from datetime import date, timedelta
+
+import pytest
+
+import crawl_engine
+
+
+class _FakeClient:
+  def login(self):
+    pass
+
+  def close(self):
+    pass
+
+
+def _run(monkeypatch, max_workers):
+  lock = threading.Lock()
+  active, peak = [0], [0]
+
+  def fake_crawl_category(client, category, start, end, anchors, on_week):
+    with lock:
+      active[0] += 1
+      peak[0] = max(peak[0], active[0])
+    time.sleep(0.05)
+    with lock:
+      active[0] -= 1
+    return [{"category": category}]
+
+  monkeypatch.setattr(crawl_engine, "BrowserClient", _FakeClient)
+  monkeypatch.setattr(crawl_engine, "_crawl_category", fake_crawl_category)
+  plans = {c: (date(2025, 1, 1), [date(2025, 1, 3)], None) for c in ("total", "economy", "society")}
+  results = crawl_engine.crawl_categories_concurrently(date(2025, 1, 31), plans, max_workers=max_workers)
+  assert all(len(rows) == 1 for rows in results.values())
+  return peak[0]
+
+
+def test_max_workers_caps_concurrent_drivers(monkeypatch):
+  assert _run(monkeypatch, max_workers=1) == 1
+
+
+def test_default_is_one_driver_per_category(monkeypatch):
+  assert _run(monkeypatch, max_workers=None) == 3
+
+
+def _collect_then_crash(client, category, anchors, start_date, end_date, on_week):
+  # Reports two weeks, then the worker dies mid-chunk
+  for anchor in anchors[:2]:
+    on_week(anchor, [{"date": anchor.isoformat(), "category": category, "title": "t", "article_count": 1}])
+  raise RuntimeError("driver crashed")
+
+
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded:DeprecationWarning")
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="patches reach workers through fork only")
+def test_process_workers_stream_weeks_before_a_crash(monkeypatch):
+  monkeypatch.setattr(crawl_engine, "BrowserClient", _FakeClient)
+  monkeypatch.setattr(crawl_engine, "_go_to_weekend_news_page", lambda client, category: None)
+  monkeypatch.setattr(crawl_engine, "_collect_anchor_weeks", _collect_then_crash)
+
+  anchors = [date(2025, 1, 3) + timedelta(weeks=i) for i in range(4)]
+  reported = []
+  rows = crawl_engine.crawl_weekly_news(
+    "total", anchors[0], anchors[-1], workers=1, executor="process", anchors=anchors,
+    on_week=lambda anchor, week: reported.append(anchor),
+  )
+
+  assert reported == anchors[:2]
+  assert len(rows) == 2
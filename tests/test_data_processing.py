@@ -0,0 +1,73 @@
+import data_processing
+from keyword_cache import KeywordCache
+
+
+class _FakeResult:
+  def __init__(self, plain):
+    self.plain = plain
+
+  def getPlainText(self):
+    return self.plain
+
+
+class _FakeKomoran:
+  """
+  Every word is a noun on its own; in a joined batch, words listed in
+  `context_sensitive` lose their noun tag (a cross-title context effect).
+  """
+
+  def __init__(self, context_sensitive=()):
+    self.context_sensitive = set(context_sensitive)
+    self.single_calls = 0
+    self.jki = self
+
+  def nouns(self, text):
+    self.single_calls += 1
+    return text.split()
+
+  def analyze(self, text):
+    items = []
+    for word in text.split():
+      tag = "SF" if word == "." else ("VV" if word in self.context_sensitive else "NNG")
+      items.append(f"{word}/{tag}")
+    return _FakeResult(" ".join(items))
+
+
+TITLES = ["관세 협상", "반도체 수출", "환율 급등"]
+
+
+def _use(monkeypatch, komoran):
+  monkeypatch.setattr(data_processing, "_komoran", komoran)
+  monkeypatch.setattr(data_processing, "_stopwords", set())
+  monkeypatch.setattr(data_processing, "_analyzer_version", lambda: "test")
+
+
+def test_batched_output_matches_per_title(monkeypatch):
+  komoran = _FakeKomoran()
+  _use(monkeypatch, komoran)
+  items = [(t, []) for t in TITLES]
+
+  batched = data_processing._extract_keywords_chunk(items, batch_size=3)
+  assert komoran.single_calls == 1  # only the sampled title
+  assert batched == data_processing._extract_keywords_chunk(items, batch_size=0)
+
+
+def test_batch_disagreeing_with_sample_falls_back(monkeypatch):
+  komoran = _FakeKomoran(context_sensitive={"수출"})
+  _use(monkeypatch, komoran)
+  items = [(t, []) for t in TITLES]
+
+  assert data_processing._extract_keywords_chunk(items, batch_size=3) == [t.split() for t in TITLES]
+
+
+def test_batched_results_are_not_cached(monkeypatch, tmp_path):
+  _use(monkeypatch, _FakeKomoran())
+  cache_path = str(tmp_path / "keywords.sqlite")
+
+  data_processing.extract_keywords_cached(TITLES, cache_path=cache_path, batch_size=3)
+  with KeywordCache(cache_path, set(), "test") as cache:
+    assert cache.get_many(TITLES) == {}
+
+  data_processing.extract_keywords_cached(TITLES, cache_path=cache_path, batch_size=0)
+  with KeywordCache(cache_path, set(), "test") as cache:
+    assert cache.get_many(TITLES) == {t: t.split() for t in TITLES}
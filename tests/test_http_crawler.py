@@ -0,0 +1,98 @@
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+import http_crawler
+from crawler import MAX_TOPICS_PER_DAY
+from http_crawler import HttpWeeklyClient, collect_weekly_news_http, parse_weekend_news_html
+
+FIXTURES = Path(__file__).parent / "fixtures" / "weekend_news"
+
+
+def _fixture(name: str) -> str:
+  return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+def test_parse_rows_per_day():
+  rows = parse_weekend_news_html(_fixture("total_2025-01-03.html"), "total")
+
+  per_day = {}
+  for row in rows:
+    per_day[row["date"]] = per_day.get(row["date"], 0) + 1
+
+  # 2025-01-02 lists 12 topics, one without an i.num node
+  assert per_day == {"2024-12-30": 5, "2024-12-31": 5, "2025-01-02": MAX_TOPICS_PER_DAY - 1, "2025-01-03": 4}
+  assert {row["category"] for row in rows} == {"total"}
+
+
+def test_parse_topic_fields():
+  rows = parse_weekend_news_html(_fixture("total_2025-01-03.html"), "total")
+  day = [row for row in rows if row["date"] == "2025-01-02"]
+
+  assert day[0] == {"date": "2025-01-02", "category": "total", "title": "윤석열 대통령 체포영장 집행", "article_count": 150}
+  # No title attribute: span text is used
+  assert day[1]["title"] == "제주항공 참사 유족 지원"
+  assert day[1]["article_count"] == 141
+  # Nested span inside the title span is part of the text
+  assert day[2]["title"] == "환율 1470원 돌파★"
+  # Non-numeric count
+  assert day[3]["article_count"] is None
+  # Topics past MAX_TOPICS_PER_DAY are not parsed
+  assert "독감 환자 급증" not in {row["title"] for row in day}
+
+
+def test_parse_page_without_result_block():
+  assert parse_weekend_news_html(_fixture("total_2025-01-10.html"), "total") == []
+
+
+def test_collect_replays_fixtures_and_skips_failed_weeks():
+  client = HttpWeeklyClient(fixture_dir=str(FIXTURES))
+  done = {}
+
+  rows = collect_weekly_news_http(
+    client,
+    "total",
+    date(2025, 1, 1),
+    date(2025, 1, 31),
+    anchors=[date(2025, 1, 3), date(2025, 1, 10), date(2025, 1, 17)],
+    on_week=lambda anchor, week_rows: done.setdefault(anchor, week_rows),
+  )
+  client.close()
+
+  # Only the week with topics is reported; rows before the start date are dropped.
+  # 2025-01-10 has no result block and 2025-01-17 has no recording: both stay pending.
+  assert list(done) == [date(2025, 1, 3)]
+  assert rows == done[date(2025, 1, 3)]
+  assert {row["date"] for row in rows} == {"2025-01-02", "2025-01-03"}
+
+
+def test_collect_economy_fixture():
+  client = HttpWeeklyClient(fixture_dir=str(FIXTURES))
+  rows = collect_weekly_news_http(client, "economy", date(2025, 1, 6), date(2025, 1, 10), anchors=[date(2025, 1, 10)])
+  client.close()
+
+  assert len(rows) == 8
+  assert rows[0] == {"date": "2025-01-06", "category": "economy", "title": "환율 1470원 돌파", "article_count": 60}
+
+
+def test_live_client_requires_the_data_endpoint(monkeypatch):
+  monkeypatch.setattr(http_crawler, "load_dotenv", lambda: None)
+  monkeypatch.delenv(http_crawler.DATA_URL_ENV, raising=False)
+  with pytest.raises(ValueError, match=http_crawler.DATA_URL_ENV):
+    HttpWeeklyClient()
+
+  monkeypatch.setenv(http_crawler.DATA_URL_ENV, "https://example.test/weekend")
+  monkeypatch.setenv(http_crawler.DATE_PARAM_ENV, "date")
+  client = HttpWeeklyClient()
+  assert (client.data_url, client.date_param, client.category_param) == (
+    "https://example.test/weekend", "date", http_crawler.CATEGORY_PARAM,
+  )
+  client.close()
+
+
+def test_replay_needs_no_data_endpoint(monkeypatch):
+  monkeypatch.setattr(http_crawler, "load_dotenv", lambda: None)
+  monkeypatch.delenv(http_crawler.DATA_URL_ENV, raising=False)
+  client = HttpWeeklyClient(fixture_dir=str(FIXTURES))
+  assert client.fetch_week("total", date(2025, 1, 3)) == _fixture("total_2025-01-03.html")
@@ -0,0 +1,20 @@
+from datetime import date
+
+import pytest
+
+pytest.importorskip("ddgs")
+pytest.importorskip("openai")
+
+from insight_agent import _build_prompt  # noqa: E402
+
+ROW = {"keyword": "관세", "first": 10, "last": 30, "change": 20, "pct_change": 2.0, "slope": 6.5, "cagr": 0.44}
+
+
+@pytest.mark.parametrize("method", ["pct_change", "slope", "cagr"])
+def test_prompt_reports_the_selected_surge_method(method):
+  prompt = _build_prompt(date(2025, 1, 1), date(2025, 3, 1), [ROW], "설명해줘", "", method)
+
+  assert f"{method} 기준" in prompt
+  assert f"{method}={ROW[method]:.2f}" in prompt
+  others = {"pct_change", "slope", "cagr"} - {method}
+  assert not any(f"{other}=" in prompt for other in others)
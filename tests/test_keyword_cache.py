@@ -0,0 +1,49 @@
+from keyword_cache import KeywordCache, stopwords_fingerprint
+
+TITLES = {"관세 협상 타결": ["관세", "협상", "타결"], "환율 급등": ["환율", "급등"]}
+
+
+def _fill(path, stopwords, version):
+  with KeywordCache(str(path), stopwords, version) as cache:
+    cache.put_many(TITLES)
+
+
+def test_hits_with_the_same_stopwords_and_rules(tmp_path):
+  path = tmp_path / "cache.sqlite"
+  _fill(path, {"속보"}, "komoran-1")
+
+  with KeywordCache(str(path), {"속보"}, "komoran-1") as cache:
+    assert cache.get_many(list(TITLES) + ["new title"]) == TITLES
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_changed_stopwords_miss(tmp_path):
+  path = tmp_path / "cache.sqlite"
+  _fill(path, {"속보"}, "komoran-1")
+
+  with KeywordCache(str(path), {"속보", "단독"}, "komoran-1") as cache:
+    assert cache.get_many(TITLES) == {}
+
+
+def test_changed_rules_version_misses(tmp_path):
+  path = tmp_path / "cache.sqlite"
+  _fill(path, {"속보"}, "komoran-1")
+
+  with KeywordCache(str(path), {"속보"}, "komoran-2") as cache:
+    assert cache.get_many(TITLES) == {}
+
+
+def test_stopwords_fingerprint_ignores_order():
+  assert stopwords_fingerprint({"a", "b", "c"}) == stopwords_fingerprint(set(["c", "a", "b"]))
+  assert stopwords_fingerprint({"a"}) != stopwords_fingerprint({"a", "b"})
+
+
+def test_extractor_version_bump_misses(tmp_path, monkeypatch):
+  import data_processing
+
+  path = tmp_path / "cache.sqlite"
+  _fill(path, {"속보"}, data_processing._analyzer_version())
+
+  monkeypatch.setattr(data_processing, "KEYWORD_EXTRACTOR_VERSION", data_processing.KEYWORD_EXTRACTOR_VERSION + 1)
+  with KeywordCache(str(path), {"속보"}, data_processing._analyzer_version()) as cache:
+    assert cache.get_many(TITLES) == {}
@@ -0,0 +1,60 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from keyword_matrix import MATRIX_FORMAT_VERSION, KeywordMatrix, build_keyword_matrix, load_keyword_matrix
+
+
+def _keyword_csv(path):
+  pd.DataFrame({
+    "date": ["2025-01-02", "2025-01-03", "2025-02-07"],
+    "category": ["total", "total", "economy"],
+    "title": ["a", "b", "c"],
+    "article_count": [3, 5, 2],
+    "keywords": ["['관세', '트럼프']", "['관세']", "['환율', '관세']"],
+  }).to_csv(path, index=False)
+
+
+def _write_v1(path, km):
+  # Layout written before weights / format_version were added
+  m = km.matrix
+  np.savez_compressed(
+    path,
+    data=m.data,
+    indices=m.indices,
+    indptr=m.indptr,
+    shape=np.array(m.shape),
+    vocab=km.vocab.astype(str),
+    dates=km.dates.astype(str),
+    categories=km.categories.astype(str),
+  )
+
+
+def test_roundtrip(tmp_path):
+  csv = tmp_path / "keywords.csv"
+  _keyword_csv(csv)
+  km = build_keyword_matrix(str(csv), str(tmp_path / "m.npz"))
+
+  loaded = KeywordMatrix.load(str(tmp_path / "m.npz"))
+  assert loaded.vocab.tolist() == ["관세", "트럼프", "환율"]
+  assert loaded.weights.tolist() == [3, 5, 2]
+  assert (loaded.matrix != km.matrix).nnz == 0
+
+
+def test_v1_file_is_rebuilt_not_loaded(tmp_path):
+  csv = tmp_path / "keywords.csv"
+  path = tmp_path / "m.npz"
+  _keyword_csv(csv)
+  _write_v1(path, build_keyword_matrix(str(csv), None))
+
+  # Newer than the dataset, so only the format version marks it stale
+  os.utime(path, (os.path.getmtime(csv) + 10,) * 2)
+  with pytest.raises(ValueError):
+    KeywordMatrix.load(str(path))
+
+  km = load_keyword_matrix(str(path), str(csv))
+  assert km.weights.tolist() == [3, 5, 2]
+  with np.load(path) as z:
+    assert int(z["format_version"]) == MATRIX_FORMAT_VERSION
@@ -0,0 +1,62 @@
+import pandas as pd
+import pandas.testing as pdt
+
+from keyword_monthly_agg import build_monthly_keyword_counts
+
+ROWS = [
+  ("2025-01-03", "total", "a", 3, "['관세', '트럼프']"),
+  ("2025-01-10", "economy", "b", 5, "['관세']"),
+  ("2025-02-07", "total", "c", 2, "['환율', 'NA']"),
+]
+NEW_ROWS = [
+  ("2025-02-14", "total", "d", 4, "['관세', '환율']"),
+  ("2025-03-07", "economy", "e", 1, "['반도체']"),
+]
+BACKFILL = [("2025-01-06", "total", "f", 7, "['트럼프']")]
+
+
+def _write(path, rows):
+  pd.DataFrame(rows, columns=["date", "category", "title", "article_count", "keywords"]).to_csv(path, index=False)
+
+
+def _full(tmp_path, input_csv):
+  return build_monthly_keyword_counts(str(input_csv), str(tmp_path / "full.csv"))
+
+
+def test_incremental_equals_full_rebuild(tmp_path):
+  input_csv, output_csv = tmp_path / "keywords.csv", tmp_path / "monthly.csv"
+  _write(input_csv, ROWS)
+  build_monthly_keyword_counts(str(input_csv), str(output_csv), incremental=True, rules_version="r1")
+
+  _write(input_csv, ROWS + NEW_ROWS)
+  incremental = build_monthly_keyword_counts(str(input_csv), str(output_csv), incremental=True, rules_version="r1")
+
+  pdt.assert_frame_equal(incremental, _full(tmp_path, input_csv))
+  # The saved table reads back the same ("NA" stays a keyword)
+  saved = pd.read_csv(output_csv, dtype={"keyword": str}, keep_default_na=False, encoding="utf-8-sig")
+  pdt.assert_frame_equal(saved, incremental)
+
+
+def test_backfilled_rows_trigger_a_full_rebuild(tmp_path):
+  input_csv, output_csv = tmp_path / "keywords.csv", tmp_path / "monthly.csv"
+  _write(input_csv, ROWS)
+  build_monthly_keyword_counts(str(input_csv), str(output_csv), incremental=True, rules_version="r1")
+
+  # Dated before the high-water mark: not picked up by the "since" read
+  _write(input_csv, ROWS + BACKFILL)
+  incremental = build_monthly_keyword_counts(str(input_csv), str(output_csv), incremental=True, rules_version="r1")
+
+  pdt.assert_frame_equal(incremental, _full(tmp_path, input_csv))
+
+
+def test_changed_rules_version_rebuilds(tmp_path):
+  input_csv, output_csv = tmp_path / "keywords.csv", tmp_path / "monthly.csv"
+  _write(input_csv, ROWS)
+  build_monthly_keyword_counts(str(input_csv), str(output_csv), incremental=True, rules_version="r1")
+
+  # Same dates and article totals, different keywords (e.g. new stopwords)
+  _write(input_csv, [r[:4] + ("['관세']",) for r in ROWS])
+  incremental = build_monthly_keyword_counts(str(input_csv), str(output_csv), incremental=True, rules_version="r2")
+
+  pdt.assert_frame_equal(incremental, _full(tmp_path, input_csv))
+  assert set(incremental["keyword"]) == {"관세"}
@@ -0,0 +1,68 @@
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import main
+
+
+def test_fixture_replay_uses_separate_outputs():
+  targets, checkpoint_path = main._crawl_outputs(replay=True)
+
+  replay_dir = Path(main.FIXTURE_REPLAY_DIR)
+  assert set(targets) == set(main.CRAWL_TARGETS)
+  for category, path in targets.items():
+    assert Path(path).parent == replay_dir
+    assert path != main.CRAWL_TARGETS[category]
+  assert Path(checkpoint_path).parent == replay_dir
+  assert checkpoint_path != main.CHECKPOINT_PATH
+
+
+def test_live_crawl_uses_real_outputs():
+  assert main._crawl_outputs(replay=False) == (main.CRAWL_TARGETS, main.CHECKPOINT_PATH)
+
+
+@pytest.mark.parametrize("argv", [
+  ["--category-mode", "switch", "--backend", "http"],
+  ["--category-mode", "parallel", "--backend", "http"],
+  ["--category-mode", "switch", "--workers", "4"],
+])
+def test_conflicting_crawl_modes_are_rejected(monkeypatch, argv):
+  monkeypatch.setattr(sys, "argv", ["main.py", "--step", "crawl"] + argv)
+  monkeypatch.setattr(main, "run_crawler", lambda **kwargs: pytest.fail("crawler should not run"))
+  with pytest.raises(SystemExit) as exc:
+    main.main()
+  assert exc.value.code == 2
+
+
+def _flusher(tmp_path):
+  checkpoint = main.CrawlCheckpoint(str(tmp_path / "checkpoint.json"))
+  return checkpoint, main._WeekFlusher(checkpoint, "total", str(tmp_path / "total.csv"))
+
+
+def _row(day):
+  return {"date": day, "category": "total", "title": f"title {day}", "article_count": 3}
+
+
+def test_finished_empty_week_is_recorded_as_empty(tmp_path):
+  checkpoint, flush = _flusher(tmp_path)
+  flush(date(2025, 1, 3), [])
+  flush(date(2025, 1, 10), [_row("2025-01-10")])
+  flush.close()
+
+  assert checkpoint.completed("total") == [date(2025, 1, 3), date(2025, 1, 10)]
+  assert checkpoint.empty("total") == [date(2025, 1, 3)]
+
+
+def test_week_not_over_yet_stays_pending(tmp_path):
+  checkpoint, flush = _flusher(tmp_path)
+  today = date.today()
+  flush(today, [_row(today.isoformat())])
+  flush(today + timedelta(days=7), [])
+  flush.close()
+
+  assert checkpoint.completed("total") == []
+  assert checkpoint.empty("total") == []
+  assert len(pd.read_csv(tmp_path / "total.csv")) == 1
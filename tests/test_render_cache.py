@@ -0,0 +1,62 @@
+import visualization
+from render_cache import RenderCache
+
+
+def _job(tmp_path):
+  data = tmp_path / "counts.csv"
+  data.write_text("keyword,count\n관세,3\n", encoding="utf-8")
+  return {"input_csv": str(data), "output_path": str(tmp_path / "chart.png")}
+
+
+def _render(kwargs):
+  with open(kwargs["output_path"], "wb") as f:
+    f.write(b"png")
+
+
+def test_unchanged_chart_is_fresh(tmp_path):
+  kwargs = _job(tmp_path)
+  cache = RenderCache(str(tmp_path / "manifest.json"))
+  fp = visualization._job_fingerprint("lineplot", kwargs)
+  _render(kwargs)
+  cache.record(kwargs["output_path"], fp)
+
+  # A new process reads the manifest back
+  reloaded = RenderCache(str(tmp_path / "manifest.json"))
+  assert reloaded.is_fresh(kwargs["output_path"], visualization._job_fingerprint("lineplot", kwargs))
+
+
+def test_changed_input_misses(tmp_path):
+  kwargs = _job(tmp_path)
+  cache = RenderCache(str(tmp_path / "manifest.json"))
+  _render(kwargs)
+  cache.record(kwargs["output_path"], visualization._job_fingerprint("lineplot", kwargs))
+
+  with open(kwargs["input_csv"], "a", encoding="utf-8") as f:
+    f.write("환율,1\n")
+  assert not cache.is_fresh(kwargs["output_path"], visualization._job_fingerprint("lineplot", kwargs))
+
+
+def test_changed_helper_module_misses(tmp_path, monkeypatch):
+  kwargs = _job(tmp_path)
+  cache = RenderCache(str(tmp_path / "manifest.json"))
+  _render(kwargs)
+  cache.record(kwargs["output_path"], visualization._job_fingerprint("enhanced_lineplot", kwargs))
+
+  real_source = visualization._module_source
+  monkeypatch.setattr(
+    visualization, "_module_source",
+    lambda m: real_source(m) + ("\n# changed\n" if m == "anomaly_detection" else ""),
+  )
+  assert not cache.is_fresh(kwargs["output_path"], visualization._job_fingerprint("enhanced_lineplot", kwargs))
+
+
+def test_replaced_output_misses(tmp_path):
+  kwargs = _job(tmp_path)
+  cache = RenderCache(str(tmp_path / "manifest.json"))
+  fp = visualization._job_fingerprint("lineplot", kwargs)
+  _render(kwargs)
+  cache.record(kwargs["output_path"], fp)
+
+  with open(kwargs["output_path"], "wb") as f:
+    f.write(b"edited by hand")
+  assert not cache.is_fresh(kwargs["output_path"], fp)
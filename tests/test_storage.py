@@ -0,0 +1,61 @@
+import pandas as pd
+
+from storage import NewsRowSink
+
+
+def _row(day, title, count=1):
+  return {"date": day, "category": "total", "title": title, "article_count": count}
+
+
+def _read(path):
+  return pd.read_csv(path, encoding="utf-8-sig")
+
+
+def test_duplicates_are_skipped_within_and_across_sessions(tmp_path):
+  path = tmp_path / "news.csv"
+  with NewsRowSink(str(path)) as sink:
+    sink.push([_row("2025-01-02", "a"), _row("2025-01-02", "a"), _row("2025-01-03", "b")])
+    assert sink.flush() == 2
+    sink.push([_row("2025-01-03", "b", count=9)])
+    assert sink.flush() == 0
+
+  # A new session (e.g. the next run) keeps deduplicating, also without the index file
+  path.with_name(path.name + ".index.sqlite").unlink()
+  with NewsRowSink(str(path)) as sink:
+    sink.push([_row("2025-01-02", "a"), _row("2025-01-04", "c")])
+    assert sink.flush() == 1
+    assert (sink.written, sink.skipped) == (1, 1)
+
+  assert _read(path)["title"].tolist() == ["a", "b", "c"]
+
+
+def test_torn_last_line_is_trimmed_on_open(tmp_path):
+  path = tmp_path / "news.csv"
+  with NewsRowSink(str(path)) as sink:
+    sink.push([_row("2025-01-02", "a")])
+    sink.flush()
+
+  # An append interrupted mid-line
+  with path.open("ab") as f:
+    f.write("2025-01-03,total,torn".encode("utf-8"))
+
+  with NewsRowSink(str(path)) as sink:
+    sink.push([_row("2025-01-03", "b")])
+    sink.flush()
+
+  assert _read(path)[["date", "title"]].values.tolist() == [["2025-01-02", "a"], ["2025-01-03", "b"]]
+
+
+def test_reset_replaces_the_dataset_and_forgets_its_keys(tmp_path):
+  path = tmp_path / "news.csv"
+  with NewsRowSink(str(path)) as sink:
+    sink.push([_row("2025-01-02", "a"), _row("2025-01-03", "b")])
+    sink.flush()
+
+  with NewsRowSink(str(path), reset=True) as sink:
+    # The old file stays until the first flush replaces it
+    assert len(_read(path)) == 2
+    sink.push([_row("2025-01-03", "b")])
+    assert sink.flush() == 1
+
+  assert _read(path)["title"].tolist() == ["b"]
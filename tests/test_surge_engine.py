@@ -0,0 +1,47 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from surge_engine import SURGE_COLUMNS, SurgeEngine
+
+
+def _frame():
+  return pd.DataFrame({
+    "keyword": ["관세", "관세", "관세", "트럼프", "트럼프", "환율"],
+    "year": [2025] * 6,
+    "month": [1, 2, 4, 2, 3, 1],
+    "count": [10, 0, 30, 4, 8, 5],
+  })
+
+
+def test_empty_frame_ranks_nothing():
+  engine = SurgeEngine.from_frame(_frame().iloc[:0])
+
+  assert engine.counts.shape == (0, 0)
+  assert engine.rank(date(2025, 1, 1), date(2025, 12, 31)).to_dict(orient="records") == []
+  assert list(engine.scores(date(2025, 1, 1), date(2025, 12, 31)).columns) == SURGE_COLUMNS
+
+
+def test_first_last_use_months_with_data():
+  engine = SurgeEngine.from_frame(_frame())
+  scores = engine.scores(date(2025, 2, 1), date(2025, 4, 30)).set_index("keyword")
+
+  # 환율 has no row in the window
+  assert scores.index.tolist() == ["관세", "트럼프"]
+  assert scores.loc["관세", ["first", "last", "change"]].tolist() == [0, 30, 30]
+  # Start value 0 is scored against 0.5
+  assert scores.loc["관세", "pct_change"] == 60.0
+  assert scores.loc["트럼프", "pct_change"] == 1.0
+  assert np.isclose(scores.loc["트럼프", "slope"], 4.0)
+  assert np.isclose(scores.loc["트럼프", "cagr"], 1.0)
+
+
+def test_rank_whole_vocabulary_and_selection():
+  engine = SurgeEngine.from_frame(_frame())
+
+  ranked = engine.rank(date(2025, 1, 1), date(2025, 4, 30), top_n=2)
+  assert ranked["keyword"].tolist() == ["관세", "트럼프"]
+
+  only = engine.rank(date(2025, 1, 1), date(2025, 4, 30), keywords=["환율", "없음"])
+  assert only["keyword"].tolist() == ["환율"]
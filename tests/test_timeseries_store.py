@@ -0,0 +1,51 @@
+import os
+
+import pandas as pd
+
+import timeseries_store
+from timeseries_store import TIMESERIES_COLUMNS, TimeseriesIndex, file_fingerprint
+
+COUNTS = pd.DataFrame({
+  "keyword": ["관세", "관세", "관세", "환율", "환율", "트럼프"],
+  "year": [2025] * 6,
+  "month": [3, 1, 2, 1, 2, 2],
+  "count": [30, 10, 20, 5, 7, 40],
+})
+
+
+def test_select_matches_a_filtered_frame():
+  index = TimeseriesIndex.from_frame(COUNTS)
+  out = index.select(["환율", "관세", "없는키워드"], start="2025-02-01", end="2025-03-01")
+
+  assert out.columns.tolist() == TIMESERIES_COLUMNS
+  assert out[["keyword", "month", "count"]].values.tolist() == [
+    ["관세", 2, 20], ["관세", 3, 30], ["환율", 2, 7],
+  ]
+  assert index.keywords == ["관세", "트럼프", "환율"]
+  assert (index.min_date, index.max_date) == (pd.Timestamp("2025-01-01"), pd.Timestamp("2025-03-01"))
+
+
+def test_select_unknown_keywords_is_empty():
+  out = TimeseriesIndex.from_frame(COUNTS).select(["없는키워드"])
+  assert out.empty
+  assert out.columns.tolist() == TIMESERIES_COLUMNS
+
+
+def test_file_fingerprint_follows_content(tmp_path, monkeypatch):
+  path = tmp_path / "counts.csv"
+  COUNTS.to_csv(path, index=False)
+  first = file_fingerprint(path)
+
+  hashed = []
+  real_digest = timeseries_store.file_digest
+  monkeypatch.setattr(timeseries_store, "file_digest", lambda p: hashed.append(p) or real_digest(p))
+
+  # Untouched file: memoized, not hashed again
+  assert file_fingerprint(path) == first
+  assert hashed == []
+
+  COUNTS.head(3).to_csv(path, index=False)
+  st = os.stat(path)
+  os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+  assert file_fingerprint(path) != first
+  assert len(hashed) == 1
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+from topk import grouped_top_k, top_k
+
+
+def _full_sort(values: pd.Series, k: int) -> pd.Series:
+  # Reference: value descending, then index ascending
+  frame = values.rename("v").reset_index()
+  frame = frame.sort_values(["v", frame.columns[0]], ascending=[False, True], kind="stable")
+  return values.loc[frame[frame.columns[0]]].head(k)
+
+
+def _tied_counts(n: int = 500, seed: int = 7) -> pd.Series:
+  rng = np.random.default_rng(seed)
+  keywords = [f"kw{i:04d}" for i in rng.permutation(n)]
+  # Few distinct values -> many ties
+  return pd.Series(rng.integers(0, 8, size=n), index=pd.Index(keywords, name="keyword"))
+
+
+def test_top_k_matches_a_full_sort_with_ties():
+  values = _tied_counts()
+  for k in (1, 10, 77, 500, 800):
+    pdt.assert_series_equal(top_k(values, k), _full_sort(values, k))
+
+
+def test_top_k_ignores_input_order():
+  values = _tied_counts()
+  shuffled = values.sample(frac=1, random_state=3)
+  pdt.assert_series_equal(top_k(shuffled, 25), top_k(values, 25))
+
+
+def test_top_k_edge_cases():
+  values = _tied_counts(5)
+  assert top_k(values, 0).empty
+  assert top_k(values.iloc[:0], 3).empty
+
+
+def test_grouped_top_k_matches_per_group_full_sort():
+  rng = np.random.default_rng(11)
+  index = pd.MultiIndex.from_product(
+    [["economy", "total"], [1, 2, 3], [f"kw{i:03d}" for i in range(40)]],
+    names=["category", "month", "keyword"],
+  )
+  values = pd.Series(rng.integers(0, 5, size=len(index)), index=index).sample(frac=1, random_state=5)
+
+  result = grouped_top_k(values, ["category", "month"], 6)
+
+  expected = []
+  for (category, month), group in values.groupby(level=["category", "month"]):
+    ranked = group.droplevel(["category", "month"])
+    expected.extend((category, month, kw, v) for kw, v in _full_sort(ranked, 6).items())
+  assert [(*key, v) for key, v in result.items()] == expected
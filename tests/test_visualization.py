@@ -0,0 +1,38 @@
+import visualization
+from visualization import _chart_code_version, _chart_input_files
+
+HEATMAP_JOB = {"input_csv": "keywords.csv", "output_path": "heatmap.png"}
+
+
+def test_heatmap_code_version_covers_module_constants(monkeypatch):
+  before = _chart_code_version("cooccurrence_heatmap")
+  monkeypatch.setattr(visualization, "COOCCURRENCE_KEYWORDS", ["관세", "반도체"])
+  assert _chart_code_version("cooccurrence_heatmap") != before
+
+
+def test_heatmap_code_version_covers_helper_modules(monkeypatch):
+  before = _chart_code_version("cooccurrence_heatmap")
+  sources = {"keyword_matrix": "MATRIX_FORMAT_VERSION = 3\n"}
+  monkeypatch.setattr(visualization, "_module_source", lambda m: sources.get(m, ""))
+  changed = _chart_code_version("cooccurrence_heatmap")
+  assert changed != before
+  sources.clear()
+  assert _chart_code_version("cooccurrence_heatmap") != changed
+
+
+def test_heatmap_inputs_include_the_matrix():
+  files = _chart_input_files("cooccurrence_heatmap", HEATMAP_JOB)
+  assert "../datasets/news_keywords_2025.matrix.npz" in files
+  files = _chart_input_files("cooccurrence_heatmap", dict(HEATMAP_JOB, matrix_path="m.npz"))
+  assert files[-1] == "m.npz"
+
+
+def test_render_context_forks_only_on_linux(monkeypatch):
+  monkeypatch.setattr(visualization.multiprocessing, "get_all_start_methods", lambda: ["fork", "spawn"])
+
+  monkeypatch.setattr(visualization.sys, "platform", "linux")
+  assert visualization._render_context().get_start_method() == "fork"
+
+  for platform in ("darwin", "win32"):
+    monkeypatch.setattr(visualization.sys, "platform", platform)
+    assert visualization._render_context().get_start_method() == "spawn"
@@ -0,0 +1,34 @@
+from waits import wait_for_result_change
+
+OLD_BLOCK = {"dates": ["2025-01-03"], "rows": 10, "text": "total block"}
+NEW_BLOCK = {"dates": ["2025-01-03"], "rows": 10, "text": "economy block"}
+
+
+class _FakeDriver:
+  def __init__(self, *signatures):
+    self.signatures = list(signatures)
+
+  def execute_script(self, script):
+    # Last signature sticks once the sequence runs out
+    return self.signatures.pop(0) if len(self.signatures) > 1 else self.signatures[0]
+
+
+def test_expected_date_shortcut_accepts_the_old_block():
+  driver = _FakeDriver(OLD_BLOCK)
+  assert wait_for_result_change(driver, OLD_BLOCK, expected_date="2025-01-03", timeout=0.3) == OLD_BLOCK
+
+
+def test_require_change_rejects_the_old_block():
+  driver = _FakeDriver(OLD_BLOCK)
+  result = wait_for_result_change(
+    driver, OLD_BLOCK, expected_date="2025-01-03", timeout=0.3, required=False, require_change=True,
+  )
+  assert result is None
+
+
+def test_require_change_waits_for_new_content_of_the_week():
+  driver = _FakeDriver(OLD_BLOCK, OLD_BLOCK, {"dates": ["2024-12-27"], "rows": 10, "text": "x"}, NEW_BLOCK)
+  result = wait_for_result_change(
+    driver, OLD_BLOCK, expected_date="2025-01-03", timeout=2, require_change=True,
+  )
+  assert result == NEW_BLOCK
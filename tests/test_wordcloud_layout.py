@@ -0,0 +1,41 @@
+import numpy as np
+
+from wordcloud_layout import build_wordcloud
+
+FREQS = {"tariff": 30, "election": 20, "wildfire": 12, "exports": 8, "chips": 5}
+ARGS = dict(width=200, height=120, background_color="white")
+
+
+def test_cached_and_uncached_renders_are_identical(tmp_path):
+  first = build_wordcloud(FREQS, cache_dir=str(tmp_path), **ARGS).to_array()
+  cached = build_wordcloud(FREQS, cache_dir=str(tmp_path), **ARGS).to_array()
+  uncached = build_wordcloud(FREQS, cache_dir=None, **ARGS).to_array()
+
+  assert len(list(tmp_path.glob("*.pkl"))) == 1
+  assert np.array_equal(first, cached)
+  assert np.array_equal(first, uncached)
+
+
+def test_scale_reuses_layout(tmp_path):
+  build_wordcloud(FREQS, cache_dir=str(tmp_path), **ARGS)
+  big = build_wordcloud(FREQS, cache_dir=str(tmp_path), scale=2, **ARGS)
+
+  assert len(list(tmp_path.glob("*.pkl"))) == 1
+  assert big.to_array().shape[:2] == (240, 400)
+
+
+def test_cache_hit_keeps_placement_colors_without_color_seed(tmp_path):
+  first = build_wordcloud(FREQS, cache_dir=str(tmp_path), color_random_state=None, **ARGS).to_array()
+  cached = build_wordcloud(FREQS, cache_dir=str(tmp_path), color_random_state=None, **ARGS).to_array()
+  uncached = build_wordcloud(FREQS, cache_dir=None, color_random_state=None, **ARGS).to_array()
+
+  assert np.array_equal(first, cached)
+  assert np.array_equal(first, uncached)
+
+
+def test_cache_written_with_color_seed_is_refreshed_for_placement_colors(tmp_path):
+  build_wordcloud(FREQS, cache_dir=str(tmp_path), **ARGS)
+  cached = build_wordcloud(FREQS, cache_dir=str(tmp_path), color_random_state=None, **ARGS).to_array()
+  uncached = build_wordcloud(FREQS, cache_dir=None, color_random_state=None, **ARGS).to_array()
+
+  assert np.array_equal(cached, uncached)